@@ -0,0 +1,368 @@
+"""
+This code defines a script which launches many processes at once, each of them
+converting a mix of dates through the shared cache, so as to measure, under
+contention, the throughput, the tail latency, how often the cache is rebuilt or
+extended, and what errors arise, with the cache starting cold, warm or about to
+roll over into a new year.
+"""
+
+# Standard imports.
+import argparse
+import multiprocessing
+import queue as queue_module
+import random
+import sqlite3
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter
+
+# Local imports.
+from source.cache_config import set_cache_config
+from source.cache_snapshot import populate_cache
+from source.concordance import ConcordanceError
+from source.frontend_utils import convert_date
+from source.lunation import (
+    get_cyprian_new_year,
+    get_cyprian_year_beginning_with_greg_year
+)
+from source.profiling import ConversionProfiler
+
+# Local constants.
+DEFAULT_PROCESSES = 8
+DEFAULT_CONVERSIONS = 500
+DEFAULT_FIRST_GREG_YEAR = 2023
+DEFAULT_LAST_GREG_YEAR = 2026
+DEFAULT_SEED = 0
+DEFAULT_DEADLINE = 300  # In seconds.
+GRACE_SECONDS = 60  # For starting up, and for finishing a last conversion.
+SCENARIOS = ("cold", "warm", "rollover")
+BOUNDARY_SHARE = 0.5  # The share of dates falling near a year boundary.
+BOUNDARY_RADIUS = 2  # In days.
+START_TIMEOUT = 300  # In seconds.
+EXPECTED_ERRORS = (sqlite3.OperationalError, ConcordanceError)
+PERCENTILES = (50, 90, 99, 99.9)
+
+##################
+# HELPER CLASSES #
+##################
+
+@dataclass
+class WorkerResult:
+    """ What one process saw. """
+    latencies: list[float] = field(default_factory=list)  # In seconds.
+    errors: Counter = field(default_factory=Counter)
+    writes: int = 0
+    extensions: int = 0
+    wall_seconds: float = 0.0
+    unfinished: int = 0  # Conversions not begun before the deadline.
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def make_parser() -> argparse.ArgumentParser:
+    """ Make the object which handles the command-line interface. """
+    result = argparse.ArgumentParser()
+    result.add_argument(
+        "--processes",
+        default=DEFAULT_PROCESSES,
+        dest="processes",
+        type=int,
+        help="The number of processes to launch together"
+    )
+    result.add_argument(
+        "--conversions",
+        default=DEFAULT_CONVERSIONS,
+        dest="conversions",
+        type=int,
+        help="The number of conversions each process makes"
+    )
+    result.add_argument(
+        "--scenario",
+        choices=SCENARIOS,
+        default="cold",
+        dest="scenario",
+        help=(
+            "Whether the cache starts absent, already covering every year, "+
+            "or covering only the first year"
+        )
+    )
+    result.add_argument(
+        "--first-year",
+        default=DEFAULT_FIRST_GREG_YEAR,
+        dest="first_greg_year",
+        type=int,
+        help="The first Gregorian year from which to draw dates"
+    )
+    result.add_argument(
+        "--last-year",
+        default=DEFAULT_LAST_GREG_YEAR,
+        dest="last_greg_year",
+        type=int,
+        help="The last Gregorian year from which to draw dates"
+    )
+    result.add_argument(
+        "--path",
+        default=None,
+        dest="path_to_cache_db",
+        help=(
+            "The cache to hammer, by default a new one in a temp directory; "+
+            "an existing cache at this path, with its journal, is deleted "+
+            "only if --clobber is also given"
+        )
+    )
+    result.add_argument(
+        "--clobber",
+        action="store_true",
+        default=False,
+        dest="clobber",
+        help="Allow the deletion of an existing cache at the given path"
+    )
+    result.add_argument(
+        "--deadline",
+        default=DEFAULT_DEADLINE,
+        dest="deadline",
+        type=float,
+        help=(
+            "The seconds after which each process stops converting, and "+
+            "after which, give or take a grace period, any stuck process is "+
+            "terminated"
+        )
+    )
+    result.add_argument(
+        "--seed",
+        default=DEFAULT_SEED,
+        dest="seed",
+        type=int,
+        help="The seed from which each process draws its dates"
+    )
+    return result
+
+def get_boundaries(first_greg_year: int, last_greg_year: int) -> list[datetime]:
+    """ Get each Cyprian and Gregorian new year in the given years. """
+    result = []
+    for greg_year in range(first_greg_year, last_greg_year+1):
+        result.append(datetime(greg_year, 1, 1, tzinfo=timezone.utc))
+        result.append(get_cyprian_new_year(greg_year))
+    return result
+
+def make_timestamps(
+    count: int,
+    first_greg_year: int,
+    last_greg_year: int,
+    boundaries: list[datetime],
+    seed: int
+) -> list[datetime]:
+    """
+    Draw timestamps from the given years, a share of them within a few days of
+    a year boundary, where rebuilds and extensions are triggered.
+    """
+    rng = random.Random(seed)
+    first = datetime(first_greg_year, 1, 1, tzinfo=timezone.utc)
+    span_seconds = (
+        datetime(last_greg_year+1, 1, 1, tzinfo=timezone.utc)-first
+    ).total_seconds()
+    radius_seconds = timedelta(days=BOUNDARY_RADIUS).total_seconds()
+    result = []
+    for _ in range(count):
+        if rng.random() < BOUNDARY_SHARE:
+            offset = rng.uniform(-radius_seconds, radius_seconds)
+            timestamp = rng.choice(boundaries)+timedelta(seconds=offset)
+        else:
+            timestamp = first+timedelta(seconds=rng.uniform(0, span_seconds))
+        result.append(timestamp)
+    return result
+
+def get_existing_cache_files(path_to_cache_db: str) -> list[Path]:
+    """ Get the cache at a given path, and any journal, etc, beside it. """
+    path_obj = Path(path_to_cache_db)
+    result = sorted(path_obj.parent.glob(path_obj.name+"*"))
+    return result
+
+def prepare_cache(args_obj: argparse.Namespace):
+    """ Leave the cache absent, warm or about to roll over, as asked. """
+    for path_obj in get_existing_cache_files(args_obj.path_to_cache_db):
+        path_obj.unlink()
+    first_cyprian_year = \
+        get_cyprian_year_beginning_with_greg_year(args_obj.first_greg_year)-1
+    if args_obj.scenario == "warm":
+        last_cyprian_year = \
+            get_cyprian_year_beginning_with_greg_year(args_obj.last_greg_year)
+        populate_cache(
+            first_cyprian_year,
+            last_cyprian_year,
+            args_obj.path_to_cache_db
+        )
+    elif args_obj.scenario == "rollover":
+        populate_cache(
+            first_cyprian_year,
+            first_cyprian_year+1,
+            args_obj.path_to_cache_db
+        )
+
+def work(
+    path_to_cache_db: str,
+    timestamps: list[datetime],
+    deadline: float,
+    barrier: multiprocessing.Barrier,
+    queue: multiprocessing.Queue
+):
+    """
+    Wait for every other process, then convert each timestamp, until the
+    deadline, timing each conversion and counting any error, and report back.
+    """
+    set_cache_config(path_to_cache_db=path_to_cache_db)
+    result = WorkerResult()
+    barrier.wait(START_TIMEOUT)
+    with ConversionProfiler() as profiler:
+        start = perf_counter()
+        for index, timestamp in enumerate(timestamps):
+            before = perf_counter()
+            if before-start > deadline:
+                result.unfinished = len(timestamps)-index
+                break
+            try:
+                convert_date(timestamp)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                result.errors[describe_error(error)] += 1
+            result.latencies.append(perf_counter()-before)
+        result.wall_seconds = perf_counter()-start
+    phases = profiler.report.phases
+    result.writes = phases["write"].count if "write" in phases else 0
+    result.extensions = phases["extend"].count if "extend" in phases else 0
+    queue.put(result)
+
+def describe_error(error: Exception) -> str:
+    """ Describe an error, marking any of a kind not expected under load. """
+    result = f"{type(error).__name__}: {error}"
+    if not isinstance(error, EXPECTED_ERRORS):
+        result = "(unexpected) "+result
+    return result
+
+def run_workers(
+    args_obj: argparse.Namespace,
+    boundaries: list[datetime]
+) -> tuple[list[WorkerResult], int]:
+    """
+    Launch every process together, gather what each of them saw, and count
+    those which had to be terminated, still stuck, after the deadline.
+    """
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(args_obj.processes)
+    queue = context.Queue()
+    processes = []
+    for index in range(args_obj.processes):
+        timestamps = \
+            make_timestamps(
+                args_obj.conversions,
+                args_obj.first_greg_year,
+                args_obj.last_greg_year,
+                boundaries,
+                args_obj.seed+index
+            )
+        process = \
+            context.Process(
+                target=work,
+                args=(
+                    args_obj.path_to_cache_db,
+                    timestamps,
+                    args_obj.deadline,
+                    barrier,
+                    queue
+                )
+            )
+        process.start()
+        processes.append(process)
+    give_up_at = perf_counter()+args_obj.deadline+GRACE_SECONDS
+    results = []
+    while len(results) < len(processes) and perf_counter() < give_up_at:
+        try:
+            results.append(queue.get(timeout=1))
+        except queue_module.Empty:
+            if not any(process.is_alive() for process in processes):
+                break  # Any process which died without reporting has crashed.
+    stuck = 0
+    for process in processes:
+        if process.is_alive() and len(results) < len(processes):
+            process.terminate()
+            stuck += 1
+        process.join()
+    return results, stuck
+
+def get_percentile(ordered: list[float], percentile: float) -> float:
+    """ Get the nearest-rank percentile of some values, already in order. """
+    index = max(round(percentile/100*len(ordered))-1, 0)
+    return ordered[min(index, len(ordered)-1)]
+
+def summarise(
+    results: list[WorkerResult],
+    processes: int,
+    stuck: int
+) -> list[str]:
+    """ Describe the combined results in a few lines. """
+    latencies = sorted(
+        latency for result in results for latency in result.latencies
+    )
+    errors = Counter()
+    for result in results:
+        errors.update(result.errors)
+    wall_seconds = max(result.wall_seconds for result in results)
+    result = [
+        f"Throughput: {len(latencies)/wall_seconds:,.0f} conversions/s "+
+        f"({len(latencies)} in {wall_seconds:.3f}s)",
+        "Latency: "+", ".join(
+            f"p{percentile:g} "+
+            f"{get_percentile(latencies, percentile)*1000:.3f}ms"
+            for percentile in PERCENTILES
+        )+f", max {latencies[-1]*1000:.3f}ms",
+        "Rebuilds: "+str(sum(result.writes for result in results))+
+        ", extensions: "+str(sum(result.extensions for result in results)),
+        "Unfinished conversions: "+
+        str(sum(result.unfinished for result in results)),
+        f"Errors: {sum(errors.values())}, "+
+        f"stuck processes: {stuck}, "+
+        f"crashed processes: {processes-len(results)-stuck}"
+    ]
+    for message, count in errors.most_common():
+        result.append(f"  {count} x {message}")
+    return result
+
+###################
+# RUN AND WRAP UP #
+###################
+
+def run():
+    """ Run this script. """
+    parser_obj = make_parser()
+    args_obj = parser_obj.parse_args()
+    if args_obj.path_to_cache_db is not None and not args_obj.clobber:
+        existing = get_existing_cache_files(args_obj.path_to_cache_db)
+        if existing:
+            parser_obj.error(
+                "Refusing to delete "+
+                ", ".join(str(path_obj) for path_obj in existing)+
+                "; pass --clobber to allow it"
+            )
+    with tempfile.TemporaryDirectory() as path_to_temp_dir:
+        if args_obj.path_to_cache_db is None:
+            args_obj.path_to_cache_db = \
+                str(Path(path_to_temp_dir)/"stress_cache.db")
+        prepare_cache(args_obj)
+        boundaries = \
+            get_boundaries(args_obj.first_greg_year, args_obj.last_greg_year)
+        results, stuck = run_workers(args_obj, boundaries)
+    print(
+        f"{args_obj.processes} process(es), scenario {args_obj.scenario}, "+
+        f"years {args_obj.first_greg_year}-{args_obj.last_greg_year}"
+    )
+    if not results:
+        print(f"No process reported back; {stuck} were stuck.")
+        return
+    for line in summarise(results, args_obj.processes, stuck):
+        print(line)
+
+if __name__ == "__main__":
+    run()
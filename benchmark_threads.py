@@ -0,0 +1,100 @@
+"""
+This code defines a script which measures how many conversions per second a
+single, shared ConversionEngine serves as the number of threads grows.
+"""
+
+# Standard imports.
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+# Local imports.
+from source.conversion_engine import ConversionEngine
+
+# Local constants.
+DEFAULT_THREAD_COUNTS = (1, 2, 4, 8)
+DEFAULT_CONVERSIONS = 200000
+FIRST_GREG = datetime(2000, 1, 1, tzinfo=timezone.utc)
+SPAN_IN_DAYS = 365*50
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def make_parser() -> argparse.ArgumentParser:
+    """ Make the object which handles the command-line interface. """
+    result = argparse.ArgumentParser()
+    result.add_argument(
+        "--threads",
+        default=DEFAULT_THREAD_COUNTS,
+        dest="thread_counts",
+        nargs="+",
+        type=int,
+        help="The numbers of threads to try"
+    )
+    result.add_argument(
+        "--conversions",
+        default=DEFAULT_CONVERSIONS,
+        dest="conversions",
+        type=int,
+        help="The number of conversions to make with each number of threads"
+    )
+    return result
+
+def make_timestamps(count: int) -> list[datetime]:
+    """ Spread a given number of timestamps, hour by hour, over the span. """
+    result = [
+        FIRST_GREG+timedelta(hours=(index*7)%(SPAN_IN_DAYS*24))
+        for index in range(count)
+    ]
+    return result
+
+def measure(
+    engine: ConversionEngine,
+    timestamps: list[datetime],
+    thread_count: int
+) -> float:
+    """ Get the conversions per second made by a given number of threads. """
+    chunk_size = -(-len(timestamps)//thread_count)
+    chunks = [
+        timestamps[index:index+chunk_size]
+        for index in range(0, len(timestamps), chunk_size)
+    ]
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        for _ in executor.map(engine.convert_many, chunks):
+            pass
+    result = len(timestamps)/(perf_counter()-start)
+    return result
+
+def describe_interpreter() -> str:
+    """ Say which Python this is, and whether its GIL is enabled. """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    gil = "enabled" if is_gil_enabled() else "disabled"
+    return f"Python {sys.version.split()[0]}, GIL {gil}"
+
+###################
+# RUN AND WRAP UP #
+###################
+
+def run():
+    """ Run this script. """
+    parser_obj = make_parser()
+    args_obj = parser_obj.parse_args()
+    timestamps = make_timestamps(args_obj.conversions)
+    engine = ConversionEngine()
+    engine.convert_many(timestamps)  # Build every year once, untimed.
+    print(describe_interpreter())
+    baseline = None
+    for thread_count in args_obj.thread_counts:
+        rate = measure(engine, timestamps, thread_count)
+        baseline = baseline or rate
+        print(
+            f"{thread_count} thread(s): {rate:,.0f} conversions/s "+
+            f"({rate/baseline:.2f}x)"
+        )
+
+if __name__ == "__main__":
+    run()
@@ -12,8 +12,15 @@ DESCRIPTION = "A Cyprian extension to the datetime package"
 GIT_URL_STEM = "https://github.com/tomhosker"
 AUTHOR = "Tom Hosker"
 AUTHOR_EMAIL = "tomdothosker@gmail.com"
-SCRIPT_PATHS = ("scripts/get-cyprian-date", "scripts/convert-cyprian-date")
+SCRIPT_PATHS = (
+    "scripts/get-cyprian-date",
+    "scripts/convert-cyprian-date",
+    "scripts/verify-cyprian-cache",
+    "scripts/cyprian-cache",
+    "scripts/export-cyprian-ical"
+)
 INSTALL_REQUIRES = ("python-dateutil", "ephem", "hosker-utils")
+EXTRAS_REQUIRE = { "arrow": ("pyarrow",), "pandas": ("pandas",) }
 INCLUDE_PACKAGE_DATA = True
 
 ###################################
@@ -32,5 +39,6 @@ setup(
     packages=[PACKAGE_NAME],
     scripts=SCRIPT_PATHS,
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     include_package_data=INCLUDE_PACKAGE_DATA
 )
@@ -0,0 +1,266 @@
+"""
+This code defines a compact alternative to Concordance, which, rather than one
+row per day, stores only the day on which each Cyprian month begins, i.e. about
+14 small rows per year rather than 365 wide ones, and converts in either
+direction by bisecting a year's month starts and adding an offset.
+"""
+
+# Standard imports.
+import sqlite3
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone, tzinfo
+from pathlib import Path
+from sqlite3 import Connection
+
+# Local imports.
+from .cache_config import CacheConfig, connect_to_memory, get_cache_config
+from .concordance import (
+    Concordance,
+    ConcordanceError,
+    get_path_to_zone_cache_db
+)
+from .cyprian_date import (
+    CyprianDate,
+    get_cyprian_year_beginning_with_greg_year,
+    round_down_to_nearest_day
+)
+from .profiling import get_connection_class, profile_phase
+from .year_structure import YearStructure, compute_year_structure
+
+# Local constants.
+BOUNDARIES_INFIX = ".boundaries"
+PATH_TO_SCRIPT = str(Path(__file__).parent/"sql"/"create_boundaries.sql")
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class BoundaryConcordance:
+    """ The class in question. """
+    path_to_cache_db: str|None = None
+    zone: tzinfo = timezone.utc
+    read_only: bool|None = None
+    config: CacheConfig|None = None
+    # The ordinal of the first day of each month of each year, followed by
+    # that of the first day of the next year.
+    year_boundaries: dict[int, tuple[int, ...]] = \
+        field(init=False, default_factory=dict)
+    db_connection: Connection|None = field(init=False, default=None)
+
+    def __post_init__(self):
+        if self.config is None:
+            self.config = get_cache_config()
+        if self.path_to_cache_db is None:
+            self.path_to_cache_db = self.config.path_to_cache_db
+        if self.read_only is None:
+            self.read_only = self.config.read_only
+        self.path_to_cache_db = \
+            get_path_to_boundary_db(
+                get_path_to_zone_cache_db(self.path_to_cache_db, self.zone)
+            )
+
+    def establish_connection(self):
+        """ Create the Connection object, and the table if need be. """
+        if self.db_connection is not None:
+            return
+        factory = get_connection_class()
+        if self.config.is_in_memory():
+            self.db_connection = \
+                connect_to_memory(self.path_to_cache_db, factory)
+        elif self.read_only:
+            uri = Path(self.path_to_cache_db).resolve().as_uri()+"?mode=ro"
+            try:
+                self.db_connection = \
+                    sqlite3.connect(uri, uri=True, factory=factory)
+            except sqlite3.OperationalError as error:
+                raise ConcordanceError(
+                    "Boundaries lie outside read-only cache "+
+                    self.path_to_cache_db
+                ) from error
+        else:
+            self.db_connection = \
+                sqlite3.connect(self.path_to_cache_db, factory=factory)
+        if not self.read_only:
+            with open(PATH_TO_SCRIPT, "r") as script_file:
+                script = script_file.read()
+            self.db_connection.executescript(script)
+
+    def close(self):
+        """ Ronseal. """
+        if self.db_connection is not None:
+            self.db_connection.close()
+            self.db_connection = None
+
+    def read_year(self, cyprian_year: int) -> tuple[int, ...]|None:
+        """
+        Read the boundaries of a given year from the database, if it holds
+        them, which, being written in one transaction, are always complete.
+        """
+        self.establish_connection()
+        cursor = self.db_connection.cursor()
+        query = (
+            "SELECT greg_ordinal FROM MonthBoundary "+
+            "WHERE cyprian_year = ? ORDER BY cyprian_month;"
+        )
+        cursor.execute(query, (cyprian_year,))
+        result = tuple(row[0] for row in cursor.fetchall())
+        if not result:
+            return None
+        self.year_boundaries[cyprian_year] = result
+        return result
+
+    @profile_phase("write_boundaries")
+    def write_year(self, cyprian_year: int):
+        """ Compute the month starts of a given year, and record them. """
+        if self.read_only:
+            raise ConcordanceError(
+                f"Year {cyprian_year} lies outside read-only cache "+
+                self.path_to_cache_db
+            )
+        self.establish_connection()
+        year_structure = compute_year_structure(cyprian_year, self.zone)
+        ordinals = tuple(
+            greg.date().toordinal()
+            for greg in
+            year_structure.month_starts+(year_structure.next_year_start,)
+        )
+        query = (
+            "INSERT OR REPLACE INTO MonthBoundary "+
+            "(cyprian_year, cyprian_month, greg_ordinal) VALUES (?, ?, ?);"
+        )
+        with self.db_connection:
+            self.db_connection.executemany(
+                query,
+                (
+                    (cyprian_year, month, ordinal)
+                    for month, ordinal in enumerate(ordinals, start=1)
+                )
+            )
+        self.year_boundaries[cyprian_year] = ordinals
+
+    def get_boundaries(
+        self,
+        cyprian_year: int,
+        force_write_first: bool = False
+    ) -> tuple[int, ...]:
+        """
+        Get the boundaries of a given year, from memory if possible, else from
+        the database, in case another process has written them, else by
+        computing and writing them.
+        """
+        if not force_write_first:
+            result = \
+                self.year_boundaries.get(cyprian_year) or \
+                self.read_year(cyprian_year)
+            if result is not None:
+                return result
+        self.write_year(cyprian_year)
+        return self.year_boundaries[cyprian_year]
+
+    def get_year_structure(
+        self,
+        cyprian_year: int,
+        force_write_first: bool = False
+    ) -> YearStructure:
+        """ Get the month-by-month structure of a given Cyprian year. """
+        boundaries = self.get_boundaries(cyprian_year, force_write_first)
+        starts = tuple(self.from_ordinal(ordinal) for ordinal in boundaries)
+        result = YearStructure(cyprian_year, starts[:-1], starts[-1], self.zone)
+        return result
+
+    @profile_phase("convert_greg")
+    def convert_greg(
+        self,
+        greg: datetime = None,
+        force_write_first: bool = False
+    ) -> CyprianDate:
+        """ Convert a given Gregorian date into its Cyprian equivalent. """
+        if greg is None:
+            greg = datetime.now(timezone.utc)
+        greg = round_down_to_nearest_day(greg, self.zone)
+        ordinal = greg.toordinal()
+        cyprian_year = get_cyprian_year_beginning_with_greg_year(greg.year)
+        boundaries = self.get_boundaries(cyprian_year, force_write_first)
+        if ordinal < boundaries[0]:
+            cyprian_year -= 1
+            boundaries = self.get_boundaries(cyprian_year, force_write_first)
+        month = bisect_right(boundaries, ordinal)
+        if not 1 <= month < len(boundaries):
+            raise ConcordanceError(
+                f"Boundaries of year {cyprian_year} don't contain {greg}"
+            )
+        result = \
+            CyprianDate(cyprian_year, month, ordinal-boundaries[month-1]+1)
+        return result
+
+    @profile_phase("convert_cyprian")
+    def convert_cyprian(
+        self,
+        cyprian: CyprianDate,
+        force_write_first: bool = False
+    ) -> datetime:
+        """ Convert a given Cyprian date into its Gregorian equivalent. """
+        boundaries = self.get_boundaries(cyprian.year, force_write_first)
+        month = cyprian.month
+        if (
+            not 1 <= month < len(boundaries) or
+            not 1 <= cyprian.day <= boundaries[month]-boundaries[month-1]
+        ):
+            raise ConcordanceError(f"No such date: {cyprian}")
+        result = self.from_ordinal(boundaries[month-1]+cyprian.day-1)
+        return result
+
+    def from_ordinal(self, ordinal: int) -> datetime:
+        """ Get midnight, in this cache's zone, on a given day. """
+        greg = date.fromordinal(ordinal)
+        return datetime(greg.year, greg.month, greg.day, tzinfo=self.zone)
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def get_path_to_boundary_db(path_to_cache_db: str) -> str:
+    """
+    Get the path to the month-boundary database kept alongside a given
+    per-day cache, i.e. that path with an infix inserted before the suffix.
+    """
+    path_obj = Path(path_to_cache_db)
+    result = path_obj.with_name(
+        f"{path_obj.stem}{BOUNDARIES_INFIX}{path_obj.suffix}"
+    )
+    return str(result)
+
+def find_disagreements(
+    boundary_concordance: BoundaryConcordance,
+    concordance: Concordance,
+    cyprian_year: int
+) -> list[tuple[date, tuple[int, int, int], tuple[int, int, int]]]:
+    """
+    Check a given year of the month-boundary encoding against the per-day
+    table, in both directions, returning each day, with the Cyprian date which
+    the table gives, and that which the boundaries give, on which they differ.
+    """
+    concordance.prepare(cyprian=CyprianDate(cyprian_year, 1, 1))
+    rows = concordance.read_year_rows(cyprian_year)
+    if not rows:
+        raise ConcordanceError(f"No rows for year {cyprian_year}")
+    result = []
+    for greg_year, greg_month, greg_day, cyprian_month, cyprian_day in rows:
+        greg = \
+            datetime(greg_year, greg_month, greg_day, tzinfo=concordance.zone)
+        expected = CyprianDate(cyprian_year, cyprian_month, cyprian_day)
+        actual = boundary_concordance.convert_greg(greg)
+        if (
+            actual != expected or
+            boundary_concordance.convert_cyprian(expected) != greg
+        ):
+            result.append(
+                (
+                    greg.date(),
+                    (expected.year, expected.month, expected.day),
+                    (actual.year, actual.month, actual.day)
+                )
+            )
+    return result
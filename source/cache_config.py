@@ -0,0 +1,161 @@
+"""
+This code defines how the cache is configured, i.e. where it lives, whether it
+lives on disk or only in memory, whether it may be written to, and how large
+it may grow. A configuration can be set for a given context, e.g. a request
+from a given tenant, for the whole process, or through environment variables,
+and is looked for in that order.
+"""
+
+# Standard imports.
+import os
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Iterator, Mapping
+from urllib.parse import quote
+
+# Local imports.
+from . import constants
+
+# Local constants.
+BACKEND_SQLITE = "sqlite"
+BACKEND_MEMORY = "memory"
+BACKENDS = (BACKEND_SQLITE, BACKEND_MEMORY)
+# Writing the cache always writes two whole Cyprian years.
+MIN_CYPRIAN_YEARS = 2
+ENV_PATH = "CYPRIAN_DATETIME_CACHE_PATH"
+ENV_BACKEND = "CYPRIAN_DATETIME_CACHE_BACKEND"
+ENV_READ_ONLY = "CYPRIAN_DATETIME_CACHE_READ_ONLY"
+ENV_MAX_CYPRIAN_YEARS = "CYPRIAN_DATETIME_CACHE_MAX_YEARS"
+TRUTHY_STRINGS = ("1", "true", "yes", "on")
+CONTEXT_CONFIG = ContextVar("cyprian_datetime_cache_config", default=None)
+PROCESS_CONFIG = None
+# Each in-memory cache lives only as long as a connection to it, so keep one.
+MEMORY_KEEPERS: dict[str, sqlite3.Connection] = {}
+MEMORY_LOCK = Lock()
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """ The class in question. """
+    path_to_cache_db: str = constants.DEFAULT_PATH_TO_CACHE_DB
+    backend: str = BACKEND_SQLITE
+    read_only: bool = False
+    # Beyond this many Cyprian years, extending the cache evicts the oldest.
+    max_cyprian_years: int|None = None
+
+    def __post_init__(self):
+        if self.backend not in BACKENDS:
+            raise CacheConfigError(f"Unknown backend: {self.backend}")
+        if (
+            self.max_cyprian_years is not None and
+            self.max_cyprian_years < MIN_CYPRIAN_YEARS
+        ):
+            raise CacheConfigError(
+                f"The cache must hold at least {MIN_CYPRIAN_YEARS} years"
+            )
+
+    @classmethod
+    def from_environment(
+        cls,
+        environ: Mapping[str, str]|None = None
+    ) -> "CacheConfig":
+        """ Read the configuration from the environment variables, if set. """
+        if environ is None:
+            environ = os.environ
+        max_cyprian_years = environ.get(ENV_MAX_CYPRIAN_YEARS)
+        result = \
+            cls(
+                path_to_cache_db=environ.get(
+                    ENV_PATH, constants.DEFAULT_PATH_TO_CACHE_DB
+                ),
+                backend=environ.get(ENV_BACKEND, BACKEND_SQLITE),
+                read_only=(
+                    environ.get(ENV_READ_ONLY, "").lower() in TRUTHY_STRINGS
+                ),
+                max_cyprian_years=(
+                    int(max_cyprian_years) if max_cyprian_years else None
+                )
+            )
+        return result
+
+    def is_in_memory(self) -> bool:
+        """ Ronseal. """
+        return self.backend == BACKEND_MEMORY
+
+##################
+# HELPER CLASSES #
+##################
+
+class CacheConfigError(Exception):
+    """ A custom exception. """
+
+#############
+# FUNCTIONS #
+#############
+
+def get_cache_config() -> CacheConfig:
+    """
+    Get the configuration for the current context, or else for the process,
+    or else from the environment.
+    """
+    result = CONTEXT_CONFIG.get()
+    if result is None:
+        result = PROCESS_CONFIG
+    if result is None:
+        result = CacheConfig.from_environment()
+    return result
+
+def set_cache_config(config: CacheConfig|None = None, **changes):
+    """
+    Set the configuration for the whole process, either as given, or as the
+    current one with the given changes. Setting None restores the default.
+    """
+    global PROCESS_CONFIG  # pylint: disable=global-statement
+    if changes:
+        config = replace(config or get_cache_config(), **changes)
+    PROCESS_CONFIG = config
+
+@contextmanager
+def use_cache_config(
+    config: CacheConfig|None = None,
+    **changes
+) -> Iterator[CacheConfig]:
+    """
+    Use a given configuration, or the current one with the given changes,
+    within a block, e.g. for the duration of a given tenant's request.
+    """
+    if config is None:
+        config = get_cache_config()
+    if changes:
+        config = replace(config, **changes)
+    token = CONTEXT_CONFIG.set(config)
+    try:
+        yield config
+    finally:
+        CONTEXT_CONFIG.reset(token)
+
+def connect_to_memory(
+    name: str,
+    factory: type[sqlite3.Connection] = sqlite3.Connection
+) -> sqlite3.Connection:
+    """ Connect to the named in-memory cache, creating it if need be. """
+    uri = "file:"+quote(name)+"?mode=memory&cache=shared"
+    with MEMORY_LOCK:
+        if uri not in MEMORY_KEEPERS:
+            MEMORY_KEEPERS[uri] = \
+                sqlite3.connect(uri, uri=True, check_same_thread=False)
+    result = sqlite3.connect(uri, uri=True, factory=factory)
+    return result
+
+def drop_memory_caches():
+    """ Let go of every in-memory cache. """
+    with MEMORY_LOCK:
+        for connection in MEMORY_KEEPERS.values():
+            connection.close()
+        MEMORY_KEEPERS.clear()
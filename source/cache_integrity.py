@@ -0,0 +1,173 @@
+"""
+This code defines a class which checks the cache, Cyprian year by Cyprian
+year, for damage, e.g. as left by an interrupted write, and rebuilds only those
+years which are damaged.
+"""
+
+# Standard imports.
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone, tzinfo
+from pathlib import Path
+
+# Local imports.
+from . import constants
+from .cache_config import CacheConfig
+from .concordance import Concordance, ConcordanceError
+from .cyprian_date import CyprianDate
+from .year_structure import compute_year_structure
+
+# Local constants.
+MONTH_LENGTHS = (29, 30)
+
+##################
+# HELPER CLASSES #
+##################
+
+@dataclass
+class IntegrityReport:
+    """ The findings of a verification. """
+    checked_years: list[int] = field(default_factory=list)
+    damaged_years: dict[int, str] = field(default_factory=dict)
+    fatal_error: str|None = None
+
+    @property
+    def ok(self) -> bool:
+        """ Determine whether the cache was found to be sound. """
+        return self.fatal_error is None and not self.damaged_years
+
+    def __str__(self) -> str:
+        if self.fatal_error:
+            return f"Cache unusable: {self.fatal_error}"
+        lines = [f"Checked {len(self.checked_years)} year(s)."]
+        for year, reason in sorted(self.damaged_years.items()):
+            lines.append(f"{constants.YEAR_INITIAL}{year} damaged: {reason}")
+        return "\n".join(lines)
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class CacheVerifier:
+    """ The class in question. """
+    path_to_cache_db: str|None = None
+    zone: tzinfo = timezone.utc
+    thorough: bool = False
+    config: CacheConfig|None = None
+    concordance: Concordance|None = field(init=False, default=None)
+
+    def __post_init__(self):
+        self.concordance = \
+            Concordance(
+                path_to_cache_db=self.path_to_cache_db,
+                zone=self.zone,
+                config=self.config
+            )
+
+    def verify(self) -> IntegrityReport:
+        """
+        Check each Cyprian year in the cache against its checksum and for
+        continuity, and, if thorough, against the new moons themselves.
+        """
+        result = IntegrityReport()
+        try:
+            self.concordance.establish_connection()
+            span = self.concordance.read_span()
+        except (sqlite3.DatabaseError, ConcordanceError) as error:
+            # The connection itself may be what failed.
+            self.concordance.close_connection()
+            result.fatal_error = str(error)
+            return result
+        for year in range(span.first_cyprian_year, span.cursor_cyprian.year):
+            result.checked_years.append(year)
+            reason = self.find_damage(year)
+            if reason:
+                result.damaged_years[year] = reason
+        self.concordance.close_connection()
+        return result
+
+    def find_damage(self, cyprian_year: int) -> str|None:
+        """ Explain what is wrong with a given year, if anything. """
+        checksum = self.concordance.read_checksum(cyprian_year)
+        if checksum is None:
+            return "no checksum"
+        if checksum != self.concordance.compute_checksum(cyprian_year):
+            return "checksum mismatch"
+        rows = self.concordance.read_year_rows(cyprian_year)
+        reason = find_discontinuity(rows)
+        if reason:
+            return reason
+        month_starts = tuple(
+            datetime(*row[:3], tzinfo=self.zone) for row in rows if row[4] == 1
+        )
+        try:
+            year_structure = self.concordance.read_year_structure(cyprian_year)
+        except ConcordanceError:
+            return "no month starts"
+        if year_structure.month_starts != month_starts:
+            return "month starts disagree with days"
+        if self.thorough:
+            expected = compute_year_structure(cyprian_year, self.zone)
+            if expected != year_structure:
+                return "months do not begin at the new moons"
+        return None
+
+    def repair(self, report: IntegrityReport|None = None) -> IntegrityReport:
+        """
+        Rebuild those years which are damaged, or the whole cache if it can't
+        be used at all, and then verify it again.
+        """
+        if report is None:
+            report = self.verify()
+        if report.fatal_error:
+            Path(self.concordance.path_to_cache_db).unlink(missing_ok=True)
+            self.concordance.write()
+            return self.verify()
+        if report.damaged_years:
+            self.concordance.establish_connection()
+            for year in sorted(report.damaged_years):
+                self.rebuild_year(year)
+            self.concordance.commit_and_close()
+        return self.verify()
+
+    def rebuild_year(self, cyprian_year: int):
+        """ Throw away, and then recalculate, the rows for a given year. """
+        cursor = self.concordance.db_connection.cursor()
+        for table in ("Equivalence", "MonthStart"):
+            cursor.execute(
+                f"DELETE FROM {table} WHERE cyprian_year = ?;", (cyprian_year,)
+            )
+        start = compute_year_structure(cyprian_year, self.zone).start
+        self.concordance.walk(start, CyprianDate(cyprian_year, 1, 1))
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def find_discontinuity(rows: list[tuple[int, ...]]) -> str|None:
+    """
+    Given a year's rows, in order, explain any gap in the Gregorian days, any
+    misstep in the Cyprian days, or any month of an impossible length.
+    """
+    if not rows:
+        return "no rows"
+    if rows[0][3:] != (1, 1):
+        return "does not begin on 01 Pri"
+    last_ordinal = None
+    last_month, last_day = None, None
+    for greg_year, greg_month, greg_day, month, day in rows:
+        ordinal = date(greg_year, greg_month, greg_day).toordinal()
+        if last_ordinal is not None:
+            if ordinal != last_ordinal+1:
+                return f"gap after {date.fromordinal(last_ordinal)}"
+            if (month, day) == (last_month+1, 1):
+                if last_day not in MONTH_LENGTHS:
+                    return f"month {last_month} has {last_day} days"
+            elif (month, day) != (last_month, last_day+1):
+                return f"misstep at {date.fromordinal(ordinal)}"
+        last_ordinal = ordinal
+        last_month, last_day = month, day
+    if last_month > constants.LEAP_MONTH or last_day not in MONTH_LENGTHS:
+        return f"month {last_month} has {last_day} days"
+    return None
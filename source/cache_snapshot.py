@@ -0,0 +1,136 @@
+"""
+This code defines some functions which populate a cache for a range of Cyprian
+years, compact it, and export or import it as a portable snapshot, e.g. so
+that a ready-made cache can be baked into a container image.
+"""
+
+# Standard imports.
+import os
+import sqlite3
+from datetime import timezone, tzinfo
+from pathlib import Path
+
+# Local imports.
+from .cache_config import CacheConfig, get_cache_config
+from .cache_integrity import CacheVerifier
+from .concordance import Concordance, get_path_to_zone_cache_db
+from .cyprian_date import CyprianDate
+
+# Local constants.
+TEMP_SUFFIX = ".partial"
+
+#############
+# FUNCTIONS #
+#############
+
+def populate_cache(
+    first_cyprian_year: int,
+    last_cyprian_year: int,
+    path_to_cache_db: str|None = None,
+    zone: tzinfo = timezone.utc
+) -> str:
+    """
+    (Re)write the cache so that it covers at least the given range of Cyprian
+    years (inclusive), compact it, and return its path.
+    """
+    if last_cyprian_year < first_cyprian_year:
+        raise CacheSnapshotError(
+            f"Range {first_cyprian_year}-{last_cyprian_year} is empty"
+        )
+    path_to_cache_db = path_to_cache_db or get_cache_config().path_to_cache_db
+    concordance = \
+        Concordance(
+            zone=zone,
+            config=CacheConfig(path_to_cache_db=path_to_cache_db)
+        )
+    # Writing a year also writes the whole of the year before it.
+    concordance.write(new_cyprian_year=first_cyprian_year+1)
+    if last_cyprian_year > first_cyprian_year+1:
+        concordance.extend(cyprian=CyprianDate(last_cyprian_year, 1, 1))
+    compact_cache(concordance.path_to_cache_db)
+    return concordance.path_to_cache_db
+
+def compact_cache(path_to_cache_db: str):
+    """
+    Reclaim any free space in a given cache file, and make sure that it
+    doesn't rely on a write-ahead log, so that it can be opened read-only.
+    """
+    connection = sqlite3.connect(path_to_cache_db)
+    connection.execute("PRAGMA journal_mode = DELETE;")
+    connection.execute("VACUUM;")
+    connection.close()
+
+def export_snapshot(
+    path_to_snapshot: str,
+    path_to_cache_db: str|None = None,
+    zone: tzinfo = timezone.utc
+) -> str:
+    """ Copy the cache, consistently and compactly, to a snapshot file. """
+    path_to_cache_db = get_path_to_zone_cache_db(
+        path_to_cache_db or get_cache_config().path_to_cache_db, zone
+    )
+    if not Path(path_to_cache_db).exists():
+        raise CacheSnapshotError(f"No cache at {path_to_cache_db}")
+    source = open_read_only(path_to_cache_db)
+    copy_database(source.db_connection, path_to_snapshot)
+    source.close_connection()
+    return path_to_snapshot
+
+def import_snapshot(
+    path_to_snapshot: str,
+    path_to_cache_db: str|None = None,
+    zone: tzinfo = timezone.utc
+) -> str:
+    """
+    Check that a snapshot is sound, and then copy it into place as the cache
+    for a given zone, returning the path to which it was copied.
+    """
+    report = \
+        CacheVerifier(
+            config=CacheConfig(path_to_cache_db=path_to_snapshot)
+        ).verify()
+    if not report.ok:
+        raise CacheSnapshotError(
+            f"Snapshot {path_to_snapshot} is unsound:\n{report}"
+        )
+    path_to_cache_db = get_path_to_zone_cache_db(
+        path_to_cache_db or get_cache_config().path_to_cache_db, zone
+    )
+    source = open_read_only(path_to_snapshot)
+    copy_database(source.db_connection, path_to_cache_db)
+    source.close_connection()
+    return path_to_cache_db
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def open_read_only(path_to_db: str) -> Concordance:
+    """
+    Open a given cache file read-only, whatever the current configuration.
+    """
+    result = \
+        Concordance(
+            config=CacheConfig(path_to_cache_db=path_to_db, read_only=True)
+        )
+    result.establish_connection()
+    return result
+
+def copy_database(source: sqlite3.Connection, path_to_target: str):
+    """
+    Copy a database to a given path via a temporary file, so that anything
+    already at that path is replaced in one step or not at all.
+    """
+    path_to_temp = path_to_target+TEMP_SUFFIX
+    target = sqlite3.connect(path_to_temp)
+    source.backup(target)
+    target.close()
+    compact_cache(path_to_temp)
+    os.replace(path_to_temp, path_to_target)
+
+##################
+# HELPER CLASSES #
+##################
+
+class CacheSnapshotError(Exception):
+    """ A custom exception. """
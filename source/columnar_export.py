@@ -0,0 +1,124 @@
+"""
+This code defines some functions which export a concordance over a range of
+Gregorian years in columnar form, i.e. to CSV, Arrow IPC or Parquet files,
+streaming one row group per Gregorian year.
+"""
+
+# Standard imports.
+import csv
+from datetime import datetime, timezone
+from typing import Iterator
+
+# Non-standard imports.
+try:
+    import pyarrow
+    from pyarrow import ipc
+except ImportError:  # Arrow is an optional dependency.
+    pyarrow = None
+try:
+    from pyarrow import parquet
+except ImportError:  # Parquet is an optional dependency.
+    parquet = None
+
+# Local imports.
+from .liturgical_calendar import DEFAULT_CALENDAR
+from .year_structure import iter_days_between
+
+# Local constants.
+COLUMNS = (
+    "greg_date",
+    "cyprian_year",
+    "cyprian_month",
+    "cyprian_day",
+    "liturgical"
+)
+
+#############
+# FUNCTIONS #
+#############
+
+def iter_row_groups(
+    first_greg_year: int,
+    last_greg_year: int
+) -> Iterator[dict[str, list]]:
+    """
+    Yield, for each Gregorian year in the range (inclusive), a dict mapping
+    each column name to that year's values.
+    """
+    for greg_year in range(first_greg_year, last_greg_year+1):
+        liturgical_lookup = DEFAULT_CALENDAR.get_ordinal_lookup(greg_year)
+        result = {column: [] for column in COLUMNS}
+        for greg, year, month, day in iter_days_between(
+            datetime(greg_year, 1, 1, tzinfo=timezone.utc),
+            datetime(greg_year+1, 1, 1, tzinfo=timezone.utc)
+        ):
+            result["greg_date"].append(greg.date())
+            result["cyprian_year"].append(year)
+            result["cyprian_month"].append(month)
+            result["cyprian_day"].append(day)
+            result["liturgical"].append(
+                liturgical_lookup.get(greg.toordinal())
+            )
+        yield result
+
+def export_csv(path: str, first_greg_year: int, last_greg_year: int) -> str:
+    """ Write the concordance for a range of years to a CSV file. """
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(COLUMNS)
+        for row_group in iter_row_groups(first_greg_year, last_greg_year):
+            row_group["greg_date"] = \
+                [greg_date.isoformat() for greg_date in row_group["greg_date"]]
+            writer.writerows(zip(*(row_group[column] for column in COLUMNS)))
+    return path
+
+def export_arrow(path: str, first_greg_year: int, last_greg_year: int) -> str:
+    """ Write the concordance for a range of years to an Arrow IPC file. """
+    check_for_pyarrow()
+    schema = get_arrow_schema()
+    with ipc.new_file(path, schema) as writer:
+        for row_group in iter_row_groups(first_greg_year, last_greg_year):
+            writer.write_batch(
+                pyarrow.RecordBatch.from_pydict(row_group, schema=schema)
+            )
+    return path
+
+def export_parquet(
+    path: str,
+    first_greg_year: int,
+    last_greg_year: int
+) -> str:
+    """ Write the concordance for a range of years to a Parquet file. """
+    check_for_pyarrow()
+    if parquet is None:
+        raise ColumnarExportError("Parquet export requires pyarrow.parquet")
+    schema = get_arrow_schema()
+    with parquet.ParquetWriter(path, schema) as writer:
+        for row_group in iter_row_groups(first_greg_year, last_greg_year):
+            writer.write_table(
+                pyarrow.Table.from_pydict(row_group, schema=schema)
+            )
+    return path
+
+def get_arrow_schema() -> "pyarrow.Schema":
+    """ Get the typed schema of the exported columns. """
+    result = pyarrow.schema([
+        ("greg_date", pyarrow.date32()),
+        ("cyprian_year", pyarrow.int32()),
+        ("cyprian_month", pyarrow.int8()),
+        ("cyprian_day", pyarrow.int8()),
+        ("liturgical", pyarrow.string())
+    ])
+    return result
+
+def check_for_pyarrow():
+    """ Raise an exception if the optional Arrow dependency is missing. """
+    if pyarrow is None:
+        raise ColumnarExportError("Columnar export requires pyarrow")
+
+##################
+# HELPER CLASSES #
+##################
+
+class ColumnarExportError(Exception):
+    """ A custom exception. """
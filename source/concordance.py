@@ -4,24 +4,38 @@ in a given Gregorian year.
 """
 
 # Standard imports.
+import hashlib
+import re
 import sqlite3
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
 from pathlib import Path
 from sqlite3 import Connection
+from typing import Sequence
 
 # Local imports.
-from . import constants
+from .cache_config import CacheConfig, connect_to_memory, get_cache_config
 from .cyprian_date import (
     CyprianDate,
     get_cyprian_year_beginning_with_greg_year,
     get_greg_year_ending_with_cyprian_year,
     get_vernal_equinox,
-    get_cyprian_new_year
+    get_cyprian_new_year,
+    round_down_to_nearest_day
 )
+from .profiling import get_connection_class, profile_phase
+from .year_structure import YearStructure
 
 # Local constants.
-DATETIME_EPHEMERALS = ("vernal_equinox", "cyprian_new_year")
+DATETIME_EPHEMERALS = (
+    "vernal_equinox",
+    "cyprian_new_year",
+    "first_greg",
+    "cursor_greg"
+)
+# Beyond this many Cyprian years, rebuilding beats extending.
+MAX_EXTENSION_YEARS = 2
+DEFAULT_ZONE_NAME = "UTC"
 
 ##############
 # MAIN CLASS #
@@ -32,14 +46,29 @@ class Concordance:
     """ The class in question. """
     whole_greg_year: int|None = None
     whole_cyprian_year: int|None = None
-    path_to_cache_db: str = constants.DEFAULT_PATH_TO_CACHE_DB
+    path_to_cache_db: str|None = None
+    zone: tzinfo = timezone.utc
+    read_only: bool|None = None
+    config: CacheConfig|None = None
     last_vernal_equinox: datetime|None = field(init=False, default=None)
     this_vernal_equinox: datetime|None = field(init=False, default=None)
     last_cyprian_new_year: datetime|None = field(init=False, default=None)
     this_cyprian_new_year: datetime|None = field(init=False, default=None)
+    first_greg: datetime|None = field(init=False, default=None)
+    first_cyprian_year: int|None = field(init=False, default=None)
+    cursor_greg: datetime|None = field(init=False, default=None)
+    cursor_cyprian: CyprianDate|None = field(init=False, default=None)
     db_connection: Connection|None = field(init=False, default=None)
 
     def __post_init__(self):
+        if self.config is None:
+            self.config = get_cache_config()
+        if self.path_to_cache_db is None:
+            self.path_to_cache_db = self.config.path_to_cache_db
+        if self.read_only is None:
+            self.read_only = self.config.read_only
+        self.path_to_cache_db = \
+            get_path_to_zone_cache_db(self.path_to_cache_db, self.zone)
         if self.whole_greg_year is None:
             if self.whole_cyprian_year is None:
                 self.whole_greg_year = datetime.now(timezone.utc).year
@@ -61,14 +90,17 @@ class Concordance:
         self.whole_greg_year = \
             get_greg_year_ending_with_cyprian_year(self.whole_cyprian_year)
 
+    @profile_phase("write")
     def write(self, new_greg_year: int = None, new_cyprian_year: int = None):
         """ Create a concordance, and write it to the database. """
+        self.check_writable()
         if new_greg_year is not None:
             self.whole_greg_year = new_greg_year
             self.auto_set_whole_cyprian_year()
         if new_cyprian_year is not None:
             self.whole_cyprian_year = new_cyprian_year
             self.auto_set_whole_greg_year()
+        self.close_connection()
         self.establish_connection()
         self.create_database()
         self.set_equinoctes()
@@ -77,14 +109,125 @@ class Concordance:
         self.write_ephemerals()
         self.commit_and_close()
 
+    @profile_phase("extend")
+    def extend(self, greg: datetime = None, cyprian: CyprianDate = None):
+        """
+        Extend the cache, a Cyprian year at a time, from the point at which it
+        last left off, until it covers the given date, evicting the oldest
+        years if need be.
+        """
+        self.check_writable()
+        self.close_connection()
+        self.establish_connection()
+        span = self.read_span()
+        self.first_greg = span.first_greg
+        self.first_cyprian_year = span.first_cyprian_year
+        self.cursor_greg = span.cursor_greg
+        self.cursor_cyprian = span.cursor_cyprian
+        while (
+            (
+                greg and
+                self.cursor_greg <= round_down_to_nearest_day(greg, self.zone)
+            ) or
+            (cyprian and self.cursor_cyprian.year <= cyprian.year)
+        ):
+            self.walk(self.cursor_greg, self.cursor_cyprian)
+        self.evict_surplus_years()
+        self.whole_cyprian_year = self.cursor_cyprian.year-1
+        self.auto_set_whole_greg_year()
+        self.set_equinoctes()
+        self.set_cyprian_new_years()
+        self.write_ephemerals()
+        self.commit_and_close()
+
+    def prepare(
+        self,
+        greg: datetime = None,
+        cyprian: CyprianDate = None,
+        force_write_first: bool = False
+    ):
+        """
+        Make sure that the cache covers a given date, (re)writing or extending
+        it as necessary, and leave a connection to it open. A read-only cache
+        is never written to, so it has to cover the date already.
+        """
+        if self.read_only:
+            if (
+                force_write_first or
+                self.should_write_first(greg, cyprian) or
+                self.should_extend_first(greg, cyprian)
+            ):
+                raise ConcordanceError(
+                    f"Date {greg or cyprian} lies outside read-only cache "+
+                    self.path_to_cache_db
+                )
+        elif force_write_first or self.should_write_first(greg, cyprian):
+            if greg:
+                self.write(new_greg_year=greg.year)
+            else:
+                self.write(new_cyprian_year=cyprian.year)
+        elif self.should_extend_first(greg, cyprian):
+            self.extend(greg, cyprian)
+        self.establish_connection()
+
+    def evict_surplus_years(self):
+        """
+        Drop the oldest Cyprian years, if the cache now holds more of them than
+        the configuration allows, rather than rebuilding it from scratch.
+        """
+        max_cyprian_years = self.config.max_cyprian_years
+        if max_cyprian_years is None:
+            return
+        new_first_cyprian_year = self.cursor_cyprian.year-max_cyprian_years
+        if new_first_cyprian_year <= self.first_cyprian_year:
+            return
+        cursor = self.db_connection.cursor()
+        for table in ("Equivalence", "MonthStart", "YearChecksum"):
+            cursor.execute(
+                f"DELETE FROM {table} WHERE cyprian_year < ?;",
+                (new_first_cyprian_year,)
+            )
+        query = (
+            "SELECT greg_year, greg_month, greg_day FROM MonthStart "+
+            "WHERE cyprian_year = ? AND cyprian_month = 1;"
+        )
+        cursor.execute(query, (new_first_cyprian_year,))
+        self.first_greg = datetime(*cursor.fetchone(), tzinfo=self.zone)
+        self.first_cyprian_year = new_first_cyprian_year
+
     def establish_connection(self):
-        """ Create the Connection object. """
-        self.db_connection = sqlite3.connect(self.path_to_cache_db)
+        """ Create the Connection object, unless one is already open. """
+        if self.db_connection is not None:
+            return
+        factory = get_connection_class()
+        if self.config.is_in_memory():
+            self.db_connection = \
+                connect_to_memory(self.path_to_cache_db, factory)
+        elif self.read_only:
+            uri = Path(self.path_to_cache_db).resolve().as_uri()+"?mode=ro"
+            self.db_connection = \
+                sqlite3.connect(uri, uri=True, factory=factory)
+        else:
+            self.db_connection = \
+                sqlite3.connect(self.path_to_cache_db, factory=factory)
+
+    def check_writable(self):
+        """ Raise an exception if this cache was opened read-only. """
+        if self.read_only:
+            raise ConcordanceError(
+                f"Cache {self.path_to_cache_db} was opened read-only"
+            )
+
+    def close_connection(self):
+        """ Close the connection, if one is open, so that the next is new. """
+        if self.db_connection is not None:
+            self.db_connection.close()
+            self.db_connection = None
 
     def commit_and_close(self):
         """ Commit all transactions and close the connection. """
         self.db_connection.commit()
-        self.db_connection.close()
+        self.close_connection()
 
     def create_database(self):
         """ Run the create-drop script. """
@@ -102,26 +245,53 @@ class Concordance:
     def set_cyprian_new_years(self):
         """ Ronseal. """
         self.last_cyprian_new_year = \
-            get_cyprian_new_year(self.whole_greg_year-1)
-        self.this_cyprian_new_year = get_cyprian_new_year(self.whole_greg_year)
+            get_cyprian_new_year(self.whole_greg_year-1, self.zone)
+        self.this_cyprian_new_year = \
+            get_cyprian_new_year(self.whole_greg_year, self.zone)
 
     def walk_through(self):
         """
         Go through each day of the Gregorian year, assigning an equivalent
         Cyprian date to each.
         """
-        greg_date = self.last_cyprian_new_year
-        cyprian_date = CyprianDate(self.whole_cyprian_year-1, 1, 1)
+        self.first_greg = self.last_cyprian_new_year
+        self.first_cyprian_year = self.whole_cyprian_year-1
+        greg_date = self.first_greg
+        cyprian_date = CyprianDate(self.first_cyprian_year, 1, 1)
         while cyprian_date.year <= self.whole_cyprian_year:
+            greg_date, cyprian_date = self.walk(greg_date, cyprian_date)
+
+    @profile_phase("walk")
+    def walk(
+        self,
+        greg_date: datetime,
+        cyprian_date: CyprianDate
+    ) -> tuple[datetime, CyprianDate]:
+        """
+        Go through each day of the Cyprian year beginning on the given day,
+        returning (and recording) the first day of the following year.
+        """
+        cyprian_date = CyprianDate(
+            cyprian_date.year, cyprian_date.month, cyprian_date.day
+        )
+        year = cyprian_date.year
+        while cyprian_date.year == year:
             self.write_dates(greg_date, cyprian_date)
-            cyprian_date.advance_one_day(greg_date)
+            if cyprian_date.day == 1:
+                self.write_month_start(greg_date, cyprian_date)
+            cyprian_date.advance_one_day(greg_date, self.zone)
             greg_date += timedelta(days=1)
+        self.write_month_start(greg_date, cyprian_date)
+        self.write_checksum(year)
+        self.cursor_greg = greg_date
+        self.cursor_cyprian = cyprian_date
+        return greg_date, cyprian_date
 
     def write_dates(self, greg_date: datetime, cyprian_date: CyprianDate):
         """ Write the corresponding dates to the database. """
         cursor = self.db_connection.cursor()
         query = (
-            "INSERT INTO Equivalence "+
+            "INSERT OR REPLACE INTO Equivalence "+
             "(greg_year, greg_month, greg_day, "+
             "cyprian_year, cyprian_month, cyprian_day) "+
             "VALUES (?, ?, ?, ?, ?, ?);"
@@ -134,23 +304,87 @@ class Concordance:
             )
         )
 
+    def write_month_start(self, greg_date: datetime, cyprian_date: CyprianDate):
+        """ Record that a given Cyprian month begins on a given day. """
+        cursor = self.db_connection.cursor()
+        query = (
+            "INSERT OR REPLACE INTO MonthStart "+
+            "(cyprian_year, cyprian_month, greg_year, greg_month, greg_day) "+
+            "VALUES (?, ?, ?, ?, ?);"
+        )
+        cursor.execute(
+            query,
+            (
+                cyprian_date.year, cyprian_date.month,
+                greg_date.year, greg_date.month, greg_date.day
+            )
+        )
+
+    def read_year_rows(self, cyprian_year: int) -> list[tuple[int, ...]]:
+        """ Read the rows for a given Cyprian year, in Gregorian order. """
+        cursor = self.db_connection.cursor()
+        query = (
+            "SELECT greg_year, greg_month, greg_day, "+
+            "cyprian_month, cyprian_day "+
+            "FROM Equivalence "+
+            "WHERE cyprian_year = ? "+
+            "ORDER BY greg_year, greg_month, greg_day;"
+        )
+        cursor.execute(query, (cyprian_year,))
+        return cursor.fetchall()
+
+    def compute_checksum(self, cyprian_year: int) -> str:
+        """ Compute a checksum of the rows held for a given Cyprian year. """
+        hasher = hashlib.sha256(str(cyprian_year).encode())
+        for row in self.read_year_rows(cyprian_year):
+            hasher.update(repr(row).encode())
+        return hasher.hexdigest()
+
+    def write_checksum(self, cyprian_year: int):
+        """ Record the checksum of a given Cyprian year's rows. """
+        cursor = self.db_connection.cursor()
+        query = (
+            "INSERT OR REPLACE INTO YearChecksum (cyprian_year, checksum) "+
+            "VALUES (?, ?);"
+        )
+        checksum = self.compute_checksum(cyprian_year)
+        cursor.execute(query, (cyprian_year, checksum))
+
+    def read_checksum(self, cyprian_year: int) -> str|None:
+        """ Read the recorded checksum of a given Cyprian year, if any. """
+        cursor = self.db_connection.cursor()
+        query = "SELECT checksum FROM YearChecksum WHERE cyprian_year = ?;"
+        cursor.execute(query, (cyprian_year,))
+        extract = cursor.fetchall()
+        if not extract:
+            return None
+        return extract[0][0]
+
     def write_ephemeral(self, key: str, val: int|str|None):
         """ Write a given ephemeral data point to the database. """
         cursor = self.db_connection.cursor()
-        query = "INSERT INTO Ephemeral (key, val) VALUES (?, ?);"
+        query = "INSERT OR REPLACE INTO Ephemeral (key, val) VALUES (?, ?);"
         cursor.execute(query, (key, val))
 
+    @profile_phase("write_ephemerals")
     def write_ephemerals(self):
         """ Write all the ephemerals to the database. """
         ephemerals = (
             ("whole_greg_year", self.whole_greg_year),
             ("whole_cyprian_year", self.whole_cyprian_year),
             ("vernal_equinox", self.this_vernal_equinox.isoformat()),
-            ("cyprian_new_year", self.this_cyprian_new_year.isoformat())
+            ("cyprian_new_year", self.this_cyprian_new_year.isoformat()),
+            ("first_greg", self.first_greg.isoformat()),
+            ("first_cyprian_year", self.first_cyprian_year),
+            ("cursor_greg", self.cursor_greg.isoformat()),
+            ("cursor_cyprian_year", self.cursor_cyprian.year),
+            ("cursor_cyprian_month", self.cursor_cyprian.month),
+            ("cursor_cyprian_day", self.cursor_cyprian.day)
         )
         for pair in ephemerals:
             self.write_ephemeral(*pair)
 
+    @profile_phase("convert_greg")
     def convert_greg(
         self,
         greg: datetime = None,
@@ -159,9 +393,8 @@ class Concordance:
         """ Convert a given Gregorian date into its Cyprian equivalent. """
         if greg is None:
             greg = datetime.now(timezone.utc)
-        if force_write_first or self.should_write_first(greg=greg):
-            self.write(new_greg_year=greg.year)
-        self.establish_connection()
+        greg = round_down_to_nearest_day(greg, self.zone)
+        self.prepare(greg=greg, force_write_first=force_write_first)
         return self.read_equivalent_cyprian(greg)
 
     def should_write_first(
@@ -169,18 +402,55 @@ class Concordance:
         greg: datetime = None,
         cyprian: CyprianDate = None
     ) -> bool:
-        """ Decide whether we need to (re)write the cache first. """
+        """
+        Decide whether we need to (re)write the cache first, i.e. whether the
+        cache is missing, or else the date falls before it or too far after it
+        for extending it to be worthwhile.
+        """
         try:
             self.establish_connection()
-            cache_greg_year = self.get_ephemeral("whole_greg_year")
-            cache_cyprian_year = self.get_ephemeral("whole_cyprian_year")
+            span = self.read_span()
         except (sqlite3.OperationalError, ConcordanceError):
             return True
-        if greg and greg.year == cache_greg_year:
-            return False
-        if cyprian and cyprian.year == cache_cyprian_year:
-            return False
-        return True
+        if greg:
+            if round_down_to_nearest_day(greg, self.zone) < span.first_greg:
+                return True
+            cyprian_year = get_cyprian_year_beginning_with_greg_year(greg.year)
+        else:
+            if cyprian.year < span.first_cyprian_year:
+                return True
+            cyprian_year = cyprian.year
+        if cyprian_year-span.cursor_cyprian.year >= MAX_EXTENSION_YEARS:
+            return True
+        return False
+
+    def should_extend_first(
+        self,
+        greg: datetime = None,
+        cyprian: CyprianDate = None
+    ) -> bool:
+        """ Decide whether the date falls after the end of the cache. """
+        self.establish_connection()
+        span = self.read_span()
+        if greg:
+            greg = round_down_to_nearest_day(greg, self.zone)
+            return greg >= span.cursor_greg
+        return cyprian.year >= span.cursor_cyprian.year
+
+    def read_span(self) -> "CacheSpan":
+        """ Read which days the cache covers. """
+        result = \
+            CacheSpan(
+                self.get_ephemeral("first_greg").astimezone(self.zone),
+                self.get_ephemeral("first_cyprian_year"),
+                self.get_ephemeral("cursor_greg").astimezone(self.zone),
+                CyprianDate(
+                    self.get_ephemeral("cursor_cyprian_year"),
+                    self.get_ephemeral("cursor_cyprian_month"),
+                    self.get_ephemeral("cursor_cyprian_day")
+                )
+            )
+        return result
 
     def get_ephemeral(self, key: str) -> int|str|datetime|None:
         """ Ronseal. """
@@ -217,15 +487,14 @@ class Concordance:
         result = CyprianDate(*constructor_args)
         return result
 
+    @profile_phase("convert_cyprian")
     def convert_cyprian(
         self,
         cyprian: CyprianDate,
         force_write_first: bool = False
     ) -> datetime:
         """ Convert a given Cyprian date into its Gregorian equivalent. """
-        if force_write_first or self.should_write_first(cyprian=cyprian):
-            self.write(new_cyprian_year=cyprian.year)
-        self.establish_connection()
+        self.prepare(cyprian=cyprian, force_write_first=force_write_first)
         return self.read_equivalent_greg(cyprian)
 
     def read_equivalent_greg(self, cyprian: CyprianDate) -> datetime:
@@ -243,12 +512,214 @@ class Concordance:
                 f"Expected to fetch 1 item, but fetched {len(extract)}"
             )
         constructor_args = extract[0]
-        result = datetime(*constructor_args, tzinfo=timezone.utc)
+        result = datetime(*constructor_args, tzinfo=self.zone)
+        return result
+
+    def prepare_span(
+        self,
+        first: datetime|CyprianDate,
+        last: datetime|CyprianDate
+    ):
+        """
+        Make sure that the cache covers every day from the first to the last,
+        extending it as far as need be, even beyond the size limit.
+        """
+        key = "greg" if isinstance(first, datetime) else "cyprian"
+        self.prepare(**{ key: first })
+        if self.read_only:
+            self.prepare(**{ key: last })
+        elif self.should_extend_first(**{ key: last }):
+            self.extend(**{ key: last })
+            self.establish_connection()
+
+    def days_in_cyprian_month(self, year: int, month: int) -> "DaySpan":
+        """ Get every day of a given Cyprian month in one query. """
+        self.prepare(cyprian=CyprianDate(year, month, 1))
+        query = (
+            "SELECT greg_year, greg_month, greg_day, "+
+            "cyprian_year, cyprian_month, cyprian_day "+
+            "FROM Equivalence "+
+            "WHERE cyprian_year = ? AND cyprian_month = ? "+
+            "ORDER BY cyprian_day;"
+        )
+        result = self.read_day_span(query, (year, month))
+        if not result:
+            raise ConcordanceError(f"No such month: {month} of year {year}")
+        return result
+
+    def cyprian_span(
+        self,
+        greg_start: datetime,
+        greg_end: datetime
+    ) -> "DaySpan":
+        """
+        Get every day from one Gregorian date (inclusive) to another
+        (exclusive) in one query.
+        """
+        greg_start = round_down_to_nearest_day(greg_start, self.zone)
+        greg_end = round_down_to_nearest_day(greg_end, self.zone)
+        if greg_end <= greg_start:
+            return DaySpan(None, ())
+        self.prepare_span(greg_start, greg_end-timedelta(days=1))
+        query = (
+            "SELECT greg_year, greg_month, greg_day, "+
+            "cyprian_year, cyprian_month, cyprian_day "+
+            "FROM Equivalence "+
+            "WHERE (greg_year, greg_month, greg_day) >= (?, ?, ?) "+
+            "AND (greg_year, greg_month, greg_day) < (?, ?, ?) "+
+            "ORDER BY greg_year, greg_month, greg_day;"
+        )
+        parameters = (
+            greg_start.year, greg_start.month, greg_start.day,
+            greg_end.year, greg_end.month, greg_end.day
+        )
+        return self.read_day_span(query, parameters)
+
+    def greg_span(
+        self,
+        cyprian_start: CyprianDate,
+        cyprian_end: CyprianDate
+    ) -> "DaySpan":
+        """
+        Get every day from one Cyprian date (inclusive) to another (exclusive)
+        in one query.
+        """
+        self.prepare_span(cyprian_start, cyprian_end)
+        query = (
+            "SELECT greg_year, greg_month, greg_day, "+
+            "cyprian_year, cyprian_month, cyprian_day "+
+            "FROM Equivalence "+
+            "WHERE (cyprian_year, cyprian_month, cyprian_day) >= (?, ?, ?) "+
+            "AND (cyprian_year, cyprian_month, cyprian_day) < (?, ?, ?) "+
+            "ORDER BY cyprian_year, cyprian_month, cyprian_day;"
+        )
+        parameters = (
+            cyprian_start.year, cyprian_start.month, cyprian_start.day,
+            cyprian_end.year, cyprian_end.month, cyprian_end.day
+        )
+        return self.read_day_span(query, parameters)
+
+    def read_day_span(self, query: str, parameters: tuple) -> "DaySpan":
+        """
+        Run a query for a run of consecutive days, and pack its results,
+        i.e. (greg_year, greg_month, greg_day, cyprian_year, cyprian_month,
+        cyprian_day) rows, into a DaySpan.
+        """
+        cursor = self.db_connection.cursor()
+        cursor.execute(query, parameters)
+        rows = cursor.fetchall()
+        if not rows:
+            return DaySpan(None, ())
+        greg_start = datetime(*rows[0][:3], tzinfo=self.zone)
+        result = DaySpan(greg_start, tuple(row[3:] for row in rows))
+        return result
+
+    def get_year_structure(
+        self,
+        cyprian_year: int,
+        force_write_first: bool = False
+    ) -> YearStructure:
+        """ Get the month-by-month structure of a given Cyprian year. """
+        cyprian = CyprianDate(cyprian_year, 1, 1)
+        self.prepare(cyprian=cyprian, force_write_first=force_write_first)
+        return self.read_year_structure(cyprian_year)
+
+    def read_year_structure(self, cyprian_year: int) -> YearStructure:
+        """ Read the structure of a given year from the cache. """
+        cursor = self.db_connection.cursor()
+        query = (
+            "SELECT greg_year, greg_month, greg_day "+
+            "FROM MonthStart "+
+            "WHERE cyprian_year = ? ORDER BY cyprian_month;"
+        )
+        cursor.execute(query, (cyprian_year,))
+        month_starts = tuple(
+            datetime(*row, tzinfo=self.zone) for row in cursor.fetchall()
+        )
+        cursor.execute(query, (cyprian_year+1,))
+        next_year_extract = cursor.fetchall()
+        if not month_starts or not next_year_extract:
+            raise ConcordanceError(
+                f"No structure cached for year {cyprian_year}"
+            )
+        next_year_start = datetime(*next_year_extract[0], tzinfo=self.zone)
+        result = YearStructure(
+            cyprian_year, month_starts, next_year_start, self.zone
+        )
         return result
 
 ##################
 # HELPER CLASSES #
 ##################
 
+@dataclass(frozen=True)
+class CacheSpan:
+    """
+    The days which the cache covers, i.e. from the first (inclusive) up to the
+    cursor (exclusive), which is where any extension would resume.
+    """
+    first_greg: datetime
+    first_cyprian_year: int
+    cursor_greg: datetime
+    cursor_cyprian: CyprianDate
+
+@dataclass(frozen=True)
+class DaySpan(Sequence):
+    """
+    A run of consecutive days, held compactly as the first Gregorian date and
+    the Cyprian (year, month, day) of each day, which, when indexed, gives
+    the Gregorian and Cyprian dates of a given day.
+    """
+    greg_start: datetime|None
+    cyprian_days: tuple[tuple[int, int, int], ...]
+
+    def __len__(self) -> int:
+        return len(self.cyprian_days)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, _, step = index.indices(len(self))
+            if step != 1:
+                raise ConcordanceError("A span's days must be consecutive")
+            cyprian_days = self.cyprian_days[index]
+            if not cyprian_days:
+                return DaySpan(None, ())
+            return DaySpan(self.greg_start+timedelta(days=start), cyprian_days)
+        cyprian_day = self.cyprian_days[index]
+        if index < 0:
+            index += len(self)
+        greg = self.greg_start+timedelta(days=index)
+        return greg, CyprianDate(*cyprian_day)
+
+    @property
+    def gregs(self) -> list[datetime]:
+        """ Get the Gregorian date of each day. """
+        return [
+            self.greg_start+timedelta(days=index) for index in range(len(self))
+        ]
+
+    @property
+    def cyprians(self) -> list[CyprianDate]:
+        """ Get the Cyprian date of each day. """
+        return [CyprianDate(*cyprian_day) for cyprian_day in self.cyprian_days]
+
 class ConcordanceError(Exception):
     """ A custom exception. """
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def get_path_to_zone_cache_db(path_to_cache_db: str, zone: tzinfo) -> str:
+    """
+    Get the path to the cache for a given zone, i.e. the path given for UTC,
+    and that path with the zone's name inserted before the suffix otherwise.
+    """
+    zone_name = str(zone)
+    if zone_name == DEFAULT_ZONE_NAME:
+        return path_to_cache_db
+    path_obj = Path(path_to_cache_db)
+    safe_zone_name = re.sub(r"[^A-Za-z0-9]+", "_", zone_name)
+    result = \
+        path_obj.with_name(f"{path_obj.stem}.{safe_zone_name}{path_obj.suffix}")
+    return str(result)
@@ -48,3 +48,15 @@ SHORT_MONTH_NAMES_LATIN = (
     "Int"
 )
 MONTH_NAMES = SHORT_MONTH_NAMES_LATIN
+MONTH_NUMBERS_LATIN = {
+    name: number
+    for number, name in enumerate(MONTH_NAMES_LATIN) if name
+}
+SHORT_MONTH_NUMBERS_LATIN = {
+    name: number
+    for number, name in enumerate(SHORT_MONTH_NAMES_LATIN) if name
+}
+MONTH_NUMBERS = SHORT_MONTH_NUMBERS_LATIN
+
+# Formatting.
+DEFAULT_FORMAT = "%d %b %Y"
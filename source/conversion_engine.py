@@ -0,0 +1,109 @@
+"""
+This code defines a conversion engine which may be shared by any number of
+threads, e.g. those of a ThreadPoolExecutor.
+
+Unlike Concordance, which keeps a connection and other mutable state on the
+instance, the engine holds only a dict mapping each Cyprian year to its
+YearStructure, which is frozen once built. Lookups therefore read shared,
+immutable structures without taking any lock. Only building a year takes a
+lock, and then only that year's, so that each year is built once while other
+years are built, and other lookups served, in parallel. Nothing here relies on
+the GIL, so the engine also scales on free-threaded builds of CPython.
+"""
+
+# Standard imports.
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone, tzinfo
+from threading import Lock
+from typing import Iterable
+
+# Local imports.
+from .cyprian_date import (
+    CyprianDate,
+    get_cyprian_year_beginning_with_greg_year,
+    round_down_to_nearest_day
+)
+from .year_structure import YearStructure, compute_year_structure
+
+# Local constants.
+ENGINES: dict[tzinfo, "ConversionEngine"] = {}
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class ConversionEngine:
+    """ The class in question. """
+    zone: tzinfo = timezone.utc
+    year_structures: dict[int, YearStructure] = \
+        field(init=False, default_factory=dict)
+    year_locks: dict[int, Lock] = field(init=False, default_factory=dict)
+
+    def get_year_structure(self, cyprian_year: int) -> YearStructure:
+        """
+        Get the structure of a given year, building it, under that year's lock,
+        only if no other thread has done so already.
+        """
+        result = self.year_structures.get(cyprian_year)
+        if result is not None:
+            return result
+        # Setting a default is atomic, so only one lock wins for each year.
+        year_lock = self.year_locks.setdefault(cyprian_year, Lock())
+        with year_lock:
+            result = self.year_structures.get(cyprian_year)
+            if result is None:
+                result = compute_year_structure(cyprian_year, self.zone)
+                self.year_structures[cyprian_year] = result
+        return result
+
+    def find_year_structure(self, greg: datetime) -> YearStructure:
+        """ Get the structure of the year in which a given day falls. """
+        cyprian_year = get_cyprian_year_beginning_with_greg_year(greg.year)
+        result = self.get_year_structure(cyprian_year)
+        if greg < result.start:
+            result = self.get_year_structure(cyprian_year-1)
+        return result
+
+    def convert_greg(self, greg: datetime) -> CyprianDate:
+        """
+        Get the Cyprian date on which a given instant falls, in this engine's
+        zone. Naive datetimes are taken to be in that zone already.
+        """
+        greg = round_down_to_nearest_day(greg, self.zone)
+        year_structure = self.find_year_structure(greg)
+        month, day = year_structure.locate(greg)
+        result = CyprianDate(year_structure.year, month, day)
+        return result
+
+    def convert_cyprian(self, cyprian: CyprianDate) -> datetime:
+        """ Get midnight, in this engine's zone, on a given Cyprian date. """
+        year_structure = self.get_year_structure(cyprian.year)
+        if not year_structure.is_valid_date(cyprian.month, cyprian.day):
+            raise ConversionEngineError(f"No such date: {cyprian}")
+        result = \
+            year_structure.get_month_start(cyprian.month)+\
+            timedelta(days=cyprian.day-1)
+        return result
+
+    def convert_many(self, gregs: Iterable[datetime]) -> list[CyprianDate]:
+        """ Ronseal. """
+        return [self.convert_greg(greg) for greg in gregs]
+
+##################
+# HELPER CLASSES #
+##################
+
+class ConversionEngineError(Exception):
+    """ A custom exception. """
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def get_engine(zone: tzinfo = timezone.utc) -> ConversionEngine:
+    """ Get the engine shared by every thread for a given zone. """
+    result = ENGINES.get(zone)
+    if result is None:
+        result = ENGINES.setdefault(zone, ConversionEngine(zone))
+    return result
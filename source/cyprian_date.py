@@ -3,15 +3,39 @@ This code defines a class which holds a Cyprian date.
 """
 
 # Standard imports.
+import re
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Self
-
-# Non-standard imports.
-import ephem
+from datetime import datetime, timezone, tzinfo
+from typing import Iterable, Self
 
 # Local imports.
 from . import constants
+from .cyprian_format import compile_format
+from .lunation import (
+    new_moon_tomorrow,
+    get_next_new_moon,
+    to_datetime,
+    fall_on_same_day,
+    round_down_to_nearest_day,
+    get_vernal_equinox,
+    tomorrow_is_on_or_after_vernal_equinox,
+    get_cyprian_new_year,
+    get_cyprian_year_beginning_with_greg_year,
+    get_greg_year_ending_with_cyprian_year,
+    get_zone
+)
+from .year_structure import compute_year_structure
+
+# Local constants.
+DAY_FORMAT = compile_format("%d")
+MONTH_FORMAT = compile_format("%b")
+HTML_FORMAT = compile_format(
+    f'%d %b <span class="frak">{constants.YEAR_INITIAL}</span><sub>%y</sub>'
+)
+LATEX_FORMAT = \
+    compile_format(f"%d %b $\\mathfrak{{{constants.YEAR_INITIAL}}}_{{%y}}$")
+# Only the first two hyphens separate; any third is a negative year's sign.
+FROM_STR_SEPARATOR_REGEX = re.compile(r"^(\d+)-(\w+)-")
 
 ##############
 # MAIN CLASS #
@@ -25,39 +49,48 @@ class CyprianDate:
     day: int
 
     def __str__(self) -> str:
-        month_str = self.get_month_str()
-        day_str = self.get_day_str()
-        year_str = f"{constants.YEAR_INITIAL}{self.year}"
-        result = f"{day_str} {month_str} {year_str}"
-        return result
+        return self.strftime(constants.DEFAULT_FORMAT)
 
     def get_day_str(self) -> str:
         """ Get a two-digit representation of the day. """
-        result = str(self.day)
-        if len(result) == 1:
-            result = "0"+result
-        return result
+        return DAY_FORMAT.format(self.year, self.month, self.day)
 
     def get_month_str(self) -> str:
         """ Get a three-letter representation of the month. """
-        month_name = constants.MONTH_NAMES[self.month]
-        result = month_name[:3]
-        return result
-
-    def advance_one_day(self, current_greg: datetime):
-        """ Find the next day in the calendar. """
-        if new_moon_tomorrow(current_greg):
-            self.advance_one_month(current_greg)
+        return MONTH_FORMAT.format(self.year, self.month, self.day)
+
+    def strftime(self, pattern: str) -> str:
+        """ Render this date according to a given pattern. """
+        cyprian_format = compile_format(pattern)
+        return cyprian_format.format(self.year, self.month, self.day)
+
+    def is_valid(self) -> bool:
+        """ Determine whether this date actually exists in the calendar. """
+        year_structure = compute_year_structure(self.year)
+        return year_structure.is_valid_date(self.month, self.day)
+
+    def advance_one_day(
+        self,
+        current_greg: datetime,
+        zone: tzinfo = timezone.utc
+    ):
+        """ Find the next day in the calendar, as reckoned in a given zone. """
+        if new_moon_tomorrow(current_greg, zone):
+            self.advance_one_month(current_greg, zone)
         else:
             self.day += 1
 
-    def advance_one_month(self, current_greg: datetime):
+    def advance_one_month(
+        self,
+        current_greg: datetime,
+        zone: tzinfo = timezone.utc
+    ):
         """ Ronseal. """
         if self.month == constants.LEAP_MONTH:
             self.advance_one_year()
         elif (
             self.month == constants.LAST_MONTH and
-            tomorrow_is_on_or_after_vernal_equinox(current_greg)
+            tomorrow_is_on_or_after_vernal_equinox(current_greg, zone)
         ):
             self.advance_one_year()
         else:
@@ -83,103 +116,73 @@ class CyprianDate:
 
     def to_html(self) -> str:
         """ Ronseal. """
-        year_str = (
-            f'<span class="frak">{constants.YEAR_INITIAL}</span>'+
-            f"<sub>{self.year}</sub>"
-        )
-        result = f"{self.get_day_str()} {self.get_month_str()} {year_str}"
-        return result
+        return HTML_FORMAT.format(self.year, self.month, self.day)
 
     def to_latex(self) -> str:
         """ Ronseal. """
-        year_str = (
-            "$\\mathfrak{"+
-            constants.YEAR_INITIAL+
-            "}_{"+
-            str(self.year)+
-            "}$"
-        )
-        result = f"{self.get_day_str()} {self.get_month_str()} {year_str}"
+        return LATEX_FORMAT.format(self.year, self.month, self.day)
+
+    def __reduce__(self) -> tuple:
+        # Pickle the fields positionally, rather than as a dict of names.
+        return (type(self), (self.year, self.month, self.day))
+
+    @classmethod
+    def strptime(
+        cls,
+        string: str,
+        pattern: str = constants.DEFAULT_FORMAT,
+        validate: bool = True
+    ) -> Self:
+        """ Create an instance of this class from a string and a pattern. """
+        cyprian_format = compile_format(pattern)
+        result = cls(*cyprian_format.parse(string))
+        if validate and not result.is_valid():
+            raise CyprianDateError(f"No such date: {string}")
         return result
 
     @classmethod
     def from_str(cls, init_str: str) -> Self:
         """
         Create an instance of this class from a string.
-        Expected format is DD MMM TY.
+        Expected format is DD MMM TY, or DD-MMM-TY.
         """
-        day_str = init_str[0:2]
-        month_str = init_str[3:6]
-        year_str = init_str[7:]
-        init_day = int(day_str)
-        init_month = constants.MONTH_NAMES.index(month_str)
-        init_year = int(year_str[1:])
-        result = cls(init_day, init_month, init_year)
-        return result
+        init_str = FROM_STR_SEPARATOR_REGEX.sub(r"\1 \2 ", init_str)
+        return cls.strptime(init_str)
+
+##################
+# HELPER CLASSES #
+##################
+
+class CyprianDateError(Exception):
+    """ A custom exception. """
 
 ####################
 # HELPER FUNCTIONS #
 ####################
 
-def new_moon_tomorrow(greg: datetime) -> bool:
-    """ Determine whether the new moon occurs tomorrow. """
-    next_new_moon = get_next_new_moon(greg)
-    tomorrow = greg+timedelta(days=1)
-    return fall_on_same_day(next_new_moon, tomorrow)
-
-def get_next_new_moon(greg: datetime) -> datetime:
-    """ Get the Gregorian datetime for the next new moon. """
-    ephem_date = ephem.next_new_moon(greg)
-    result = to_datetime(ephem_date)
-    return result
-
-def to_datetime(ephem_date: ephem.Date) -> datetime:
-    """ Convert an ephem date object into a timezone-aware datetime object. """
-    result = ephem_date.datetime()
-    result = result.replace(tzinfo=timezone.utc)
-    return result
-
-def fall_on_same_day(left: datetime, right: datetime) -> bool:
-    """ Determine whether two events occur on the same calendar day. """
-    if round_down_to_nearest_day(left) == round_down_to_nearest_day(right):
-        return True
-    return False
-
-def round_down_to_nearest_day(greg: datetime) -> datetime:
-    """ Ronseal. """
-    result = datetime(greg.year, greg.month, greg.day, tzinfo=timezone.utc)
-    return result
-
-def get_vernal_equinox(year: int) -> datetime:
-    """ Ronseal. """
-    ephem_date = ephem.next_vernal_equinox(str(year))
-    result = to_datetime(ephem_date)
-    return result
-
-def tomorrow_is_on_or_after_vernal_equinox(greg: datetime) -> bool:
-    """ Ronseal. """
-    tomorrow = greg+timedelta(days=1)
-    rounded_equinox = round_down_to_nearest_day(get_vernal_equinox(greg.year))
-    if tomorrow >= rounded_equinox:
-        return True
-    return False
-
-def get_cyprian_new_year(year: int) -> datetime:
-    """
-    Given the Gregorian year, calculate the Gregorian equivalent of the Cyprian
-    New Year falling within that calendar year.
-    """
-    ephem_date = ephem.next_new_moon(get_vernal_equinox(year))
-    unrounded = to_datetime(ephem_date)
-    result = round_down_to_nearest_day(unrounded)
-    return result
-
-def get_cyprian_year_beginning_with_greg_year(greg_year: int) -> int:
-    """ Get the Cyprian year which begins with the given Gregorian year. """
-    result = greg_year-constants.CYPRIAN_GREGORIAN_YEAR_DIFF
+def format_cyprian_dates(
+    cyprian_dates: Iterable[CyprianDate],
+    pattern: str = constants.DEFAULT_FORMAT
+) -> list[str]:
+    """ Render many Cyprian dates, compiling the pattern only once. """
+    cyprian_format = compile_format(pattern)
+    result = [
+        cyprian_format.format(date.year, date.month, date.day)
+        for date in cyprian_dates
+    ]
     return result
 
-def get_greg_year_ending_with_cyprian_year(cyprian_year: int) -> int:
-    """ Get the Gregorian year which ends with the given Cyprian year. """
-    result = cyprian_year+constants.CYPRIAN_GREGORIAN_YEAR_DIFF
+def parse_cyprian_dates(
+    strings: Iterable[str],
+    pattern: str = constants.DEFAULT_FORMAT,
+    validate: bool = True
+) -> list[CyprianDate]:
+    """ Parse many Cyprian date strings, compiling the pattern only once. """
+    cyprian_format = compile_format(pattern)
+    result = []
+    for string in strings:
+        cyprian_date = CyprianDate(*cyprian_format.parse(string))
+        if validate and not cyprian_date.is_valid():
+            raise CyprianDateError(f"No such date: {string}")
+        result.append(cyprian_date)
     return result
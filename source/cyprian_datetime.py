@@ -4,13 +4,23 @@ This code defines the extension of the standard datetime class.
 
 # Standard imports.
 import json
-from datetime import datetime
-from typing import Self
+import struct
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Iterable, Self
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Local imports.
 from .cyprian_date import CyprianDate
 from .frontend_utils import convert_date
 
+# Local constants.
+BATCH_MAGIC = b"CYDT2"
+BATCH_HEADER = struct.Struct("<5sI")  # Magic, then length of zones' JSON.
+# Wall time in microseconds since 1 Jan 1, zone index (-1 if naive), fold,
+# then Cyprian year, month and day.
+BATCH_RECORD = struct.Struct("<qhBiBB")
+MIN_DATETIME = datetime.min
+
 ##############
 # MAIN CLASS #
 ##############
@@ -22,6 +32,34 @@ class CyprianDateTime(datetime):
         self._cyprian = convert_date(self)
         return self
 
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        # Carry the Cyprian date, so that unpickling needn't convert again.
+        _, state = super().__reduce_ex__(protocol)
+        cyprian = self._cyprian
+        result = (
+            restore_cyprian_datetime,
+            (type(self), state, cyprian.year, cyprian.month, cyprian.day)
+        )
+        return result
+
+    def replace(self, *args, **kwargs) -> Self:
+        # The standard replace builds the new instance without calling
+        # __new__, so rebuild it here, to convert the new date.
+        greg = super().replace(*args, **kwargs)
+        result = \
+            type(self)(
+                greg.year,
+                greg.month,
+                greg.day,
+                greg.hour,
+                greg.minute,
+                greg.second,
+                greg.microsecond,
+                greg.tzinfo,
+                fold=greg.fold
+            )
+        return result
+
     def __str__(self) -> str:
         greg_str = super().__str__()
         cyprian_str = str(self.cyprian)
@@ -45,14 +83,46 @@ class CyprianDateTime(datetime):
     @property
     def cyprian(self) -> CyprianDate:
         """ The Cyprian equivalent to the current date. """
-        self._cyprian = convert_date(self)  # Synchronise on each lookup.
-        return self._cyprian
+        # Every new instance, including the result of any arithmetic, passes
+        # through __new__, replace, from_known_dates or
+        # restore_cyprian_datetime, so this is never stale.
+        cyprian = self._cyprian
+        return CyprianDate(cyprian.year, cyprian.month, cyprian.day)
+
+    @classmethod
+    def from_cyprian(
+        cls,
+        cyprian: CyprianDate,
+        zone: tzinfo|None = None
+    ) -> Self:
+        """
+        Construct an instance of this class from a CyprianDate object, naive
+        unless a zone is given, in which case it will be midnight there.
+        """
+        greg = convert_date(cyprian, zone or timezone.utc)
+        result = cls(greg.year, greg.month, greg.day, tzinfo=zone)
+        return result
 
     @classmethod
-    def from_cyprian(cls, cyprian: CyprianDate) -> Self:
-        """ Construct an instance of this class from a CyprianDate object. """
-        greg = convert_date(cyprian)
-        result = cls(greg.year, greg.month, greg.day)
+    def from_known_dates(cls, greg: datetime, cyprian: CyprianDate) -> Self:
+        """
+        Construct an instance of this class from a datetime and the Cyprian
+        date already known to fall on it, without converting again.
+        """
+        result = \
+            datetime.__new__(
+                cls,
+                greg.year,
+                greg.month,
+                greg.day,
+                greg.hour,
+                greg.minute,
+                greg.second,
+                greg.microsecond,
+                greg.tzinfo,
+                fold=greg.fold
+            )
+        result._cyprian = CyprianDate(cyprian.year, cyprian.month, cyprian.day)
         return result
 
     @classmethod
@@ -64,6 +134,13 @@ class CyprianDateTime(datetime):
         cyprian = CyprianDate.from_str(cyprian_str)
         return cls.from_cyprian(cyprian)
 
+##################
+# HELPER CLASSES #
+##################
+
+class CyprianDateTimeError(Exception):
+    """ A custom exception. """
+
 ####################
 # HELPER FUNCTIONS #
 ####################
@@ -72,3 +149,135 @@ def correct_weekday(datetime_weekday: int) -> int:
     """ Adjust to system in which Sunday is the first day of the week. """
     result = (datetime_weekday+1)%7
     return result
+
+def restore_cyprian_datetime(
+    cls: type[CyprianDateTime],
+    state: tuple,
+    cyprian_year: int,
+    cyprian_month: int,
+    cyprian_day: int
+) -> CyprianDateTime:
+    """
+    Rebuild a pickled instance from datetime's own state and the Cyprian date
+    it carried, without converting anything.
+    """
+    result = datetime.__new__(cls, *state)
+    result._cyprian = CyprianDate(cyprian_year, cyprian_month, cyprian_day)
+    return result
+
+def dump_cyprian_datetimes(
+    cyprian_datetimes: Iterable[CyprianDateTime]
+) -> bytes:
+    """
+    Pack many instances into a compact string of bytes, i.e. a fixed-size
+    record for each, plus each distinct zone described once, as data, so that
+    loading a batch never runs any code it carries.
+    """
+    zones = []
+    zone_indices = {}
+    records = []
+    for cyprian_datetime in cyprian_datetimes:
+        zone = cyprian_datetime.tzinfo
+        if zone is None:
+            zone_index = -1
+        else:
+            zone_index = zone_indices.get(zone)
+            if zone_index is None:
+                zone_index = zone_indices[zone] = len(zones)
+                zones.append(zone)
+        cyprian = cyprian_datetime._cyprian
+        records.append(
+            BATCH_RECORD.pack(
+                get_wall_microseconds(cyprian_datetime),
+                zone_index,
+                cyprian_datetime.fold,
+                cyprian.year,
+                cyprian.month,
+                cyprian.day
+            )
+        )
+    zones_json = \
+        json.dumps([describe_zone(zone) for zone in zones]).encode("utf-8")
+    result = \
+        BATCH_HEADER.pack(BATCH_MAGIC, len(zones_json))+\
+        zones_json+\
+        b"".join(records)
+    return result
+
+def describe_zone(zone: tzinfo) -> dict:
+    """
+    Describe a zone as data: an IANA zone by its key, or a fixed offset by its
+    length in microseconds and its name.
+    """
+    if isinstance(zone, ZoneInfo) and zone.key is not None:
+        return {"key": zone.key}
+    if isinstance(zone, timezone):
+        offset = zone.utcoffset(None)
+        result = {
+            "offset": offset//timedelta(microseconds=1),
+            "name": zone.tzname(None)
+        }
+        return result
+    raise CyprianDateTimeError(f"Can't represent zone in a batch: {zone!r}")
+
+def rebuild_zone(description: dict) -> tzinfo:
+    """ Rebuild a zone from what describe_zone made of it. """
+    try:
+        if "key" in description:
+            return ZoneInfo(description["key"])
+        offset = timedelta(microseconds=description["offset"])
+        return timezone(offset, description["name"])
+    except (KeyError, TypeError, ValueError, ZoneInfoNotFoundError) as error:
+        raise CyprianDateTimeError(f"Bad zone in batch: {description!r}") \
+            from error
+
+def get_wall_microseconds(greg: datetime) -> int:
+    """
+    Get the wall time of a given datetime, ignoring its zone, in microseconds
+    since 1 Jan 1, without making any new instance of a subclass.
+    """
+    result = (
+        (
+            (greg.toordinal()-1)*86400+
+            greg.hour*3600+
+            greg.minute*60+
+            greg.second
+        )*1000000+
+        greg.microsecond
+    )
+    return result
+
+def load_cyprian_datetimes(data: bytes) -> list[CyprianDateTime]:
+    """ Unpack what dump_cyprian_datetimes packed, converting nothing. """
+    if len(data) < BATCH_HEADER.size:
+        raise CyprianDateTimeError("Batch too short for its header")
+    magic, zones_length = BATCH_HEADER.unpack_from(data)
+    if magic != BATCH_MAGIC:
+        raise CyprianDateTimeError(f"Unrecognised batch format: {magic!r}")
+    offset = BATCH_HEADER.size+zones_length
+    if (len(data)-offset)%BATCH_RECORD.size:
+        raise CyprianDateTimeError("Batch truncated mid-record")
+    try:
+        descriptions = json.loads(data[BATCH_HEADER.size:offset])
+    except ValueError as error:
+        raise CyprianDateTimeError("Unreadable zones in batch") from error
+    if not isinstance(descriptions, list):
+        raise CyprianDateTimeError("Unreadable zones in batch")
+    zones = [rebuild_zone(description) for description in descriptions]
+    result = []
+    for micros, zone_index, fold, year, month, day in \
+        BATCH_RECORD.iter_unpack(data[offset:]):
+        if zone_index >= len(zones):
+            raise CyprianDateTimeError(f"No zone {zone_index} in batch")
+        wall = MIN_DATETIME+timedelta(microseconds=micros)
+        greg = \
+            wall.replace(
+                tzinfo=None if zone_index < 0 else zones[zone_index],
+                fold=fold
+            )
+        cyprian_datetime = \
+            CyprianDateTime.from_known_dates(
+                greg, CyprianDate(year, month, day)
+            )
+        result.append(cyprian_datetime)
+    return result
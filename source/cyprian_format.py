@@ -0,0 +1,149 @@
+"""
+This code defines a class which formats and parses Cyprian dates according to
+strftime-style patterns, e.g. "%d %b %Y" for "21 Dec T10".
+
+The supported directives are:
+    %d - the day, as a two-digit number;
+    %m - the month, as a two-digit number;
+    %b - the month, as a three-letter Latin abbreviation;
+    %B - the month, as its full Latin name;
+    %y - the year, as a plain number;
+    %Y - the year, with its initial, e.g. "T10";
+    %% - a literal percent sign.
+"""
+
+# Standard imports.
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from re import Pattern
+
+# Local imports.
+from . import constants
+
+# Local constants.
+DIRECTIVE_MARKER = "%"
+FORMAT_CACHE_SIZE = 64
+# Directive: (template field, regex, name of regex group).
+DIRECTIVES = {
+    "d": ("{2:02d}", r"(?P<day>\d{1,2})", "day"),
+    "m": ("{1:02d}", r"(?P<month>\d{1,2})", "month"),
+    "b": ("{3}", None, "short_month"),
+    "B": ("{4}", None, "long_month"),
+    "y": ("{0}", r"(?P<year>-?\d+)", "year"),
+    "Y": (
+        constants.YEAR_INITIAL+"{0}",
+        re.escape(constants.YEAR_INITIAL)+r"(?P<year>-?\d+)",
+        "year"
+    )
+}
+MONTH_NAME_REGEXES = {
+    "b": "(?P<short_month>"+"|".join(constants.SHORT_MONTH_NUMBERS_LATIN)+")",
+    "B": "(?P<long_month>"+"|".join(constants.MONTH_NUMBERS_LATIN)+")"
+}
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class CyprianFormat:
+    """ The class in question. """
+    pattern: str
+    template: str|None = field(init=False, default=None)
+    regex: Pattern|None = field(init=False, default=None)
+
+    def __post_init__(self):
+        self.compile()
+
+    def compile(self):
+        """ Turn the pattern into a str.format template and a regex. """
+        template_parts = []
+        regex_parts = []
+        groups = set()
+        index = 0
+        while index < len(self.pattern):
+            char = self.pattern[index]
+            if char != DIRECTIVE_MARKER:
+                template_parts.append(escape_for_template(char))
+                regex_parts.append(re.escape(char))
+                index += 1
+                continue
+            directive = self.pattern[index+1:index+2]
+            if directive == DIRECTIVE_MARKER:
+                template_parts.append(DIRECTIVE_MARKER)
+                regex_parts.append(re.escape(DIRECTIVE_MARKER))
+            elif directive in DIRECTIVES:
+                template_field, regex, group = DIRECTIVES[directive]
+                if group in groups:
+                    raise CyprianFormatError(
+                        f"Repeated field in pattern: {self.pattern}"
+                    )
+                groups.add(group)
+                template_parts.append(template_field)
+                regex_parts.append(regex or MONTH_NAME_REGEXES[directive])
+            else:
+                raise CyprianFormatError(
+                    f"Bad directive {DIRECTIVE_MARKER}{directive} in pattern: "+
+                    self.pattern
+                )
+            index += 2
+        self.template = "".join(template_parts)
+        self.regex = re.compile("".join(regex_parts))
+
+    def format(self, year: int, month: int, day: int) -> str:
+        """ Render the given fields according to this pattern. """
+        result = \
+            self.template.format(
+                year,
+                month,
+                day,
+                constants.SHORT_MONTH_NAMES_LATIN[month],
+                constants.MONTH_NAMES_LATIN[month]
+            )
+        return result
+
+    def parse(self, string: str) -> tuple[int, int, int]:
+        """ Extract the year, month and day from a string. """
+        match = self.regex.fullmatch(string)
+        if not match:
+            raise CyprianFormatError(
+                f"String {string} does not match pattern: {self.pattern}"
+            )
+        fields = match.groupdict()
+        if "year" not in fields:
+            raise CyprianFormatError(f"No year in pattern: {self.pattern}")
+        if "month" in fields:
+            month = int(fields["month"])
+        elif "short_month" in fields:
+            month = constants.SHORT_MONTH_NUMBERS_LATIN[fields["short_month"]]
+        elif "long_month" in fields:
+            month = constants.MONTH_NUMBERS_LATIN[fields["long_month"]]
+        else:
+            raise CyprianFormatError(f"No month in pattern: {self.pattern}")
+        if "day" not in fields:
+            raise CyprianFormatError(f"No day in pattern: {self.pattern}")
+        result = (int(fields["year"]), month, int(fields["day"]))
+        return result
+
+##################
+# HELPER CLASSES #
+##################
+
+class CyprianFormatError(Exception):
+    """ A custom exception. """
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def compile_format(pattern: str) -> CyprianFormat:
+    """ Compile a given pattern, reusing any previous compilation. """
+    return CyprianFormat(pattern)
+
+def escape_for_template(char: str) -> str:
+    """ Escape a literal character so that str.format leaves it alone. """
+    if char in "{}":
+        return char*2
+    return char
@@ -0,0 +1,65 @@
+"""
+This code defines a class which converts timestamps into Cyprian dates,
+remembering the last day it resolved, so that a stream of timestamps, sorted or
+nearly so, needs only one lookup per day rather than one per timestamp.
+"""
+
+# Standard imports.
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Iterable
+
+# Local imports.
+from .cache_config import CacheConfig
+from .concordance import Concordance
+from .cyprian_date import CyprianDate, round_down_to_nearest_day
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class DayBucketConverter:
+    """ The class in question. """
+    zone: tzinfo = timezone.utc
+    path_to_cache_db: str|None = None
+    config: CacheConfig|None = None
+    concordance: Concordance|None = field(init=False, default=None)
+    # (Start of day, start of next day, Cyprian date), held as one tuple so
+    # that it can be swapped atomically.
+    bucket: tuple[datetime, datetime, CyprianDate]|None = \
+        field(init=False, default=None)
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        self.concordance = \
+            Concordance(
+                path_to_cache_db=self.path_to_cache_db,
+                zone=self.zone,
+                config=self.config
+            )
+
+    def convert(self, greg: datetime) -> CyprianDate:
+        """
+        Get the Cyprian date on which a given timestamp falls, in this object's
+        zone. Naive timestamps are taken to be in that zone already.
+        """
+        if greg.tzinfo is None:
+            greg = greg.replace(tzinfo=self.zone)
+        bucket = self.bucket
+        if bucket is None or not bucket[0] <= greg < bucket[1]:
+            self.misses += 1
+            day_start = round_down_to_nearest_day(greg, self.zone)
+            day_end = day_start+timedelta(days=1)
+            bucket = \
+                (day_start, day_end, self.concordance.convert_greg(day_start))
+            self.bucket = bucket
+        else:
+            self.hits += 1
+        cyprian = bucket[2]
+        return CyprianDate(cyprian.year, cyprian.month, cyprian.day)
+
+    def convert_many(self, timestamps: Iterable[datetime]) -> list[CyprianDate]:
+        """ Convert many timestamps, ideally sorted, in one go. """
+        return [self.convert(timestamp) for timestamp in timestamps]
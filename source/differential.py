@@ -0,0 +1,292 @@
+"""
+This code defines a harness which checks any fast engine, i.e. anything which
+yields the Cyprian equivalent of each day in a range, against the reference
+implementation, i.e. walking the calendar a day at a time with ephem, and
+reports the first day on which each engine diverges from it.
+
+Ranges are chosen deterministically: around every new moon and vernal equinox,
+where subtle errors are most likely, plus some seeded random ones; or, in the
+exhaustive tier, every day across several centuries.
+"""
+
+# Standard imports.
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Callable, Iterable, Iterator
+
+# Local imports.
+from .cache_config import BACKEND_MEMORY, CacheConfig
+from .concordance import Concordance
+from .cyprian_date import CyprianDate
+from .lunation import (
+    get_cyprian_new_year,
+    get_cyprian_year_beginning_with_greg_year,
+    get_next_new_moon,
+    get_vernal_equinox,
+    round_down_to_nearest_day
+)
+from .year_structure import iter_days_between
+
+# Local constants.
+BOUNDARY_RADIUS = 2  # In days, either side of each new moon or equinox.
+MAX_RANDOM_RANGE_LENGTH = 45  # In days.
+DEFAULT_SEED = 0
+ONE_DAY = timedelta(days=1)
+
+# Each engine yields (greg, cyprian_year, cyprian_month, cyprian_day) for each
+# day from start (inclusive) to end (exclusive), as reckoned in the zone.
+Engine = Callable[
+    [datetime, datetime, tzinfo], Iterable[tuple[datetime, int, int, int]]
+]
+DayRange = tuple[datetime, datetime]
+
+##################
+# HELPER CLASSES #
+##################
+
+@dataclass(frozen=True)
+class Divergence:
+    """ The first day on which an engine disagrees with the reference. """
+    engine_name: str
+    greg: date
+    expected: tuple[int, int, int]|None
+    actual: tuple[int, int, int]|None
+
+    def __str__(self) -> str:
+        return (
+            f"{self.engine_name} diverges on {self.greg.isoformat()}: "+
+            f"expected {self.expected}, got {self.actual}"
+        )
+
+@dataclass
+class DifferentialReport:
+    """ The findings of a run. """
+    days_checked: int = 0
+    divergences: dict[str, Divergence] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """ Determine whether every engine agreed with the reference. """
+        return not self.divergences
+
+    def __str__(self) -> str:
+        lines = [f"Checked {self.days_checked} day(s)."]
+        for divergence in self.divergences.values():
+            lines.append(str(divergence))
+        return "\n".join(lines)
+
+@dataclass(frozen=True)
+class Tier:
+    """ How widely, and how deeply, to compare. """
+    name: str
+    first_greg_year: int
+    last_greg_year: int
+    random_ranges: int = 0
+    seed: int = DEFAULT_SEED
+    exhaustive: bool = False
+
+    def get_ranges(self, zone: tzinfo = timezone.utc) -> list[DayRange]:
+        """ Get the ranges of days over which this tier compares. """
+        if self.exhaustive:
+            return [
+                (
+                    datetime(self.first_greg_year, 1, 1, tzinfo=zone),
+                    datetime(self.last_greg_year+1, 1, 1, tzinfo=zone)
+                )
+            ]
+        result = \
+            make_boundary_ranges(
+                self.first_greg_year, self.last_greg_year, zone
+            )+\
+            make_random_ranges(
+                self.first_greg_year,
+                self.last_greg_year,
+                self.random_ranges,
+                self.seed,
+                zone
+            )
+        return merge_ranges(result)
+
+FAST_TIER = Tier("fast", 2016, 2032, random_ranges=20)
+EXHAUSTIVE_TIER = Tier("exhaustive", 1800, 2200, exhaustive=True)
+
+@dataclass
+class ReferenceWalker:
+    """
+    Walks the calendar a day at a time, as the original implementation did,
+    only ever forwards, unless asked for a day it has already passed.
+    """
+    zone: tzinfo = timezone.utc
+    greg: datetime|None = field(init=False, default=None)
+    cyprian: CyprianDate|None = field(init=False, default=None)
+
+    def restart(self, greg: datetime):
+        """ Start again from the beginning of the year containing a day. """
+        greg_year = greg.year
+        new_year = get_cyprian_new_year(greg_year, self.zone)
+        if greg < new_year:
+            greg_year -= 1
+            new_year = get_cyprian_new_year(greg_year, self.zone)
+        cyprian_year = get_cyprian_year_beginning_with_greg_year(greg_year)
+        self.greg = new_year
+        self.cyprian = CyprianDate(cyprian_year, 1, 1)
+
+    def iter_days(
+        self,
+        start: datetime,
+        end: datetime
+    ) -> Iterator[tuple[datetime, int, int, int]]:
+        """ Yield each day from start (inclusive) to end (exclusive). """
+        if self.greg is None or start < self.greg:
+            self.restart(start)
+        while self.greg < end:
+            if self.greg >= start:
+                cyprian = self.cyprian
+                yield self.greg, cyprian.year, cyprian.month, cyprian.day
+            self.cyprian.advance_one_day(self.greg, self.zone)
+            self.greg += ONE_DAY
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class DifferentialHarness:
+    """ The class in question. """
+    engines: dict[str, Engine]
+    zone: tzinfo = timezone.utc
+
+    def run(self, ranges: Iterable[DayRange]) -> DifferentialReport:
+        """
+        Compare each engine against the reference over the given ranges,
+        recording only the first divergence of each.
+        """
+        result = DifferentialReport()
+        walker = ReferenceWalker(self.zone)
+        for start, end in merge_ranges(ranges):
+            expected = {
+                greg.date(): (year, month, day)
+                for greg, year, month, day in walker.iter_days(start, end)
+            }
+            result.days_checked += len(expected)
+            for name, engine in self.engines.items():
+                if name in result.divergences:
+                    continue
+                divergence = \
+                    find_first_divergence(
+                        name, expected, engine(start, end, self.zone)
+                    )
+                if divergence:
+                    result.divergences[name] = divergence
+        return result
+
+    def run_tier(self, tier: Tier) -> DifferentialReport:
+        """ Ronseal. """
+        return self.run(tier.get_ranges(self.zone))
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def find_first_divergence(
+    engine_name: str,
+    expected: dict[date, tuple[int, int, int]],
+    days: Iterable[tuple[datetime, int, int, int]]
+) -> Divergence|None:
+    """
+    Find the earliest day on which an engine's output differs from what was
+    expected, including any day missing from, or extra to, its output.
+    """
+    actual = {
+        greg.date(): (year, month, day) for greg, year, month, day in days
+    }
+    for greg in sorted(set(expected)|set(actual)):
+        if expected.get(greg) != actual.get(greg):
+            return Divergence(
+                engine_name, greg, expected.get(greg), actual.get(greg)
+            )
+    return None
+
+def make_boundary_ranges(
+    first_greg_year: int,
+    last_greg_year: int,
+    zone: tzinfo = timezone.utc,
+    radius: int = BOUNDARY_RADIUS
+) -> list[DayRange]:
+    """
+    Make a range of days around each new moon and vernal equinox in the given
+    Gregorian years (inclusive).
+    """
+    events = []
+    for greg_year in range(first_greg_year, last_greg_year+1):
+        events.append(get_vernal_equinox(greg_year))
+    end = datetime(last_greg_year+1, 1, 1, tzinfo=timezone.utc)
+    new_moon = \
+        get_next_new_moon(datetime(first_greg_year, 1, 1, tzinfo=timezone.utc))
+    while new_moon < end:
+        events.append(new_moon)
+        new_moon = get_next_new_moon(new_moon+ONE_DAY)
+    result = []
+    for event in events:
+        day = round_down_to_nearest_day(event, zone)
+        result.append((day-radius*ONE_DAY, day+(radius+1)*ONE_DAY))
+    return result
+
+def make_random_ranges(
+    first_greg_year: int,
+    last_greg_year: int,
+    count: int,
+    seed: int = DEFAULT_SEED,
+    zone: tzinfo = timezone.utc,
+    max_length: int = MAX_RANDOM_RANGE_LENGTH
+) -> list[DayRange]:
+    """ Make some seeded random ranges of days in the given years. """
+    rng = random.Random(seed)
+    first_ordinal = date(first_greg_year, 1, 1).toordinal()
+    last_ordinal = date(last_greg_year, 12, 31).toordinal()
+    result = []
+    for _ in range(count):
+        start = date.fromordinal(rng.randint(first_ordinal, last_ordinal))
+        start = datetime(start.year, start.month, start.day, tzinfo=zone)
+        result.append((start, start+rng.randint(1, max_length)*ONE_DAY))
+    return result
+
+def merge_ranges(ranges: Iterable[DayRange]) -> list[DayRange]:
+    """ Sort some ranges, and merge any which overlap or touch. """
+    result = []
+    for start, end in sorted(ranges):
+        if result and start <= result[-1][1]:
+            result[-1] = (result[-1][0], max(result[-1][1], end))
+        else:
+            result.append((start, end))
+    return result
+
+def year_structure_engine(
+    start: datetime,
+    end: datetime,
+    zone: tzinfo = timezone.utc
+) -> Iterator[tuple[datetime, int, int, int]]:
+    """ Locate each day from the structure of the year containing it. """
+    return iter_days_between(start, end, zone)
+
+def make_concordance_engine(config: CacheConfig|None = None) -> Engine:
+    """
+    Make an engine which reads each day from a cache, by default one held
+    only in memory, so as to check the storage layer too.
+    """
+    if config is None:
+        config = CacheConfig("differential", BACKEND_MEMORY)
+    def concordance_engine(
+        start: datetime,
+        end: datetime,
+        zone: tzinfo = timezone.utc
+    ) -> Iterator[tuple[datetime, int, int, int]]:
+        """ Convert each day through the cache. """
+        concordance = Concordance(zone=zone, config=config)
+        greg = start
+        while greg < end:
+            cyprian = concordance.convert_greg(greg)
+            yield greg, cyprian.year, cyprian.month, cyprian.day
+            greg += ONE_DAY
+    return concordance_engine
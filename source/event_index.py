@@ -0,0 +1,258 @@
+"""
+This code defines an index of the events which shape the Cyprian calendar,
+i.e. the start of each month and year, the start of each Intercalaris and each
+vernal equinox, over a range of Cyprian years, so that the next or previous
+event of a given kind, or the number of them between two instants, can be found
+by bisection rather than by walking from day to day.
+"""
+
+# Standard imports.
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, tzinfo
+from typing import Callable
+
+# Local imports.
+from . import constants
+from .concordance import Concordance
+from .cyprian_date import CyprianDate
+from .lunation import get_vernal_equinox, round_down_to_nearest_day
+from .year_structure import YearStructure, compute_year_structure, locate_greg
+
+# Local constants.
+MONTH_START = "month_start"
+YEAR_START = "year_start"
+LEAP_MONTH_START = "leap_month_start"
+VERNAL_EQUINOX = "vernal_equinox"
+EVENT_KINDS = (MONTH_START, YEAR_START, LEAP_MONTH_START, VERNAL_EQUINOX)
+
+##################
+# HELPER CLASSES #
+##################
+
+@dataclass(frozen=True)
+class Event:
+    """
+    Something which happens at a given instant, or, for the start of a month
+    or year, at midnight on a given day, with the Cyprian date it falls on.
+    """
+    greg: datetime
+    kind: str
+    cyprian: CyprianDate
+
+class EventIndexError(Exception):
+    """ A custom exception. """
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class EventIndex:
+    """ The class in question. """
+    first_cyprian_year: int
+    last_cyprian_year: int
+    zone: tzinfo = timezone.utc
+    get_year_structure: Callable[[int], YearStructure]|None = None
+    start: datetime|None = field(init=False, default=None)
+    end: datetime|None = field(init=False, default=None)
+    events: dict[str, list[Event]]|None = field(init=False, default=None)
+    instants: dict[str, list[datetime]]|None = \
+        field(init=False, default=None)
+
+    def __post_init__(self):
+        if self.last_cyprian_year < self.first_cyprian_year:
+            raise EventIndexError(
+                f"Empty range of years: {self.first_cyprian_year} to "+
+                f"{self.last_cyprian_year}"
+            )
+        if self.get_year_structure is None:
+            self.get_year_structure = self.compute_year_structure
+        self.fill_events()
+
+    def compute_year_structure(self, cyprian_year: int) -> YearStructure:
+        """ Ronseal. """
+        return compute_year_structure(cyprian_year, self.zone)
+
+    def fill_events(self):
+        """
+        List the events of each kind, in order, from the structure of each
+        year in the range.
+        """
+        self.events = { kind: [] for kind in EVENT_KINDS }
+        for cyprian_year in range(
+            self.first_cyprian_year, self.last_cyprian_year+1
+        ):
+            year_structure = self.get_year_structure(cyprian_year)
+            if self.start is None:
+                self.start = year_structure.start
+            self.end = year_structure.next_year_start
+            for month, month_start in enumerate(
+                year_structure.month_starts, start=1
+            ):
+                event = \
+                    Event(
+                        month_start,
+                        MONTH_START,
+                        CyprianDate(cyprian_year, month, 1)
+                    )
+                self.events[MONTH_START].append(event)
+                if month == 1:
+                    self.add_event(event, YEAR_START)
+                elif month == constants.LEAP_MONTH:
+                    self.add_event(event, LEAP_MONTH_START)
+        for greg_year in range(self.start.year, self.end.year+1):
+            equinox = get_vernal_equinox(greg_year)
+            if self.start <= equinox < self.end:
+                cyprian = CyprianDate(*locate_greg(equinox, self.zone))
+                self.events[VERNAL_EQUINOX].append(
+                    Event(equinox, VERNAL_EQUINOX, cyprian)
+                )
+        self.instants = {
+            kind: [event.greg for event in events]
+            for kind, events in self.events.items()
+        }
+
+    def add_event(self, event: Event, kind: str):
+        """ Add a copy of an event, as one of a given kind. """
+        self.events[kind].append(Event(event.greg, kind, event.cyprian))
+
+    def get_instants(self, kind: str, greg: datetime) -> list[datetime]:
+        """
+        Get the instants of the events of a given kind, having checked that a
+        given instant falls within the range which the index covers.
+        """
+        if kind not in self.instants:
+            raise EventIndexError(f"Unknown kind of event: {kind}")
+        if not self.start <= greg <= self.end:
+            raise EventIndexError(
+                f"{greg} falls outside the index, which runs from "+
+                f"{self.start} to {self.end}"
+            )
+        return self.instants[kind]
+
+    def next(
+        self,
+        kind: str,
+        greg: datetime,
+        inclusive: bool = False
+    ) -> Event|None:
+        """
+        Get the first event of a given kind after a given instant, or at it,
+        if inclusive, or None if the index holds no such event.
+        """
+        greg = self.localise(greg)
+        instants = self.get_instants(kind, greg)
+        bisect = bisect_left if inclusive else bisect_right
+        index = bisect(instants, greg)
+        if index == len(instants):
+            return None
+        return self.events[kind][index]
+
+    def previous(
+        self,
+        kind: str,
+        greg: datetime,
+        inclusive: bool = False
+    ) -> Event|None:
+        """
+        Get the last event of a given kind before a given instant, or at it,
+        if inclusive, or None if the index holds no such event.
+        """
+        greg = self.localise(greg)
+        instants = self.get_instants(kind, greg)
+        bisect = bisect_right if inclusive else bisect_left
+        index = bisect(instants, greg)
+        if index == 0:
+            return None
+        return self.events[kind][index-1]
+
+    def between(
+        self,
+        kind: str,
+        greg_start: datetime,
+        greg_end: datetime
+    ) -> list[Event]:
+        """
+        Get the events of a given kind from one instant (inclusive) to another
+        (exclusive).
+        """
+        first, last = self.bisect_range(kind, greg_start, greg_end)
+        return self.events[kind][first:last]
+
+    def count_between(
+        self,
+        kind: str,
+        greg_start: datetime,
+        greg_end: datetime
+    ) -> int:
+        """
+        Count the events of a given kind from one instant (inclusive) to
+        another (exclusive).
+        """
+        first, last = self.bisect_range(kind, greg_start, greg_end)
+        return max(last-first, 0)
+
+    def bisect_range(
+        self,
+        kind: str,
+        greg_start: datetime,
+        greg_end: datetime
+    ) -> tuple[int, int]:
+        """ Ronseal. """
+        greg_start = self.localise(greg_start)
+        greg_end = self.localise(greg_end)
+        self.get_instants(kind, greg_start)
+        instants = self.get_instants(kind, greg_end)
+        result = (
+            bisect_left(instants, greg_start),
+            bisect_left(instants, greg_end)
+        )
+        return result
+
+    def days_until(self, kind: str, greg: datetime) -> int|None:
+        """
+        Count the days from a given date until the day of the next event of a
+        given kind, i.e. 0 if it falls later that day, or None if the index
+        holds no such event.
+        """
+        greg = self.localise(greg)
+        event = self.next(kind, greg, inclusive=True)
+        if event is None:
+            return None
+        result = (
+            round_down_to_nearest_day(event.greg, self.zone)-
+            round_down_to_nearest_day(greg, self.zone)
+        ).days
+        return result
+
+    def localise(self, greg: datetime) -> datetime:
+        """ Take a naive datetime to be in this index's zone. """
+        if greg.tzinfo is None:
+            return greg.replace(tzinfo=self.zone)
+        return greg
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def make_cached_event_index(
+    concordance: Concordance|None = None
+) -> EventIndex:
+    """
+    Make an index of every event over the range of whole Cyprian years which
+    a cache already holds, reading the structure of each from it.
+    """
+    concordance = concordance or Concordance()
+    concordance.prepare(
+        cyprian=CyprianDate(concordance.whole_cyprian_year, 1, 1)
+    )
+    span = concordance.read_span()
+    result = \
+        EventIndex(
+            span.first_cyprian_year,
+            span.cursor_cyprian.year-1,
+            concordance.zone,
+            concordance.read_year_structure
+        )
+    return result
@@ -56,24 +56,21 @@ class ExtendedConcordance:
         lines = []
         for equ in self.equivalents:
             if equ.greg.day == 1 or equ.cyprian.day == 1 or equ.liturgical:
-                greg = equ.greg_latex
-                cyprian = equ.cyprian_latex
-                liturgical = equ.liturgical_latex
-                row = f"        {greg} & {cyprian} & {liturgical} \\\\"
-                lines.append(row)
+                lines.append(equ.to_latex_row())
         result = "\n".join(lines)
         return result
 
-    def export_latex_file(self) -> str:
+    def export_latex_file(self, path_to_output_dir: str = PATH_TO_TEMP) -> str:
         """ Put a summmary of the concordance into a LaTeX file. """
         with open(PATH_TO_CONCORDANCE_BASE, "r") as base_file:
             code = base_file.read()
         rows = self.make_latex_rows()
         code = code.replace("#YEAR", str(self.year))
         code = code.replace("#ROWS", rows)
-        path_obj_to_temp = Path(PATH_TO_TEMP)
-        path_obj_to_temp.mkdir(exist_ok=True)
-        path_to_output = str(path_obj_to_temp/f"concordance{self.year}.tex")
+        path_obj_to_output_dir = Path(path_to_output_dir)
+        path_obj_to_output_dir.mkdir(parents=True, exist_ok=True)
+        path_to_output = \
+            str(path_obj_to_output_dir/f"concordance{self.year}.tex")
         with open(path_to_output, "w") as output_file:
             output_file.write(code)
         return path_to_output
@@ -121,6 +118,14 @@ class Equivalent:
             return self.liturgical
         return "---"
 
+    def to_latex_row(self) -> str:
+        """ Get a row of a LaTeX table representing this object. """
+        greg = self.greg_latex
+        cyprian = self.cyprian_latex
+        liturgical = self.liturgical_latex
+        result = f"        {greg} & {cyprian} & {liturgical} \\\\"
+        return result
+
     def to_json(self) -> dict:
         """ Ronseal. """
         result = {
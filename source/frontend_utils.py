@@ -3,36 +3,108 @@ This code defines some frotend utility functions.
 """
 
 # Standard imports.
-from datetime import datetime
+import threading
+from datetime import datetime, timezone, tzinfo
+from typing import Iterable
 
 # Local imports.
-from .concordance import Concordance
-from .cyprian_date import CyprianDate
+from .cache_config import get_cache_config
+from .concordance import Concordance, DaySpan
+from .cyprian_date import CyprianDate, get_zone
+from .day_bucket import DayBucketConverter
+from .profiling import profile_phase
+from .year_structure import YearStructure, locate_greg
+
+# Local constants.
+# Each thread keeps its own converters, keyed by zone and cache configuration,
+# since a converter holds a Concordance, and so an sqlite connection, which
+# only the thread that opened it may use.
+DAY_BUCKET_CONVERTERS = threading.local()
 
 #############
 # FUNCTIONS #
 #############
 
-def convert_date(to_convert: datetime|CyprianDate) -> datetime|CyprianDate:
-    """ Convert a Gregorian date to a Cyprian one, or vice versa. """
+@profile_phase("convert_date")
+def convert_date(
+    to_convert: datetime|CyprianDate,
+    zone: tzinfo|None = None
+) -> datetime|CyprianDate:
+    """
+    Convert a Gregorian date to a Cyprian one, or vice versa, with days reckoned
+    in a given zone, or else that of the Gregorian date, or else UTC.
+    """
     if isinstance(to_convert, datetime):
-        return convert_greg_to_cyprian(to_convert)
+        return convert_greg_to_cyprian(to_convert, zone)
     if isinstance(to_convert, CyprianDate):
-        return convert_cyprian_to_greg(to_convert)
+        return convert_cyprian_to_greg(to_convert, zone or timezone.utc)
     raise ConversionError(f"Unanticipated type: {type(to_convert)}")
 
-def convert_greg_to_cyprian(greg: datetime) -> CyprianDate:
-    """ Ronseal. """
-    concordance = Concordance()
-    result = concordance.convert_greg(greg)
+def convert_greg_to_cyprian(
+    greg: datetime,
+    zone: tzinfo|None = None
+) -> CyprianDate:
+    """
+    Convert a Gregorian date to a Cyprian one, with days reckoned in a given
+    zone, or else that of the Gregorian date, or else UTC.
+    """
+    converter = get_day_bucket_converter(zone or get_zone(greg))
+    result = converter.convert(greg)
     return result
 
-def convert_cyprian_to_greg(cyprian: datetime) -> datetime:
+def get_day_bucket_converter(zone: tzinfo) -> DayBucketConverter:
+    """
+    Get this thread's converter for a given zone, under the current cache
+    configuration, creating it if need be.
+    """
+    config = get_cache_config()
+    key = (zone, config)
+    converters = getattr(DAY_BUCKET_CONVERTERS, "by_key", None)
+    if converters is None:
+        converters = DAY_BUCKET_CONVERTERS.by_key = {}
+    result = converters.get(key)
+    if result is None:
+        result = converters[key] = DayBucketConverter(zone=zone, config=config)
+    return result
+
+def convert_cyprian_to_greg(
+    cyprian: CyprianDate,
+    zone: tzinfo = timezone.utc
+) -> datetime:
     """ Ronseal. """
-    concordance = Concordance()
+    concordance = Concordance(zone=zone)
     result = concordance.convert_cyprian(cyprian)
     return result
 
+def get_days_in_cyprian_month(
+    year: int,
+    month: int,
+    zone: tzinfo = timezone.utc
+) -> DaySpan:
+    """ Get the Gregorian and Cyprian dates of every day in a given month. """
+    concordance = Concordance(zone=zone)
+    result = concordance.days_in_cyprian_month(year, month)
+    return result
+
+def convert_timestamps(
+    timestamps: Iterable[datetime],
+    zone: tzinfo = timezone.utc
+) -> list[CyprianDate]:
+    """
+    Convert many timestamps, each of them aware or else already in the given
+    zone, into the Cyprian dates on which they fall there.
+    """
+    result = [
+        CyprianDate(*locate_greg(timestamp, zone)) for timestamp in timestamps
+    ]
+    return result
+
+def get_year_structure(cyprian_year: int) -> YearStructure:
+    """ Get the month lengths, etc of a given Cyprian year. """
+    concordance = Concordance()
+    result = concordance.get_year_structure(cyprian_year)
+    return result
+
 ##################
 # HELPER CLASSES #
 ##################
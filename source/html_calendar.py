@@ -0,0 +1,275 @@
+"""
+This code defines a renderer which turns Cyprian months and years into HTML
+calendar grids, with Gregorian and liturgical annotations, fetching each month
+or year from the cache in a single query, and keeping each rendered month, so
+that rendering it again with the same options costs only a lookup.
+"""
+
+# Standard imports.
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, tzinfo
+from html import escape
+from threading import Lock
+
+# Local imports.
+from . import constants
+from .cache_config import CacheConfig
+from .concordance import Concordance, DaySpan
+from .cyprian_date import CyprianDate
+from .cyprian_format import compile_format
+from .liturgical_calendar import DEFAULT_CALENDAR, LiturgicalCalendar
+
+# Local constants.
+CAPTION_FORMAT = compile_format(
+    f'%B <span class="frak">{constants.YEAR_INITIAL}</span><sub>%y</sub>'
+)
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+DEFAULT_MAX_FRAGMENTS = 512
+
+##################
+# HELPER CLASSES #
+##################
+
+@dataclass(frozen=True)
+class HtmlCalendarOptions:
+    """ How to render a month, which, being hashable, keys the cache. """
+    show_greg: bool = True
+    show_liturgical: bool = True
+    greg_format: str = "%d %b"
+    first_weekday: int = 0  # As with datetime.weekday(), i.e. Monday is 0.
+    css_prefix: str = "cyprian"
+
+    def __post_init__(self):
+        if not 0 <= self.first_weekday < len(WEEKDAY_NAMES):
+            raise HtmlCalendarError(
+                f"Invalid first weekday: {self.first_weekday}"
+            )
+
+@dataclass
+class FragmentStats:
+    """ How often the cache of rendered months has been useful. """
+    hits: int = 0
+    misses: int = 0
+
+class HtmlCalendarError(Exception):
+    """ A custom exception. """
+
+DEFAULT_OPTIONS = HtmlCalendarOptions()
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class HtmlCalendar:
+    """ The class in question. """
+    zone: tzinfo = timezone.utc
+    config: CacheConfig|None = None
+    calendar: LiturgicalCalendar|None = None
+    max_fragments: int = DEFAULT_MAX_FRAGMENTS
+    fragments: OrderedDict[tuple, str] = \
+        field(init=False, default_factory=OrderedDict)
+    stats: FragmentStats = field(init=False, default_factory=FragmentStats)
+    lock: Lock = field(init=False, default_factory=Lock)
+
+    def __post_init__(self):
+        self.calendar = self.calendar or DEFAULT_CALENDAR
+
+    def render_month(
+        self,
+        year: int,
+        month: int,
+        options: HtmlCalendarOptions = DEFAULT_OPTIONS
+    ) -> str:
+        """ Render a given month, reusing any previous rendering of it. """
+        result = self.get_fragment(year, month, options)
+        if result is None:
+            span = self.make_concordance().days_in_cyprian_month(year, month)
+            result = self.render_span(year, month, span, options)
+            self.put_fragment(year, month, options, result)
+        return result
+
+    def render_year(
+        self,
+        year: int,
+        options: HtmlCalendarOptions = DEFAULT_OPTIONS
+    ) -> str:
+        """
+        Render every month of a given year, fetching all those months which
+        haven't been rendered already in one query.
+        """
+        months = {}
+        month = 1
+        while CyprianDate(year, month, 1).is_valid():
+            months[month] = self.get_fragment(year, month, options)
+            month += 1
+        if None in months.values():
+            self.render_missing_months(year, months, options)
+        prefix = options.css_prefix
+        result = "\n".join(
+            [f'<div class="{prefix}-year">']+
+            list(months.values())+
+            ["</div>"]
+        )
+        return result
+
+    def render_missing_months(
+        self,
+        year: int,
+        months: dict[int, str|None],
+        options: HtmlCalendarOptions
+    ):
+        """ Fetch the whole year at once, and render each month not cached. """
+        span = \
+            self.make_concordance().greg_span(
+                CyprianDate(year, 1, 1), CyprianDate(year+1, 1, 1)
+            )
+        month_spans = split_span_by_month(span)
+        for month, fragment in months.items():
+            if fragment is not None:
+                continue
+            month_span = month_spans.get(month)
+            if not month_span:
+                raise HtmlCalendarError(
+                    f"No such month: {month} of year {year}"
+                )
+            fragment = self.render_span(year, month, month_span, options)
+            self.put_fragment(year, month, options, fragment)
+            months[month] = fragment
+
+    def render_span(
+        self,
+        year: int,
+        month: int,
+        span: DaySpan,
+        options: HtmlCalendarOptions
+    ) -> str:
+        """ Render the days of one month as a table, a week to a row. """
+        prefix = options.css_prefix
+        caption = CAPTION_FORMAT.format(year, month, 1)
+        weekdays = [
+            WEEKDAY_NAMES[(options.first_weekday+index)%len(WEEKDAY_NAMES)]
+            for index in range(len(WEEKDAY_NAMES))
+        ]
+        lines = [
+            f'<table class="{prefix}-month">',
+            f"<caption>{caption}</caption>",
+            "<thead><tr>"+
+            "".join(f"<th>{weekday}</th>" for weekday in weekdays)+
+            "</tr></thead>",
+            "<tbody>"
+        ]
+        cells = [
+            "<td></td>"
+            for _ in range(
+                (span.greg_start.weekday()-options.first_weekday)%
+                len(WEEKDAY_NAMES)
+            )
+        ]
+        for greg, cyprian in span:
+            cells.append(self.render_day(greg, cyprian, options))
+        while len(cells)%len(WEEKDAY_NAMES):
+            cells.append("<td></td>")
+        for index in range(0, len(cells), len(WEEKDAY_NAMES)):
+            lines.append(
+                "<tr>"+"".join(cells[index:index+len(WEEKDAY_NAMES)])+"</tr>"
+            )
+        lines.append("</tbody>")
+        lines.append("</table>")
+        result = "\n".join(lines)
+        return result
+
+    def render_day(
+        self,
+        greg: datetime,
+        cyprian: CyprianDate,
+        options: HtmlCalendarOptions
+    ) -> str:
+        """ Render one cell of the grid. """
+        prefix = options.css_prefix
+        observance = None
+        if options.show_liturgical:
+            observance = \
+                self.calendar.get_ordinal_lookup(greg.year).get(
+                    greg.toordinal()
+                )
+        classes = f"{prefix}-day"
+        if observance:
+            classes += f" {prefix}-observance"
+        parts = [
+            f'<td class="{classes}" data-greg="{greg.date().isoformat()}">',
+            f'<span class="{prefix}-number">{cyprian.get_day_str()}</span>'
+        ]
+        if options.show_greg:
+            parts.append(
+                f'<span class="{prefix}-greg">'+
+                escape(greg.strftime(options.greg_format))+
+                "</span>"
+            )
+        if observance:
+            parts.append(
+                f'<span class="{prefix}-liturgical">'+
+                escape(observance)+
+                "</span>"
+            )
+        parts.append("</td>")
+        result = "".join(parts)
+        return result
+
+    def make_concordance(self) -> Concordance:
+        """ Ronseal. """
+        return Concordance(zone=self.zone, config=self.config)
+
+    def get_fragment(
+        self,
+        year: int,
+        month: int,
+        options: HtmlCalendarOptions
+    ) -> str|None:
+        """ Look up a rendered month, counting a hit or a miss. """
+        key = (year, month, options)
+        with self.lock:
+            result = self.fragments.get(key)
+            if result is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                self.fragments.move_to_end(key)
+        return result
+
+    def put_fragment(
+        self,
+        year: int,
+        month: int,
+        options: HtmlCalendarOptions,
+        fragment: str
+    ):
+        """ Keep a rendered month, forgetting the least recently used. """
+        with self.lock:
+            self.fragments[(year, month, options)] = fragment
+            self.fragments.move_to_end((year, month, options))
+            while len(self.fragments) > self.max_fragments:
+                self.fragments.popitem(last=False)
+
+    def clear(self):
+        """ Forget every rendered month, e.g. after changing the calendar. """
+        with self.lock:
+            self.fragments.clear()
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def split_span_by_month(span: DaySpan) -> dict[int, DaySpan]:
+    """ Split a span of one year's days into a span for each month. """
+    result = {}
+    start = 0
+    for index in range(1, len(span)+1):
+        if (
+            index == len(span) or
+            span.cyprian_days[index][1] != span.cyprian_days[start][1]
+        ):
+            result[span.cyprian_days[start][1]] = span[start:index]
+            start = index
+    return result
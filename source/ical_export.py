@@ -0,0 +1,213 @@
+"""
+This code defines some functions which stream the start of each Cyprian month
+and year, and the liturgical observances, as iCalendar (RFC 5545) all-day
+events, a year at a time, so that a feed of any length is written in bounded
+memory, straight to a file, a socket's file object or any other stream.
+"""
+
+# Standard imports.
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Iterator, TextIO
+
+# Local imports.
+from . import constants
+from .cyprian_date import CyprianDate
+from .liturgical_calendar import DEFAULT_CALENDAR, LiturgicalCalendar
+from .year_structure import YearStructure, compute_year_structure
+
+# Local constants.
+PRODUCT_ID = "-//cyprian-datetime//Cyprian Calendar//EN"
+UID_DOMAIN = "cyprian-datetime"
+LINE_BREAK = "\r\n"
+MAX_LINE_OCTETS = 75
+MONTH_START_FORMAT = "%B %Y"
+ONE_DAY = timedelta(days=1)
+
+##################
+# HELPER CLASSES #
+##################
+
+class IcalExportError(Exception):
+    """ A custom exception. """
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def escape_text(text: str) -> str:
+    """ Escape a value of type TEXT, as RFC 5545 requires. """
+    result = (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+    return result
+
+def fold_line(line: str) -> str:
+    """
+    Fold a content line into pieces of no more than 75 octets, each after the
+    first beginning with a space, without splitting any character.
+    """
+    pieces = []
+    piece = ""
+    for character in line:
+        if len((piece+character).encode("utf-8")) > MAX_LINE_OCTETS:
+            pieces.append(piece)
+            piece = " "
+        piece += character
+    pieces.append(piece)
+    result = LINE_BREAK.join(pieces)
+    return result
+
+def make_event_lines(
+    greg: date,
+    uid: str,
+    summary: str,
+    description: str,
+    stamp: str,
+    categories: str
+) -> list[str]:
+    """ Make the content lines of one all-day event. """
+    result = [
+        "BEGIN:VEVENT",
+        f"UID:{escape_text(uid)}@{UID_DOMAIN}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART;VALUE=DATE:{greg.strftime('%Y%m%d')}",
+        f"DTEND;VALUE=DATE:{(greg+ONE_DAY).strftime('%Y%m%d')}",
+        f"SUMMARY:{escape_text(summary)}",
+        f"DESCRIPTION:{escape_text(description)}",
+        f"CATEGORIES:{escape_text(categories)}",
+        "TRANSP:TRANSPARENT",
+        "END:VEVENT"
+    ]
+    return result
+
+def iter_month_start_events(
+    year_structure: YearStructure,
+    stamp: str
+) -> Iterator[list[str]]:
+    """ Yield an event for the start of each month of a given year. """
+    for month, month_start in enumerate(year_structure.month_starts, start=1):
+        cyprian = CyprianDate(year_structure.year, month, 1)
+        if month == 1:
+            summary = f"Cyprian New Year: {cyprian.strftime('%Y')}"
+        else:
+            summary = f"{cyprian.strftime(MONTH_START_FORMAT)} begins"
+        greg = month_start.date()
+        yield make_event_lines(
+            greg,
+            f"month-{cyprian.year}-{month}",
+            summary,
+            str(cyprian),
+            stamp,
+            "Cyprian month"
+        )
+
+def iter_observance_events(
+    year_structure: YearStructure,
+    calendar: LiturgicalCalendar,
+    stamp: str
+) -> Iterator[list[str]]:
+    """
+    Yield an event for each observance falling within a given year, locating
+    it from the year's structure rather than by conversion.
+    """
+    first_ordinal = year_structure.start.date().toordinal()
+    last_ordinal = year_structure.next_year_start.date().toordinal()
+    month_ordinals = [
+        month_start.date().toordinal()
+        for month_start in year_structure.month_starts
+    ]
+    for greg_year in range(
+        year_structure.start.year, year_structure.next_year_start.year+1
+    ):
+        lookup = calendar.get_names_by_ordinal(greg_year)
+        for ordinal, names in sorted(lookup.items()):
+            if not first_ordinal <= ordinal < last_ordinal:
+                continue
+            month = bisect_right(month_ordinals, ordinal)
+            cyprian = \
+                CyprianDate(
+                    year_structure.year,
+                    month,
+                    ordinal-month_ordinals[month-1]+1
+                )
+            greg = date.fromordinal(ordinal)
+            for name in names:
+                yield make_event_lines(
+                    greg,
+                    f"observance-{greg.isoformat()}-{name}".replace(" ", "-"),
+                    name,
+                    str(cyprian),
+                    stamp,
+                    "Liturgical"
+                )
+
+def iter_ical_lines(
+    first_cyprian_year: int,
+    last_cyprian_year: int,
+    zone: tzinfo = timezone.utc,
+    calendar: LiturgicalCalendar|None = None,
+    stamp: datetime|None = None,
+    month_starts: bool = True,
+    observances: bool = True
+) -> Iterator[str]:
+    """
+    Yield each content line, already folded, of a calendar covering a range of
+    Cyprian years (inclusive), a year at a time.
+    """
+    if last_cyprian_year < first_cyprian_year:
+        raise IcalExportError(
+            f"Empty range of years: {first_cyprian_year} to "+
+            f"{last_cyprian_year}"
+        )
+    calendar = calendar or DEFAULT_CALENDAR
+    stamp = stamp or datetime.now(timezone.utc)
+    stamp_str = stamp.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield "BEGIN:VCALENDAR"
+    yield "VERSION:2.0"
+    yield f"PRODID:{PRODUCT_ID}"
+    yield "CALSCALE:GREGORIAN"
+    yield (
+        "X-WR-CALNAME:Cyprian Calendar "+
+        escape_text(
+            f"{constants.YEAR_INITIAL}{first_cyprian_year}-"+
+            f"{constants.YEAR_INITIAL}{last_cyprian_year}"
+        )
+    )
+    for cyprian_year in range(first_cyprian_year, last_cyprian_year+1):
+        year_structure = compute_year_structure(cyprian_year, zone)
+        events = []
+        if month_starts:
+            events.extend(iter_month_start_events(year_structure, stamp_str))
+        if observances:
+            events.extend(
+                iter_observance_events(year_structure, calendar, stamp_str)
+            )
+        events.sort(key=lambda event_lines: event_lines[3])
+        for event_lines in events:
+            for line in event_lines:
+                yield fold_line(line)
+    yield "END:VCALENDAR"
+
+def write_ical(out_file: TextIO, *args, **kwargs) -> int:
+    """
+    Write a calendar to a given stream, e.g. a file opened with newline="",
+    or a socket's file object, returning the number of events written. The
+    arguments are those of iter_ical_lines.
+    """
+    result = 0
+    for line in iter_ical_lines(*args, **kwargs):
+        out_file.write(line)
+        out_file.write(LINE_BREAK)
+        if line == "BEGIN:VEVENT":
+            result += 1
+    return result
+
+def export_ical(path_to_output: str, *args, **kwargs) -> int:
+    """ Write a calendar to a given path, as write_ical does to a stream. """
+    with open(path_to_output, "w", encoding="utf-8", newline="") as out_file:
+        result = write_ical(out_file, *args, **kwargs)
+    return result
@@ -0,0 +1,172 @@
+"""
+This code defines some functions which write concordances for many years to
+LaTeX files, either as one combined document or as one document per year.
+"""
+
+# Standard imports.
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+# Local imports.
+from .cyprian_date import CyprianDate
+from .extended_concordance import (
+    PATH_TO_CONCORDANCE_BASE,
+    PATH_TO_TEMP,
+    Equivalent
+)
+from .liturgical_calendar import DEFAULT_CALENDAR
+from .year_structure import iter_days_between
+
+# Local constants.
+YEAR_MARKER = "#YEAR"
+ROWS_MARKER = "#ROWS"
+BEGIN_DOCUMENT = "\\begin{document}\n"
+END_DOCUMENT = "\\end{document}"
+NEW_PAGE = "\n\\newpage\n"
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass(frozen=True)
+class ConcordanceTemplate:
+    """ A LaTeX template, split once into the pieces around its markers. """
+    preamble: str
+    body_head: str
+    body_tail: str
+    ending: str
+
+    def write_year(self, out_file: TextIO, year: int, rows: Iterable[str]):
+        """ Write the body of one year's concordance to a given file. """
+        out_file.write(self.body_head.replace(YEAR_MARKER, str(year)))
+        for row in rows:
+            out_file.write(row)
+            out_file.write("\n")
+        out_file.write(self.body_tail.replace(YEAR_MARKER, str(year)))
+
+    def write_document(
+        self,
+        out_file: TextIO,
+        title: str,
+        years_and_rows: Iterable[tuple[int, Iterable[str]]]
+    ):
+        """ Write a whole document, holding one or more years, to a file. """
+        out_file.write(self.preamble.replace(YEAR_MARKER, title))
+        for index, (year, rows) in enumerate(years_and_rows):
+            if index > 0:
+                out_file.write(NEW_PAGE)
+            self.write_year(out_file, year, rows)
+        out_file.write(self.ending)
+
+##################
+# HELPER CLASSES #
+##################
+
+class LatexExportError(Exception):
+    """ A custom exception. """
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+@lru_cache
+def load_template(
+    path_to_template: str = PATH_TO_CONCORDANCE_BASE
+) -> ConcordanceTemplate:
+    """ Read and split a given template, reusing any previous reading. """
+    with open(path_to_template, "r") as template_file:
+        code = template_file.read()
+    if (
+        BEGIN_DOCUMENT not in code or
+        END_DOCUMENT not in code or
+        ROWS_MARKER not in code
+    ):
+        raise LatexExportError(f"Malformed template: {path_to_template}")
+    preamble, body = code.split(BEGIN_DOCUMENT, 1)
+    body, ending = body.rsplit(END_DOCUMENT, 1)
+    body_head, body_tail = body.split(ROWS_MARKER, 1)
+    body_tail = body_tail.removeprefix("\n")
+    result = \
+        ConcordanceTemplate(
+            preamble+BEGIN_DOCUMENT,
+            body_head,
+            body_tail,
+            END_DOCUMENT+ending
+        )
+    return result
+
+def make_latex_rows_for_year(year: int) -> list[str]:
+    """
+    Make the rows of the concordance for a given Gregorian year, i.e. one for
+    the first day of each Gregorian or Cyprian month, and one for each
+    liturgical milestone.
+    """
+    liturgical_lookup = DEFAULT_CALENDAR.get_ordinal_lookup(year)
+    result = []
+    for greg, cyprian_year, month, day in iter_days_between(
+        datetime(year, 1, 1, tzinfo=timezone.utc),
+        datetime(year+1, 1, 1, tzinfo=timezone.utc)
+    ):
+        greg = greg.replace(tzinfo=None)
+        liturgical = liturgical_lookup.get(greg.toordinal())
+        if greg.day == 1 or day == 1 or liturgical:
+            cyprian = CyprianDate(cyprian_year, month, day)
+            equivalent = Equivalent(greg, cyprian, liturgical)
+            result.append(equivalent.to_latex_row())
+    return result
+
+def iter_years_and_rows(
+    first_year: int,
+    last_year: int,
+    max_workers: int|None
+) -> Iterator[tuple[int, list[str]]]:
+    """
+    Yield the rows for each year in a range, in order, using several processes
+    unless told to use only one.
+    """
+    years = range(first_year, last_year+1)
+    if max_workers == 1:
+        for year in years:
+            yield year, make_latex_rows_for_year(year)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from zip(years, executor.map(make_latex_rows_for_year, years))
+
+def export_latex_years(
+    first_year: int,
+    last_year: int,
+    path_to_output_dir: str = PATH_TO_TEMP,
+    combined: bool = True,
+    max_workers: int|None = None,
+    path_to_template: str = PATH_TO_CONCORDANCE_BASE
+) -> list[str]:
+    """
+    Write the concordances for a range of Gregorian years (inclusive) to one
+    combined LaTeX file, or to one file per year, returning the paths written.
+    """
+    template = load_template(path_to_template)
+    path_obj_to_output_dir = Path(path_to_output_dir)
+    path_obj_to_output_dir.mkdir(parents=True, exist_ok=True)
+    years_and_rows = \
+        iter_years_and_rows(first_year, last_year, max_workers)
+    result = []
+    if combined:
+        path_to_output = str(
+            path_obj_to_output_dir/f"concordance{first_year}-{last_year}.tex"
+        )
+        with open(path_to_output, "w") as output_file:
+            template.write_document(
+                output_file, f"{first_year}--{last_year}", years_and_rows
+            )
+        result.append(path_to_output)
+        return result
+    for year, rows in years_and_rows:
+        path_to_output = str(path_obj_to_output_dir/f"concordance{year}.tex")
+        with open(path_to_output, "w") as output_file:
+            template.write_document(output_file, str(year), ((year, rows),))
+        result.append(path_to_output)
+    return result
@@ -0,0 +1,226 @@
+"""
+This code defines a class which looks up liturgical observances by date, from
+a registry of fixed and Easter- or Advent-relative observances, remembering
+each year's lookup once it has been built.
+"""
+
+# Standard imports.
+from dataclasses import dataclass, field
+from datetime import MAXYEAR, MINYEAR, date
+from functools import lru_cache
+
+# Non-standard imports
+from dateutil.easter import easter
+
+# Local imports.
+from .liturgical_summary import (
+    ALL_SAINTS_DAY,
+    CHRISTMAS,
+    EPIPHANY,
+    EVE_OF_ST_CRISPIN,
+    FEAST_OF_ST_CRISPIN,
+    FEAST_OF_ST_FRANCIS,
+    FEAST_OF_ST_GEORGE,
+    TRANSITUS_OF_ST_FRANCIS,
+    advent_sunday
+)
+
+# Local constants.
+ANCHOR_FIXED = "fixed"
+ANCHOR_EASTER = "easter"
+ANCHOR_ADVENT = "advent"
+ANCHORS = (ANCHOR_FIXED, ANCHOR_EASTER, ANCHOR_ADVENT)
+
+##################
+# HELPER CLASSES #
+##################
+
+@dataclass(frozen=True)
+class Observance:
+    """
+    A named observance, falling either on a fixed (month, day), or a given
+    number of days after Easter Sunday or Advent Sunday.
+    """
+    name: str
+    anchor: str = ANCHOR_FIXED
+    month_and_day: tuple[int, int]|None = None
+    offset_days: int = 0
+
+    def __post_init__(self):
+        if self.anchor not in ANCHORS:
+            raise LiturgicalCalendarError(f"Bad anchor: {self.anchor}")
+        if self.anchor == ANCHOR_FIXED and self.month_and_day is None:
+            raise LiturgicalCalendarError(
+                f"Fixed observance {self.name} needs a month and day"
+            )
+
+    def get_ordinal(self, year: int) -> int:
+        """ Get the ordinal of the date on which this falls in a given year. """
+        if self.anchor == ANCHOR_EASTER:
+            return get_easter_ordinal(year)+self.offset_days
+        if self.anchor == ANCHOR_ADVENT:
+            return get_advent_sunday_ordinal(year)+self.offset_days
+        return date(year, *self.month_and_day).toordinal()+self.offset_days
+
+class LiturgicalCalendarError(Exception):
+    """ A custom exception. """
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+@lru_cache
+def get_easter_ordinal(year: int) -> int:
+    """ Get the ordinal of Easter Sunday in a given year. """
+    return easter(year).toordinal()
+
+@lru_cache
+def get_advent_sunday_ordinal(year: int) -> int:
+    """ Get the ordinal of Advent Sunday in a given year. """
+    return advent_sunday(year).toordinal()
+
+def get_reach_in_years(observances: list[Observance]) -> int:
+    """
+    Get how many years either side of a given year the anchors of the
+    observances falling in it may lie.
+    """
+    max_offset = max(
+        (abs(observance.offset_days) for observance in observances), default=0
+    )
+    result = max_offset//365+1
+    return result
+
+def get_default_observances() -> list[Observance]:
+    """
+    Get the observances given by LiturgicalSummary, in the same order, so that
+    later entries take precedence in the same way.
+    """
+    result = [
+        Observance("Advent Sunday", ANCHOR_ADVENT),
+        Observance("Gaudete Sunday", ANCHOR_ADVENT, offset_days=14),
+        # This matches EasterDDates, which counts back from Mothering Sunday.
+        Observance("Ash Wednesday", ANCHOR_EASTER, offset_days=-53),
+        Observance("Mothering Sunday", ANCHOR_EASTER, offset_days=-21),
+        Observance("Palm Sunday", ANCHOR_EASTER, offset_days=-7),
+        Observance("Maundy Thursday", ANCHOR_EASTER, offset_days=-3),
+        Observance("Good Friday", ANCHOR_EASTER, offset_days=-2),
+        Observance("Easter Sunday", ANCHOR_EASTER),
+        Observance("Ascension", ANCHOR_EASTER, offset_days=39),
+        Observance("Pentecost", ANCHOR_EASTER, offset_days=49),
+        Observance("Christmas", month_and_day=CHRISTMAS),
+        Observance("Epiphany", month_and_day=EPIPHANY),
+        Observance("Feast of St George", month_and_day=FEAST_OF_ST_GEORGE),
+        Observance(
+            "Transitus of St Francis", month_and_day=TRANSITUS_OF_ST_FRANCIS
+        ),
+        Observance("Feast of St Francis", month_and_day=FEAST_OF_ST_FRANCIS),
+        Observance("Eve of St Crispin", month_and_day=EVE_OF_ST_CRISPIN),
+        Observance("Feast of St Crispin", month_and_day=FEAST_OF_ST_CRISPIN),
+        Observance("All Saints' Day", month_and_day=ALL_SAINTS_DAY)
+    ]
+    return result
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class LiturgicalCalendar:
+    """ The class in question. """
+    observances: list[Observance] = \
+        field(default_factory=get_default_observances)
+    # Keyed by the Gregorian year in which each observance falls, which, for
+    # a large enough offset, needn't be the year of its anchor.
+    year_lookups: dict[int, dict[int, list[str]]] = \
+        field(init=False, default_factory=dict)
+    principal_lookups: dict[int, dict[int, str]] = \
+        field(init=False, default_factory=dict)
+
+    def register(self, observance: Observance):
+        """ Add an observance, replacing any other of the same name. """
+        self.observances = [
+            existing for existing in self.observances
+            if existing.name != observance.name
+        ]
+        self.observances.append(observance)
+        self.forget_lookups()
+
+    def unregister(self, name: str):
+        """ Remove the observance of a given name. """
+        remaining = [
+            existing for existing in self.observances if existing.name != name
+        ]
+        if len(remaining) == len(self.observances):
+            raise LiturgicalCalendarError(f"No such observance: {name}")
+        self.observances = remaining
+        self.forget_lookups()
+
+    def forget_lookups(self):
+        """ Ronseal. """
+        self.year_lookups = {}
+        self.principal_lookups = {}
+
+    def get_names_by_ordinal(self, year: int) -> dict[int, list[str]]:
+        """
+        Get every observance falling in a given Gregorian year, indexed by
+        date ordinal, those sharing a date in order of registration.
+        """
+        result = self.year_lookups.get(year)
+        if result is None:
+            first_ordinal = date(year, 1, 1).toordinal()
+            last_ordinal = date(year, 12, 31).toordinal()
+            reach = get_reach_in_years(self.observances)
+            anchor_years = range(
+                max(year-reach, MINYEAR), min(year+reach, MAXYEAR)+1
+            )
+            result = {}
+            for observance in self.observances:
+                for anchor_year in anchor_years:
+                    ordinal = observance.get_ordinal(anchor_year)
+                    if first_ordinal <= ordinal <= last_ordinal:
+                        result.setdefault(ordinal, []).append(observance.name)
+            self.year_lookups[year] = result
+        return result
+
+    def get_ordinal_lookup(self, year: int) -> dict[int, str]:
+        """
+        Get the principal observance on each date in a given Gregorian year,
+        i.e. the last registered, as in LiturgicalSummary, for displays with
+        room for only one name per day.
+        """
+        result = self.principal_lookups.get(year)
+        if result is None:
+            result = {
+                ordinal: names[-1]
+                for ordinal, names in self.get_names_by_ordinal(year).items()
+            }
+            self.principal_lookups[year] = result
+        return result
+
+    def get_observances(self, greg: date) -> list[str]:
+        """ Get every observance falling on a given date. """
+        names = self.get_names_by_ordinal(greg.year).get(greg.toordinal(), [])
+        return list(names)
+
+    def observances_between(
+        self,
+        start: date,
+        end: date
+    ) -> list[tuple[date, str]]:
+        """
+        Get the observances from the start (inclusive) to the end (exclusive),
+        in order of date.
+        """
+        start_ordinal = start.toordinal()
+        end_ordinal = end.toordinal()
+        result = []
+        for year in range(start.year, end.year+1):
+            lookup = self.get_names_by_ordinal(year)
+            for ordinal, names in sorted(lookup.items()):
+                if start_ordinal <= ordinal < end_ordinal:
+                    greg = date.fromordinal(ordinal)
+                    result.extend((greg, name) for name in names)
+        return result
+
+# The calendar which the rest of the package consults.
+DEFAULT_CALENDAR = LiturgicalCalendar()
@@ -0,0 +1,98 @@
+"""
+This code defines a class which cross-indexes the liturgical observances in a
+range of Gregorian years with their Cyprian equivalents, so that either can be
+looked up from the other.
+"""
+
+# Standard imports.
+from dataclasses import dataclass, field
+from datetime import date
+
+# Local imports.
+from .cyprian_date import CyprianDate
+from .liturgical_calendar import DEFAULT_CALENDAR, LiturgicalCalendar
+from .year_structure import locate_greg
+
+##################
+# HELPER CLASSES #
+##################
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """ An observance, with its Gregorian and Cyprian dates. """
+    greg: date
+    name: str
+    cyprian: CyprianDate
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class LiturgicalIndex:
+    """ The class in question. """
+    first_greg_year: int
+    last_greg_year: int
+    calendar: LiturgicalCalendar|None = None
+    entries: list[IndexEntry]|None = field(init=False, default=None)
+    by_name: dict[str, list[IndexEntry]]|None = \
+        field(init=False, default=None)
+    by_cyprian: dict[tuple[int, int, int], list[IndexEntry]]|None = \
+        field(init=False, default=None)
+    by_cyprian_month_and_day: dict[tuple[int, int], list[IndexEntry]]|None = \
+        field(init=False, default=None)
+
+    def __post_init__(self):
+        if self.calendar is None:
+            self.calendar = DEFAULT_CALENDAR
+        self.fill_entries()
+        self.fill_indices()
+
+    def fill_entries(self):
+        """
+        Locate each year's observances in the Cyprian calendar, from the
+        structure of the Cyprian year rather than by converting every day.
+        """
+        self.entries = []
+        for year in range(self.first_greg_year, self.last_greg_year+1):
+            lookup = self.calendar.get_names_by_ordinal(year)
+            for ordinal, names in sorted(lookup.items()):
+                greg = date.fromordinal(ordinal)
+                cyprian = CyprianDate(*locate_greg(greg))
+                for name in names:
+                    self.entries.append(IndexEntry(greg, name, cyprian))
+
+    def fill_indices(self):
+        """ Index the entries by name and by Cyprian date. """
+        self.by_name = {}
+        self.by_cyprian = {}
+        self.by_cyprian_month_and_day = {}
+        for entry in self.entries:
+            cyprian = entry.cyprian
+            self.by_name.setdefault(entry.name, []).append(entry)
+            self.by_cyprian.setdefault(
+                (cyprian.year, cyprian.month, cyprian.day), []
+            ).append(entry)
+            self.by_cyprian_month_and_day.setdefault(
+                (cyprian.month, cyprian.day), []
+            ).append(entry)
+
+    def get_cyprian_dates(self, name: str) -> list[CyprianDate]:
+        """ Get the Cyprian date of a given observance in each year. """
+        return [entry.cyprian for entry in self.by_name.get(name, [])]
+
+    def get_observances(self, cyprian: CyprianDate) -> list[str]:
+        """ Get the observances falling on a given Cyprian date. """
+        key = (cyprian.year, cyprian.month, cyprian.day)
+        return [entry.name for entry in self.by_cyprian.get(key, [])]
+
+    def find_by_cyprian_month_and_day(
+        self,
+        month: int,
+        day: int
+    ) -> list[IndexEntry]:
+        """
+        Find the observances falling on a given Cyprian month and day in any
+        year, e.g. on each Cyprian New Year.
+        """
+        return list(self.by_cyprian_month_and_day.get((month, day), []))
@@ -0,0 +1,114 @@
+"""
+This code defines some functions which locate the new moons and equinoxes
+around which the Cyprian calendar is built.
+"""
+
+# Standard imports.
+from datetime import date, datetime, timedelta, timezone, tzinfo
+
+# Non-standard imports.
+import ephem
+
+# Local imports.
+from . import constants
+
+#############
+# FUNCTIONS #
+#############
+
+def new_moon_tomorrow(greg: datetime, zone: tzinfo = timezone.utc) -> bool:
+    """ Determine whether the new moon occurs tomorrow, in a given zone. """
+    next_new_moon = get_next_new_moon(greg)
+    tomorrow = greg+timedelta(days=1)
+    return fall_on_same_day(next_new_moon, tomorrow, zone)
+
+def get_next_new_moon(greg: datetime) -> datetime:
+    """ Get the Gregorian datetime for the next new moon. """
+    ephem_date = ephem.next_new_moon(greg)
+    result = to_datetime(ephem_date)
+    return result
+
+def to_datetime(ephem_date: ephem.Date) -> datetime:
+    """ Convert an ephem date object into a timezone-aware datetime object. """
+    result = ephem_date.datetime()
+    result = result.replace(tzinfo=timezone.utc)
+    return result
+
+def fall_on_same_day(
+    left: datetime,
+    right: datetime,
+    zone: tzinfo = timezone.utc
+) -> bool:
+    """
+    Determine whether two events occur on the same calendar day, as reckoned
+    in a given zone.
+    """
+    if (
+        round_down_to_nearest_day(left, zone) ==
+        round_down_to_nearest_day(right, zone)
+    ):
+        return True
+    return False
+
+def round_down_to_nearest_day(
+    greg: datetime|date,
+    zone: tzinfo = timezone.utc
+) -> datetime:
+    """
+    Get midnight, in a given zone, at the start of the day on which a given
+    instant falls there. Naive datetimes are taken to be in that zone already.
+    """
+    if isinstance(greg, datetime) and greg.tzinfo is not None:
+        greg = greg.astimezone(zone)
+    result = datetime(greg.year, greg.month, greg.day, tzinfo=zone)
+    return result
+
+def get_zone(greg: datetime) -> tzinfo:
+    """
+    Get the zone in which a given datetime is expressed, taking naive datetimes
+    to be in UTC.
+    """
+    if greg.tzinfo is None:
+        return timezone.utc
+    return greg.tzinfo
+
+def get_vernal_equinox(year: int) -> datetime:
+    """ Ronseal. """
+    ephem_date = ephem.next_vernal_equinox(str(year))
+    result = to_datetime(ephem_date)
+    return result
+
+def tomorrow_is_on_or_after_vernal_equinox(
+    greg: datetime,
+    zone: tzinfo = timezone.utc
+) -> bool:
+    """ Ronseal. """
+    tomorrow = greg+timedelta(days=1)
+    rounded_equinox = \
+        round_down_to_nearest_day(get_vernal_equinox(greg.year), zone)
+    if tomorrow >= rounded_equinox:
+        return True
+    return False
+
+def get_cyprian_new_year(year: int, zone: tzinfo = timezone.utc) -> datetime:
+    """
+    Given the Gregorian year, calculate the Gregorian equivalent of the Cyprian
+    New Year falling within that calendar year, as reckoned in a given zone.
+    Like CyprianDate.advance_one_month, this compares days, not instants, so a
+    new moon earlier on the day of the equinox begins the year.
+    """
+    rounded_equinox = round_down_to_nearest_day(get_vernal_equinox(year), zone)
+    ephem_date = ephem.next_new_moon(rounded_equinox)
+    unrounded = to_datetime(ephem_date)
+    result = round_down_to_nearest_day(unrounded, zone)
+    return result
+
+def get_cyprian_year_beginning_with_greg_year(greg_year: int) -> int:
+    """ Get the Cyprian year which begins with the given Gregorian year. """
+    result = greg_year-constants.CYPRIAN_GREGORIAN_YEAR_DIFF
+    return result
+
+def get_greg_year_ending_with_cyprian_year(cyprian_year: int) -> int:
+    """ Get the Gregorian year which ends with the given Cyprian year. """
+    result = cyprian_year+constants.CYPRIAN_GREGORIAN_YEAR_DIFF
+    return result
@@ -0,0 +1,435 @@
+"""
+This code defines an optional integration with pandas: a "cyprian" extension
+dtype, whose array stores each Cyprian date as a packed integer, and a
+".cyprian" accessor on Series of datetimes.
+
+Both convert through a table of packed dates indexed by day, built a year at a
+time from the structure of each Cyprian year, so that a whole Series is
+converted by a single vectorised lookup, rather than by a call to
+convert_date per row.
+
+Importing this module registers both with pandas.
+"""
+
+# Standard imports.
+from dataclasses import dataclass, field
+from datetime import date, timezone, tzinfo
+from typing import Any, Sequence
+
+# Non-standard imports.
+try:
+    import numpy
+    import pandas
+    from pandas.api.extensions import (
+        ExtensionArray,
+        ExtensionDtype,
+        register_extension_dtype,
+        register_series_accessor
+    )
+except ImportError as error:  # pandas is an optional dependency.
+    raise ImportError("The pandas integration requires pandas") from error
+
+# Local imports.
+from . import constants
+from .cyprian_date import CyprianDate
+from .cyprian_format import compile_format
+from .year_structure import compute_year_structure, find_cyprian_year
+
+# Local constants.
+PACK_YEAR = 10000
+PACK_MONTH = 100
+NA_CODE = numpy.iinfo(numpy.int64).min
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+DTYPE_NAME = "cyprian"
+ACCESSOR_NAME = "cyprian"
+DAY_TABLES: dict[tzinfo, "DayTable"] = {}
+
+##################
+# HELPER CLASSES #
+##################
+
+@dataclass
+class DayTable:
+    """
+    The packed Cyprian date of each day in a span, indexed by the day's
+    Gregorian ordinal, which grows, a Cyprian year at a time, as needed.
+    """
+    zone: tzinfo = timezone.utc
+    # (First ordinal, first Cyprian year, last Cyprian year, codes), held as
+    # one tuple so that it can be swapped atomically, since tables are shared
+    # between threads.
+    table: tuple[int, int, int, numpy.ndarray]|None = \
+        field(init=False, default=None)
+
+    def ensure_covers(
+        self,
+        min_ordinal: int,
+        max_ordinal: int
+    ) -> tuple[int, int, int, numpy.ndarray]:
+        """ Get a table which covers the given days. """
+        first_year = \
+            find_cyprian_year(date.fromordinal(min_ordinal), self.zone)
+        last_year = find_cyprian_year(date.fromordinal(max_ordinal), self.zone)
+        return self.ensure_covers_years(first_year, last_year)
+
+    def ensure_covers_years(
+        self,
+        first_cyprian_year: int,
+        last_cyprian_year: int
+    ) -> tuple[int, int, int, numpy.ndarray]:
+        """ Get a table which covers the given Cyprian years (inclusive). """
+        table = self.table
+        if table is not None:
+            _, first_year, last_year, _ = table
+            if (
+                first_cyprian_year >= first_year and
+                last_cyprian_year <= last_year
+            ):
+                return table
+            first_cyprian_year = min(first_cyprian_year, first_year)
+            last_cyprian_year = max(last_cyprian_year, last_year)
+        return self.build(first_cyprian_year, last_cyprian_year)
+
+    def build(
+        self,
+        first_cyprian_year: int,
+        last_cyprian_year: int
+    ) -> tuple[int, int, int, numpy.ndarray]:
+        """ (Re)build the table for a range of Cyprian years (inclusive). """
+        chunks = []
+        for year in range(first_cyprian_year, last_cyprian_year+1):
+            year_structure = compute_year_structure(year, self.zone)
+            for month, length in enumerate(year_structure.month_lengths, 1):
+                chunks.append(
+                    pack(year, month, numpy.arange(1, length+1, dtype="int64"))
+                )
+        first_ordinal = \
+            compute_year_structure(first_cyprian_year, self.zone).start\
+            .toordinal()
+        result = (
+            first_ordinal,
+            first_cyprian_year,
+            last_cyprian_year,
+            numpy.concatenate(chunks)
+        )
+        self.table = result
+        return result
+
+    def look_up(self, ordinals: numpy.ndarray) -> numpy.ndarray:
+        """ Get the packed Cyprian date of each of the given days. """
+        if not len(ordinals):
+            return numpy.empty(0, dtype="int64")
+        first_ordinal, _, _, codes = \
+            self.ensure_covers(int(ordinals.min()), int(ordinals.max()))
+        return codes[ordinals-first_ordinal]
+
+    def look_up_ordinals(self, codes: numpy.ndarray) -> numpy.ndarray:
+        """
+        Get the Gregorian ordinal of each of the given packed dates, which
+        works because packed dates, like days, only ever increase.
+        """
+        if not len(codes):
+            return numpy.empty(0, dtype="int64")
+        years = codes//PACK_YEAR
+        first_ordinal, _, _, table_codes = \
+            self.ensure_covers_years(int(years.min()), int(years.max()))
+        indices = numpy.searchsorted(table_codes, codes)
+        indices = numpy.minimum(indices, len(table_codes)-1)
+        if (table_codes[indices] != codes).any():
+            raise PandasSupportError("No such Cyprian date in the array")
+        return indices+first_ordinal
+
+@register_extension_dtype
+class CyprianDateDtype(ExtensionDtype):
+    """ The dtype of an array of Cyprian dates. """
+    name = DTYPE_NAME
+    type = CyprianDate
+    kind = "O"
+    na_value = pandas.NA
+
+    @classmethod
+    def construct_array_type(cls):
+        return CyprianDateArray
+
+class CyprianDateArray(ExtensionArray):
+    """ An array of Cyprian dates, each stored as a packed integer. """
+
+    def __init__(self, codes: numpy.ndarray, mask: numpy.ndarray|None = None):
+        self.codes = numpy.asarray(codes, dtype="int64")
+        if mask is None:
+            mask = self.codes == NA_CODE
+        self.mask = numpy.asarray(mask, dtype=bool)
+        self.codes[self.mask] = NA_CODE
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        if pandas.api.types.is_datetime64_any_dtype(scalars):
+            return cls.from_datetimes(pandas.Series(scalars))
+        codes = numpy.full(len(scalars), NA_CODE, dtype="int64")
+        for index, scalar in enumerate(scalars):
+            if isinstance(scalar, str):
+                scalar = CyprianDate.strptime(scalar)
+            if isinstance(scalar, CyprianDate):
+                codes[index] = pack(scalar.year, scalar.month, scalar.day)
+            elif not pandas.isna(scalar):
+                raise PandasSupportError(f"Not a Cyprian date: {scalar}")
+        return cls(codes)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values)
+
+    @classmethod
+    def from_datetimes(
+        cls,
+        series: pandas.Series,
+        zone: tzinfo|None = None
+    ) -> "CyprianDateArray":
+        """
+        Convert a Series of datetimes, reckoning days in a given zone, or else
+        in that of the Series, or else in UTC.
+        """
+        zone = zone or series.dt.tz or timezone.utc
+        ordinals, mask = get_day_ordinals(series, zone)
+        codes = numpy.full(len(series), NA_CODE, dtype="int64")
+        codes[~mask] = get_day_table(zone).look_up(ordinals[~mask])
+        return cls(codes, mask)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(
+            numpy.concatenate([array.codes for array in to_concat]),
+            numpy.concatenate([array.mask for array in to_concat])
+        )
+
+    @property
+    def dtype(self) -> CyprianDateDtype:
+        return CyprianDateDtype()
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes+self.mask.nbytes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, item) -> Any:
+        if isinstance(item, (int, numpy.integer)):
+            if self.mask[item]:
+                return pandas.NA
+            return CyprianDate(*unpack(int(self.codes[item])))
+        item = pandas.api.indexers.check_array_indexer(self, item)
+        return type(self)(self.codes[item], self.mask[item])
+
+    def __eq__(self, other) -> numpy.ndarray:
+        if isinstance(other, CyprianDate):
+            other = type(self)._from_sequence([other]*len(self))
+        if not isinstance(other, CyprianDateArray):
+            return NotImplemented
+        return (self.codes == other.codes) & ~self.mask & ~other.mask
+
+    def isna(self) -> numpy.ndarray:
+        return self.mask.copy()
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        if allow_fill and not pandas.isna(fill_value):
+            fill_value = pack(fill_value.year, fill_value.month, fill_value.day)
+        else:
+            fill_value = NA_CODE
+        codes = \
+            pandas.api.extensions.take(
+                self.codes,
+                indices,
+                allow_fill=allow_fill,
+                fill_value=fill_value
+            )
+        return type(self)(codes)
+
+    def copy(self) -> "CyprianDateArray":
+        return type(self)(self.codes.copy(), self.mask.copy())
+
+    def unique(self) -> "CyprianDateArray":
+        # CyprianDate isn't hashable, so compare the codes instead.
+        return type(self)(pandas.unique(self.codes))
+
+    def _values_for_factorize(self) -> tuple[numpy.ndarray, int]:
+        return self.codes.copy(), NA_CODE
+
+    def _values_for_argsort(self) -> numpy.ndarray:
+        return self.codes
+
+    @property
+    def year(self) -> pandas.api.extensions.ExtensionArray:
+        """ Ronseal. """
+        return make_int_array(self.codes//PACK_YEAR, self.mask)
+
+    @property
+    def month(self) -> pandas.api.extensions.ExtensionArray:
+        """ Ronseal. """
+        return make_int_array(self.codes%PACK_YEAR//PACK_MONTH, self.mask)
+
+    @property
+    def day(self) -> pandas.api.extensions.ExtensionArray:
+        """ Ronseal. """
+        return make_int_array(self.codes%PACK_MONTH, self.mask)
+
+    @property
+    def month_key(self) -> pandas.api.extensions.ExtensionArray:
+        """
+        Get a key which sorts, and groups, by Cyprian year and month, e.g.
+        1101 for Primilis T11.
+        """
+        return make_int_array(self.codes//PACK_MONTH, self.mask)
+
+    def strftime(
+        self,
+        pattern: str = constants.DEFAULT_FORMAT
+    ) -> pandas.api.extensions.ExtensionArray:
+        """ Render each date, formatting each distinct date only once. """
+        cyprian_format = compile_format(pattern)
+        uniques, inverse = numpy.unique(self.codes, return_inverse=True)
+        rendered = numpy.array(
+            [
+                None if code == NA_CODE else
+                cyprian_format.format(*unpack(int(code)))
+                for code in uniques
+            ],
+            dtype=object
+        )
+        return pandas.array(rendered[inverse], dtype="string")
+
+    def to_greg(self, zone: tzinfo = timezone.utc) -> pandas.DatetimeIndex:
+        """ Get midnight, in a given zone, on each of these dates. """
+        ordinals = numpy.zeros(len(self), dtype="int64")
+        ordinals[~self.mask] = \
+            get_day_table(zone).look_up_ordinals(self.codes[~self.mask])
+        days = (ordinals-EPOCH_ORDINAL).astype("datetime64[D]")
+        days = days.astype("datetime64[s]")
+        days[self.mask] = numpy.datetime64("NaT")
+        return pandas.DatetimeIndex(days).tz_localize(zone)
+
+@register_series_accessor(ACCESSOR_NAME)
+class CyprianAccessor:
+    """
+    Gives the Cyprian dates of a Series of datetimes, reckoning days in the
+    Series' zone, or else in UTC, or of a Series of Cyprian dates.
+    """
+
+    def __init__(self, series: pandas.Series):
+        if isinstance(series.dtype, CyprianDateDtype):
+            self.array = series.array
+        elif pandas.api.types.is_datetime64_any_dtype(series):
+            self.array = CyprianDateArray.from_datetimes(series)
+        else:
+            raise AttributeError(
+                f"The .{ACCESSOR_NAME} accessor needs datetimes, "+
+                f"not {series.dtype}"
+            )
+        self.series = series
+
+    def wrap(self, values: Sequence, name: str|None = None) -> pandas.Series:
+        """ Put some values into a Series like this one. """
+        return pandas.Series(
+            values, index=self.series.index, name=name or self.series.name
+        )
+
+    def to_series(self) -> pandas.Series:
+        """ Get the Cyprian dates as a Series of the "cyprian" dtype. """
+        return self.wrap(self.array)
+
+    @property
+    def year(self) -> pandas.Series:
+        """ Ronseal. """
+        return self.wrap(self.array.year)
+
+    @property
+    def month(self) -> pandas.Series:
+        """ Ronseal. """
+        return self.wrap(self.array.month)
+
+    @property
+    def day(self) -> pandas.Series:
+        """ Ronseal. """
+        return self.wrap(self.array.day)
+
+    @property
+    def month_key(self) -> pandas.Series:
+        """ Get a key by which to group by Cyprian month. """
+        return self.wrap(self.array.month_key, "cyprian_month")
+
+    def strftime(
+        self,
+        pattern: str = constants.DEFAULT_FORMAT
+    ) -> pandas.Series:
+        """ Render each date according to a given pattern. """
+        return self.wrap(self.array.strftime(pattern))
+
+    # Defined last, since it shadows the built-in within the class body.
+    @property
+    def str(self) -> pandas.Series:
+        """ Render each date in the default format. """
+        return self.strftime()
+
+class PandasSupportError(Exception):
+    """ A custom exception. """
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def pack(year: int, month: int, day: Any) -> Any:
+    """ Pack a Cyprian date, or an array of days, into integers. """
+    return year*PACK_YEAR+month*PACK_MONTH+day
+
+def unpack(code: int) -> tuple[int, int, int]:
+    """ Unpack a Cyprian date from an integer. """
+    return code//PACK_YEAR, code%PACK_YEAR//PACK_MONTH, code%PACK_MONTH
+
+def get_day_table(zone: tzinfo = timezone.utc) -> DayTable:
+    """ Get the shared table for a given zone, creating it if need be. """
+    result = DAY_TABLES.get(zone)
+    if result is None:
+        result = DAY_TABLES.setdefault(zone, DayTable(zone))
+    return result
+
+def get_day_ordinals(
+    series: pandas.Series,
+    zone: tzinfo
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Get the Gregorian ordinal of the day, in a given zone, on which each
+    datetime falls, along with a mask of those which are missing. Naive
+    datetimes are taken to be in that zone already.
+    """
+    if series.dt.tz is not None:
+        series = series.dt.tz_convert(zone).dt.tz_localize(None)
+    mask = series.isna().to_numpy()
+    days = series.dt.floor("D").to_numpy(dtype="datetime64[D]")
+    ordinals = days.astype("int64")+EPOCH_ORDINAL
+    ordinals[mask] = EPOCH_ORDINAL
+    return ordinals, mask
+
+def make_int_array(
+    values: numpy.ndarray,
+    mask: numpy.ndarray
+) -> pandas.api.extensions.ExtensionArray:
+    """ Make a nullable integer array. """
+    return pandas.arrays.IntegerArray(values.astype("int64"), mask.copy())
+
+def convert_series(
+    series: pandas.Series,
+    zone: tzinfo|None = None
+) -> pandas.Series:
+    """
+    Convert a Series of datetimes to a Series of Cyprian dates, reckoning days
+    in a given zone, or else in that of the Series, or else in UTC.
+    """
+    result = \
+        pandas.Series(
+            CyprianDateArray.from_datetimes(series, zone),
+            index=series.index,
+            name=series.name
+        )
+    return result
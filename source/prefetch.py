@@ -0,0 +1,159 @@
+"""
+This code defines a class which keeps the cache warm on a background thread,
+so that it always covers the current Cyprian year, and a given number of years
+either side, before any request needs them, in each zone in which the
+application converts dates, since each zone has a cache of its own.
+"""
+
+# Standard imports.
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, tzinfo
+from threading import Event, Thread
+from typing import Callable
+
+# Local imports.
+from .cache_config import CacheConfig, get_cache_config
+from .concordance import Concordance, ConcordanceError
+from .cyprian_date import CyprianDate
+from .year_structure import find_cyprian_year
+
+# Local constants.
+DEFAULT_YEARS_EITHER_SIDE = 1
+DEFAULT_INTERVAL = 60*60  # In seconds.
+THREAD_NAME = "cyprian-datetime-prefetcher"
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def utc_now() -> datetime:
+    """ Ronseal. """
+    return datetime.now(timezone.utc)
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class CachePrefetcher:
+    """ The class in question. """
+    years_either_side: int = DEFAULT_YEARS_EITHER_SIDE
+    interval: float = DEFAULT_INTERVAL
+    path_to_cache_db: str|None = None
+    clock: Callable[[], datetime] = utc_now
+    config: CacheConfig|None = None
+    zones: tuple[tzinfo, ...] = (timezone.utc,)
+    ready: Event = field(init=False, default_factory=Event)
+    stopping: Event = field(init=False, default_factory=Event)
+    thread: Thread|None = field(init=False, default=None)
+    last_error: Exception|None = field(init=False, default=None)
+
+    def __post_init__(self):
+        # The thread won't inherit this context, so settle the config now.
+        if self.config is None:
+            self.config = get_cache_config()
+        # Otherwise each pass would evict years which the last one wrote.
+        max_cyprian_years = self.config.max_cyprian_years
+        window = 2*self.years_either_side+1
+        if max_cyprian_years is not None and window > max_cyprian_years:
+            raise CachePrefetcherError(
+                f"Prefetching {window} years overflows a cache limited to "+
+                f"{max_cyprian_years}"
+            )
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """ Start warming the cache on a background thread. """
+        if self.thread and self.thread.is_alive():
+            return
+        self.stopping.clear()
+        self.thread = Thread(target=self.run, name=THREAD_NAME, daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: float|None = None):
+        """ Ask the background thread to finish, and wait for it. """
+        self.stopping.set()
+        if self.thread:
+            self.thread.join(timeout)
+
+    def run(self):
+        """ Warm the cache, then check it again every so often. """
+        while not self.stopping.is_set():
+            try:
+                self.warm()
+            except Exception as error:  # Keep going; the next pass may work.
+                self.last_error = error
+            self.stopping.wait(self.interval)
+
+    def warm(self):
+        """
+        Make sure that the cache for each zone covers the current Cyprian year,
+        and the given number of years either side.
+        """
+        for zone in self.zones:
+            self.warm_zone(zone)
+        self.last_error = None
+        self.ready.set()
+
+    def warm_zone(self, zone: tzinfo):
+        """ Warm the cache for a given zone. """
+        current_year = find_cyprian_year(self.clock(), zone)
+        earliest = CyprianDate(current_year-self.years_either_side, 1, 1)
+        latest = CyprianDate(current_year+self.years_either_side, 1, 1)
+        concordance = \
+            Concordance(
+                path_to_cache_db=self.path_to_cache_db,
+                zone=zone,
+                config=self.config
+            )
+        if (
+            concordance.should_write_first(cyprian=earliest) and
+            not self.is_full_from(concordance, current_year)
+        ):
+            concordance.write(new_cyprian_year=earliest.year+1)
+        if concordance.should_extend_first(cyprian=latest):
+            concordance.extend(cyprian=latest)
+        concordance.close_connection()
+
+    def is_full_from(self, concordance: Concordance, cyprian_year: int) -> bool:
+        """
+        Decide whether the cache covers a given year onwards, as many years as
+        it may hold, in which case any earlier years it lacks were evicted to
+        make way for later ones, and aren't worth a rebuild to restore.
+        """
+        max_cyprian_years = self.config.max_cyprian_years
+        if max_cyprian_years is None:
+            return False
+        try:
+            concordance.establish_connection()
+            span = concordance.read_span()
+        except (sqlite3.OperationalError, ConcordanceError):
+            return False
+        result = (
+            span.first_cyprian_year <= cyprian_year and
+            span.cursor_cyprian.year-span.first_cyprian_year >=
+            max_cyprian_years
+        )
+        return result
+
+    def is_ready(self) -> bool:
+        """ Determine whether the cache has been warmed at least once. """
+        return self.ready.is_set()
+
+    def wait_until_ready(self, timeout: float|None = None) -> bool:
+        """ Block until the cache has been warmed, or the timeout expires. """
+        return self.ready.wait(timeout)
+
+##################
+# HELPER CLASSES #
+##################
+
+class CachePrefetcherError(Exception):
+    """ A custom exception. """
@@ -0,0 +1,344 @@
+"""
+This code defines a profiler for the conversion hot paths, which, while
+active, records how long each phase takes, how often ephem is called, how many
+sqlite statements are run and how long they take, and how many more memory
+blocks are allocated at the end than at the start, optionally along with
+cProfile statistics and sampled stacks for a flame graph.
+"""
+
+# Standard imports.
+import argparse
+import cProfile
+import pstats
+import sqlite3
+import sys
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from threading import Event, Thread, get_ident
+from time import perf_counter
+from typing import Callable, Iterator
+
+# Non-standard imports.
+import ephem
+
+# Local constants.
+EPHEM_FUNCTIONS = (
+    "next_new_moon",
+    "previous_new_moon",
+    "next_vernal_equinox",
+    "previous_vernal_equinox"
+)
+DEFAULT_SAMPLE_INTERVAL = 0.001  # In seconds.
+ACTIVE_PROFILER = ContextVar("cyprian_datetime_profiler", default=None)
+
+##################
+# HELPER CLASSES #
+##################
+
+@dataclass
+class Tally:
+    """ How often something happened, and how long it took in all. """
+    count: int = 0
+    seconds: float = 0.0
+
+@dataclass
+class ProfileReport:
+    """ The findings of a profiler. """
+    wall_seconds: float = 0.0
+    # Phases nest, e.g. "walk" within "write", so their times overlap.
+    phases: dict[str, Tally] = field(default_factory=dict)
+    ephem_calls: dict[str, int] = field(default_factory=dict)
+    # Keyed by each statement's first keyword, e.g. "SELECT".
+    sql_statements: dict[str, Tally] = field(default_factory=dict)
+    net_allocated_blocks: int = 0
+    stats: pstats.Stats|None = None
+    folded_stacks: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """ Get the report as plain data, e.g. for writing as JSON. """
+        result = {
+            "wall_seconds": self.wall_seconds,
+            "phases": tally_to_dict(self.phases),
+            "ephem_calls": dict(self.ephem_calls),
+            "sql_statements": tally_to_dict(self.sql_statements),
+            "net_allocated_blocks": self.net_allocated_blocks
+        }
+        return result
+
+    def dump_stats(self, path: str):
+        """ Write the cProfile statistics in pstats format. """
+        if self.stats is None:
+            raise ProfilingError("No cProfile statistics were collected")
+        self.stats.dump_stats(path)
+
+    def write_folded_stacks(self, path: str):
+        """
+        Write the sampled stacks in the folded format which flame graph tools
+        read, i.e. one "outer;inner count" line per distinct stack.
+        """
+        with open(path, "w") as folded_file:
+            for stack, count in sorted(self.folded_stacks.items()):
+                folded_file.write(f"{stack} {count}\n")
+
+    def __str__(self) -> str:
+        lines = [f"Wall time: {self.wall_seconds:.6f}s"]
+        for heading, tallies in (
+            ("Phase", self.phases),
+            ("SQL", self.sql_statements)
+        ):
+            for name, tally in sorted(tallies.items()):
+                lines.append(
+                    f"{heading} {name}: {tally.count} in {tally.seconds:.6f}s"
+                )
+        for name, count in sorted(self.ephem_calls.items()):
+            lines.append(f"ephem.{name}: {count}")
+        lines.append(f"Net allocated blocks: {self.net_allocated_blocks}")
+        return "\n".join(lines)
+
+class ProfiledCursor(sqlite3.Cursor):
+    """ A cursor which times each statement it runs. """
+
+    def execute(self, *args, **kwargs):
+        with self.connection.time_sql():
+            return super().execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        with self.connection.time_sql():
+            return super().executemany(*args, **kwargs)
+
+    def executescript(self, *args, **kwargs):
+        with self.connection.time_sql():
+            return super().executescript(*args, **kwargs)
+
+class ProfiledConnection(sqlite3.Connection):
+    """
+    A connection which counts each statement which sqlite actually runs,
+    through the trace callback, and whose cursors time them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profiler = ACTIVE_PROFILER.get()
+        self.last_statement = None
+        if self.profiler:
+            self.set_trace_callback(self.trace)
+
+    def trace(self, statement: str):
+        """ Record a statement as it begins. """
+        keyword = statement.split(maxsplit=1)[0].upper() if statement else ""
+        self.last_statement = keyword
+        self.profiler.get_tally(self.profiler.report.sql_statements, keyword)
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    def time_sql(self) -> "SqlTimer":
+        """ Ronseal. """
+        return SqlTimer(self)
+
+class SqlTimer:
+    """ Charges the time taken by a statement to its keyword's tally. """
+
+    def __init__(self, connection: ProfiledConnection):
+        self.connection = connection
+        self.start = None
+
+    def __enter__(self):
+        self.connection.last_statement = None
+        self.start = perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback_obj):
+        profiler = self.connection.profiler
+        keyword = self.connection.last_statement
+        if profiler and keyword is not None:
+            tally = profiler.report.sql_statements[keyword]
+            tally.seconds += perf_counter()-self.start
+
+class ProfilingError(Exception):
+    """ A custom exception. """
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass
+class ConversionProfiler:
+    """ The class in question. """
+    use_cprofile: bool = False
+    sample_stacks: bool = False
+    sample_interval: float = DEFAULT_SAMPLE_INTERVAL
+    report: ProfileReport = field(init=False, default_factory=ProfileReport)
+    token: object = field(init=False, default=None)
+    originals: dict[str, Callable] = field(init=False, default_factory=dict)
+    cprofile: cProfile.Profile|None = field(init=False, default=None)
+    sampler: Thread|None = field(init=False, default=None)
+    sampling_done: Event = field(init=False, default_factory=Event)
+    start: float|None = field(init=False, default=None)
+    start_net_blocks: int = field(init=False, default=0)
+
+    def __enter__(self):
+        self.token = ACTIVE_PROFILER.set(self)
+        self.patch_ephem()
+        if self.sample_stacks:
+            self.start_sampling(get_ident())
+        if self.use_cprofile:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        self.start_net_blocks = sys.getallocatedblocks()
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback_obj):
+        self.report.wall_seconds = perf_counter()-self.start
+        self.report.net_allocated_blocks = \
+            sys.getallocatedblocks()-self.start_net_blocks
+        if self.cprofile:
+            self.cprofile.disable()
+            self.report.stats = pstats.Stats(self.cprofile)
+        if self.sampler:
+            self.sampling_done.set()
+            self.sampler.join()
+        self.unpatch_ephem()
+        ACTIVE_PROFILER.reset(self.token)
+
+    def get_tally(self, tallies: dict[str, Tally], name: str) -> Tally:
+        """ Get, creating if need be, a given tally, and count one more. """
+        result = tallies.setdefault(name, Tally())
+        result.count += 1
+        return result
+
+    def patch_ephem(self):
+        """ Count each call to ephem's lunar and solar functions. """
+        for name in EPHEM_FUNCTIONS:
+            original = getattr(ephem, name)
+            self.originals[name] = original
+            self.report.ephem_calls[name] = 0
+            setattr(ephem, name, self.make_counter(name, original))
+
+    def make_counter(self, name: str, original: Callable) -> Callable:
+        """ Wrap a function so that each call to it is counted. """
+        @wraps(original)
+        def counter(*args, **kwargs):
+            self.report.ephem_calls[name] += 1
+            return original(*args, **kwargs)
+        return counter
+
+    def unpatch_ephem(self):
+        """ Restore ephem's own functions. """
+        for name, original in self.originals.items():
+            setattr(ephem, name, original)
+        self.originals.clear()
+
+    def start_sampling(self, thread_id: int):
+        """ Sample the given thread's stack, at intervals, on another. """
+        self.sampling_done.clear()
+        self.sampler = \
+            Thread(target=self.sample, args=(thread_id,), daemon=True)
+        self.sampler.start()
+
+    def sample(self, thread_id: int):
+        """ Record the given thread's stack until told to stop. """
+        while not self.sampling_done.wait(self.sample_interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+            stack = ";".join(
+                f"{summary.name} ({summary.filename}:{summary.lineno})"
+                for summary in traceback.extract_stack(frame)
+            )
+            self.report.folded_stacks[stack] = \
+                self.report.folded_stacks.get(stack, 0)+1
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def profile_phase(name: str) -> Callable:
+    """
+    Decorate a function so that, while a profiler is active, each call to it
+    is timed as a given phase; otherwise, it costs only a lookup.
+    """
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            profiler = ACTIVE_PROFILER.get()
+            if profiler is None:
+                return function(*args, **kwargs)
+            tally = profiler.get_tally(profiler.report.phases, name)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                tally.seconds += perf_counter()-start
+        return wrapper
+    return decorator
+
+def get_connection_class() -> type[sqlite3.Connection]:
+    """
+    Get the class of connection to create, i.e. a profiled one only while a
+    profiler is active.
+    """
+    if ACTIVE_PROFILER.get() is None:
+        return sqlite3.Connection
+    return ProfiledConnection
+
+def add_profiling_arguments(parser: argparse.ArgumentParser):
+    """ Add the profiling flags to a script's command-line interface. """
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        dest="profile",
+        help="Print a profile of the conversion to stderr"
+    )
+    parser.add_argument(
+        "--profile-stats",
+        default=None,
+        dest="path_to_profile_stats",
+        help="Also write cProfile statistics, in pstats format, to this path"
+    )
+    parser.add_argument(
+        "--flamegraph",
+        default=None,
+        dest="path_to_folded_stacks",
+        help="Also write sampled stacks, in folded format, to this path"
+    )
+
+@contextmanager
+def profile_if_asked(
+    args_obj: argparse.Namespace
+) -> Iterator[ConversionProfiler|None]:
+    """
+    Profile a block if a script's profiling flags ask for it, and then print
+    and write the results as asked.
+    """
+    if not (
+        args_obj.profile or
+        args_obj.path_to_profile_stats or
+        args_obj.path_to_folded_stacks
+    ):
+        yield None
+        return
+    profiler = \
+        ConversionProfiler(
+            use_cprofile=bool(args_obj.path_to_profile_stats),
+            sample_stacks=bool(args_obj.path_to_folded_stacks)
+        )
+    with profiler:
+        yield profiler
+    print(profiler.report, file=sys.stderr)
+    if args_obj.path_to_profile_stats:
+        profiler.report.dump_stats(args_obj.path_to_profile_stats)
+    if args_obj.path_to_folded_stacks:
+        profiler.report.write_folded_stacks(args_obj.path_to_folded_stacks)
+
+def tally_to_dict(tallies: dict[str, Tally]) -> dict[str, dict]:
+    """ Ronseal. """
+    result = {
+        name: { "count": tally.count, "seconds": tally.seconds }
+        for name, tally in tallies.items()
+    }
+    return result
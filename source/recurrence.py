@@ -0,0 +1,226 @@
+"""
+This code defines recurrence rules on the Cyprian calendar, after the fashion
+of dateutil's rrule, e.g. "the 1st of every month" or "the 15th of Intercalaris
+in each leap year", whose occurrences are generated lazily from the structure
+of each year, rather than by converting each candidate day.
+"""
+
+# Standard imports.
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Iterator
+
+# Local imports.
+from . import constants
+from .cyprian_date import CyprianDate
+from .cyprian_datetime import CyprianDateTime
+from .year_structure import YearStructure, compute_year_structure, locate_greg
+
+# Local constants.
+YEARLY = "yearly"
+MONTHLY = "monthly"
+FREQUENCIES = (YEARLY, MONTHLY)
+SYNODIC_MONTH = timedelta(days=29.530588853)
+MAX_MONTH_LENGTH = 30
+
+# A run of months of a given year, in which to look for occurrences.
+Period = tuple[YearStructure, tuple[int, ...]]
+
+##################
+# HELPER CLASSES #
+##################
+
+class RecurrenceError(Exception):
+    """ A custom exception. """
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass(frozen=True)
+class CyprianRule:
+    """ The class in question. """
+    frequency: str
+    start: CyprianDate
+    interval: int = 1
+    days: tuple[int, ...] = (1,)  # Negative days count back from the end.
+    months: tuple[int, ...]|None = None  # Every month, if None.
+    leap_years: bool|None = None  # Only leap, or only common, years.
+    count: int|None = None
+    until: CyprianDate|None = None
+    zone: tzinfo = timezone.utc
+
+    def __post_init__(self):
+        if self.frequency not in FREQUENCIES:
+            raise RecurrenceError(f"Unknown frequency: {self.frequency}")
+        if self.interval < 1:
+            raise RecurrenceError(f"Invalid interval: {self.interval}")
+        year_structure = compute_year_structure(self.start.year, self.zone)
+        if not year_structure.is_valid_date(self.start.month, self.start.day):
+            raise RecurrenceError(f"No such start date: {self.start}")
+        if not self.days or not all(
+            0 < abs(day) <= MAX_MONTH_LENGTH for day in self.days
+        ):
+            raise RecurrenceError(f"Invalid days: {self.days}")
+        if self.months is not None and not (
+            self.months and
+            all(1 <= month <= constants.LEAP_MONTH for month in self.months)
+        ):
+            raise RecurrenceError(f"Invalid months: {self.months}")
+        if (
+            self.leap_years is False and
+            self.months is not None and
+            set(self.months) == {constants.LEAP_MONTH}
+        ):
+            raise RecurrenceError("Only leap years have Intercalaris")
+
+    def __iter__(self) -> Iterator[CyprianDateTime]:
+        return self.iter_occurrences()
+
+    def iter_occurrences(
+        self,
+        greg_from: datetime|None = None
+    ) -> Iterator[CyprianDateTime]:
+        """
+        Yield each occurrence, in order, optionally only those on or after a
+        given instant, skipping straight to it unless they need counting.
+        """
+        if greg_from is not None:
+            greg_from = self.localise(greg_from)
+        skip_to = None if self.count is not None else greg_from
+        start_key = (self.start.year, self.start.month, self.start.day)
+        until_key = None
+        if self.until:
+            until_key = (self.until.year, self.until.month, self.until.day)
+        occurrences = 0
+        for year_structure, months in self.iter_periods(skip_to):
+            year = year_structure.year
+            if until_key and year > until_key[0]:
+                return
+            for month in months:
+                month_start = year_structure.get_month_start(month)
+                for day in self.get_days(year_structure, month):
+                    key = (year, month, day)
+                    if key < start_key:
+                        continue
+                    if until_key and key > until_key:
+                        return
+                    occurrences += 1
+                    if self.count is not None and occurrences > self.count:
+                        return
+                    greg = month_start+timedelta(days=day-1)
+                    if greg_from is not None and greg < greg_from:
+                        continue
+                    yield CyprianDateTime.from_known_dates(
+                        greg, CyprianDate(*key)
+                    )
+
+    def iter_periods(self, skip_to: datetime|None) -> Iterator[Period]:
+        """
+        Yield, from the period in which a given instant falls, or else from
+        the first, each year or month in which occurrences might fall.
+        """
+        if self.frequency == YEARLY:
+            year = self.start.year
+            if skip_to is not None:
+                year_from, _, _ = locate_greg(skip_to, self.zone)
+                year += max(year_from-year, 0)//self.interval*self.interval
+            while True:
+                year_structure = compute_year_structure(year, self.zone)
+                if self.is_wanted_year(year_structure):
+                    months = tuple(
+                        month
+                        for month in range(1, year_structure.number_of_months+1)
+                        if self.months is None or month in self.months
+                    )
+                    yield year_structure, months
+                year += self.interval
+        year, month = self.find_first_month(skip_to)
+        while True:
+            year_structure = compute_year_structure(year, self.zone)
+            if (
+                self.is_wanted_year(year_structure) and
+                (self.months is None or month in self.months)
+            ):
+                yield year_structure, (month,)
+            month += self.interval
+            while month > year_structure.number_of_months:
+                month -= year_structure.number_of_months
+                year += 1
+                year_structure = compute_year_structure(year, self.zone)
+
+    def find_first_month(self, skip_to: datetime|None) -> tuple[int, int]:
+        """
+        Find the year and month of the last period to begin no later than a
+        given instant, by counting lunations, which are months, rather than
+        stepping through every year in between.
+        """
+        if skip_to is None:
+            return self.start.year, self.start.month
+        start_greg = \
+            compute_year_structure(
+                self.start.year, self.zone
+            ).get_month_start(self.start.month)
+        lunations = (skip_to-start_greg)//SYNODIC_MONTH
+        # Step back a period, in case the count of lunations overshoots.
+        periods = max(lunations-1, 0)//self.interval
+        if periods == 0:
+            return self.start.year, self.start.month
+        mid_month = \
+            start_greg+SYNODIC_MONTH*(periods*self.interval)+SYNODIC_MONTH/2
+        year, month, _ = locate_greg(mid_month, self.zone)
+        return year, month
+
+    def is_wanted_year(self, year_structure: YearStructure) -> bool:
+        """ Determine whether a given year passes the leap year filter. """
+        if self.leap_years is None:
+            return True
+        return year_structure.is_leap == self.leap_years
+
+    def get_days(self, year_structure: YearStructure, month: int) -> list[int]:
+        """ Get the days of a given month on which this rule falls. """
+        length = year_structure.get_month_length(month)
+        result = sorted({
+            day if day > 0 else length+1+day
+            for day in self.days
+            if abs(day) <= length
+        })
+        return result
+
+    def after(
+        self,
+        greg: datetime,
+        inclusive: bool = False
+    ) -> CyprianDateTime|None:
+        """
+        Get the first occurrence after a given instant, or at it, if
+        inclusive, or None if there is none.
+        """
+        greg = self.localise(greg)
+        for occurrence in self.iter_occurrences(greg):
+            if inclusive or occurrence > greg:
+                return occurrence
+        return None
+
+    def between(
+        self,
+        greg_start: datetime,
+        greg_end: datetime
+    ) -> list[CyprianDateTime]:
+        """
+        Get the occurrences from one instant (inclusive) to another
+        (exclusive).
+        """
+        greg_end = self.localise(greg_end)
+        result = []
+        for occurrence in self.iter_occurrences(greg_start):
+            if occurrence >= greg_end:
+                break
+            result.append(occurrence)
+        return result
+
+    def localise(self, greg: datetime) -> datetime:
+        """ Take a naive datetime to be in this rule's zone. """
+        if greg.tzinfo is None:
+            return greg.replace(tzinfo=self.zone)
+        return greg
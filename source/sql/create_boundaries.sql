@@ -0,0 +1,10 @@
+-- This code creates the month-boundary database, if it doesn't exist already.
+-- Each Cyprian year has a row for the first day of each of its months, plus a
+-- row, numbered one past its last month, for the first day of the next year.
+
+CREATE TABLE IF NOT EXISTS MonthBoundary (
+    cyprian_year INT,
+    cyprian_month INT,
+    greg_ordinal INT,
+    PRIMARY KEY(cyprian_year, cyprian_month)
+) WITHOUT ROWID;
@@ -2,6 +2,8 @@
 
 DROP TABLE IF EXISTS Equivalence;
 DROP TABLE IF EXISTS Ephemeral;
+DROP TABLE IF EXISTS MonthStart;
+DROP TABLE IF EXISTS YearChecksum;
 
 CREATE TABLE Ephemeral (
     key TEXT PRIMARY KEY,
@@ -17,3 +19,20 @@ CREATE TABLE Equivalence (
     cyprian_day INT,
     PRIMARY KEY(greg_year, greg_month, greg_day)
 );
+
+CREATE INDEX EquivalenceByCyprian
+    ON Equivalence (cyprian_year, cyprian_month, cyprian_day);
+
+CREATE TABLE MonthStart (
+    cyprian_year INT,
+    cyprian_month INT,
+    greg_year INT,
+    greg_month INT,
+    greg_day INT,
+    PRIMARY KEY(cyprian_year, cyprian_month)
+);
+
+CREATE TABLE YearChecksum (
+    cyprian_year INT PRIMARY KEY,
+    checksum TEXT
+);
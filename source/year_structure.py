@@ -0,0 +1,202 @@
+"""
+This code defines a class which describes the structure of a given Cyprian year,
+i.e. when each of its months begins and how long each of them lasts.
+"""
+
+# Standard imports.
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Iterator
+
+# Local imports.
+from . import constants
+from .lunation import (
+    get_cyprian_new_year,
+    get_cyprian_year_beginning_with_greg_year,
+    get_greg_year_ending_with_cyprian_year,
+    get_next_new_moon,
+    round_down_to_nearest_day,
+    tomorrow_is_on_or_after_vernal_equinox
+)
+from .profiling import profile_phase
+
+# Local constants.
+YEAR_STRUCTURE_CACHE_SIZE = 256
+
+##############
+# MAIN CLASS #
+##############
+
+@dataclass(frozen=True)
+class YearStructure:
+    """ The class in question. """
+    year: int
+    month_starts: tuple[datetime, ...]
+    next_year_start: datetime
+    zone: tzinfo = timezone.utc
+
+    @property
+    def start(self) -> datetime:
+        """ The Gregorian date on which this year begins. """
+        return self.month_starts[0]
+
+    @property
+    def number_of_months(self) -> int:
+        """ Ronseal. """
+        return len(self.month_starts)
+
+    @property
+    def is_leap(self) -> bool:
+        """ Determine whether this year has an Intercalaris month. """
+        return self.number_of_months == constants.LEAP_MONTH
+
+    @property
+    def length(self) -> int:
+        """ The number of days in this year. """
+        return (self.next_year_start-self.start).days
+
+    @property
+    def month_lengths(self) -> tuple[int, ...]:
+        """ The number of days in each month, in order. """
+        ends = self.month_starts[1:]+(self.next_year_start,)
+        result = tuple(
+            (end-start).days for start, end in zip(self.month_starts, ends)
+        )
+        return result
+
+    def get_month_start(self, month: int) -> datetime:
+        """ Get the Gregorian date on which a given month begins. """
+        self.check_month(month)
+        return self.month_starts[month-1]
+
+    def get_month_length(self, month: int) -> int:
+        """ Get the number of days in a given month. """
+        self.check_month(month)
+        return self.month_lengths[month-1]
+
+    def check_month(self, month: int):
+        """ Raise an exception if this year has no such month. """
+        if not 1 <= month <= self.number_of_months:
+            raise YearStructureError(
+                f"{constants.YEAR_INITIAL}{self.year} has no month {month}"
+            )
+
+    def is_valid_date(self, month: int, day: int) -> bool:
+        """ Determine whether a given month and day exist in this year. """
+        if not 1 <= month <= self.number_of_months:
+            return False
+        return 1 <= day <= self.month_lengths[month-1]
+
+    def locate(self, greg: datetime) -> tuple[int, int]:
+        """ Get the month and day of this year on which a given date falls. """
+        greg = round_down_to_nearest_day(greg, self.zone)
+        if not self.start <= greg < self.next_year_start:
+            raise YearStructureError(
+                f"{greg} is not in {constants.YEAR_INITIAL}{self.year}"
+            )
+        month = bisect_right(self.month_starts, greg)
+        day = (greg-self.month_starts[month-1]).days+1
+        return month, day
+
+    def iter_days(self) -> Iterator[tuple[datetime, int, int, int]]:
+        """
+        Yield the Gregorian date, and the Cyprian year, month and day, of each
+        day in this year, in order.
+        """
+        for month, (start, length) in enumerate(
+            zip(self.month_starts, self.month_lengths), start=1
+        ):
+            for day in range(1, length+1):
+                yield start+timedelta(days=day-1), self.year, month, day
+
+##################
+# HELPER CLASSES #
+##################
+
+class YearStructureError(Exception):
+    """ A custom exception. """
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+@lru_cache(maxsize=YEAR_STRUCTURE_CACHE_SIZE)
+@profile_phase("compute_year_structure")
+def compute_year_structure(
+    cyprian_year: int,
+    zone: tzinfo = timezone.utc
+) -> YearStructure:
+    """
+    Calculate the structure of a given Cyprian year, as reckoned in a given
+    zone, from the lunations alone, applying the same rules as
+    CyprianDate.advance_one_month, but visiting only the new moons rather than
+    every day.
+    """
+    greg_year = get_greg_year_ending_with_cyprian_year(cyprian_year)
+    month_starts = [get_cyprian_new_year(greg_year, zone)]
+    while True:
+        month = len(month_starts)
+        next_start = get_next_month_start(month_starts[-1], zone)
+        if month == constants.LEAP_MONTH:
+            break
+        if (
+            month == constants.LAST_MONTH and
+            tomorrow_is_on_or_after_vernal_equinox(
+                next_start-timedelta(days=1), zone
+            )
+        ):
+            break
+        month_starts.append(next_start)
+    result = \
+        YearStructure(cyprian_year, tuple(month_starts), next_start, zone)
+    return result
+
+def get_next_month_start(
+    month_start: datetime,
+    zone: tzinfo = timezone.utc
+) -> datetime:
+    """ Get the first day of the month following the one given. """
+    next_new_moon = get_next_new_moon(month_start+timedelta(days=1))
+    result = round_down_to_nearest_day(next_new_moon, zone)
+    return result
+
+def find_cyprian_year(greg: datetime, zone: tzinfo = timezone.utc) -> int:
+    """ Find the Cyprian year in which a given Gregorian date falls. """
+    greg = round_down_to_nearest_day(greg, zone)
+    result = get_cyprian_year_beginning_with_greg_year(greg.year)
+    if greg < compute_year_structure(result, zone).start:
+        result -= 1
+    return result
+
+def locate_greg(
+    greg: datetime,
+    zone: tzinfo = timezone.utc
+) -> tuple[int, int, int]:
+    """ Get the Cyprian year, month and day on which a given date falls. """
+    cyprian_year = find_cyprian_year(greg, zone)
+    month, day = compute_year_structure(cyprian_year, zone).locate(greg)
+    return cyprian_year, month, day
+
+def iter_days_between(
+    greg_start: datetime,
+    greg_end: datetime,
+    zone: tzinfo = timezone.utc
+) -> Iterator[tuple[datetime, int, int, int]]:
+    """
+    Yield the Gregorian date, and the Cyprian year, month and day, of each day
+    from the start (inclusive) to the end (exclusive), visiting the new moons
+    once per year rather than converting each day.
+    """
+    greg_start = round_down_to_nearest_day(greg_start, zone)
+    greg_end = round_down_to_nearest_day(greg_end, zone)
+    cyprian_year = find_cyprian_year(greg_start, zone)
+    while True:
+        year_structure = compute_year_structure(cyprian_year, zone)
+        for day_tuple in year_structure.iter_days():
+            if day_tuple[0] >= greg_end:
+                return
+            if day_tuple[0] >= greg_start:
+                yield day_tuple
+        cyprian_year += 1
@@ -0,0 +1,115 @@
+"""
+This code tests the BoundaryConcordance class.
+"""
+
+# Standard imports.
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.boundary_concordance import (
+    BoundaryConcordance,
+    find_disagreements,
+    get_path_to_boundary_db
+)
+from source.cache_config import BACKEND_MEMORY, CacheConfig
+from source.concordance import Concordance, ConcordanceError
+from source.cyprian_date import CyprianDate
+from source.year_structure import compute_year_structure
+
+# Local constants.
+CONFIG = CacheConfig("boundary_concordance", BACKEND_MEMORY)
+
+#########
+# TESTS #
+#########
+
+def test_conversion():
+    """ Test that dates are converted, in either direction, as intended. """
+    boundary_concordance = BoundaryConcordance(config=CONFIG)
+    christmas = datetime(2024, 12, 25, 18, tzinfo=timezone.utc)
+    assert boundary_concordance.convert_greg(christmas) == \
+        CyprianDate(11, 9, 25)
+    assert boundary_concordance.convert_cyprian(CyprianDate(11, 9, 25)) == \
+        datetime(2024, 12, 25, tzinfo=timezone.utc)
+    assert boundary_concordance.convert_greg(datetime(2024, 4, 7)) == \
+        CyprianDate(10, 13, 29)
+    assert boundary_concordance.get_year_structure(11) == \
+        compute_year_structure(11)
+    for cyprian in (CyprianDate(11, 9, 30), CyprianDate(11, 13, 1)):
+        with pytest.raises(ConcordanceError):
+            boundary_concordance.convert_cyprian(cyprian)
+
+def test_zone():
+    """ Test that days are reckoned in the cache's zone. """
+    zone = ZoneInfo("Pacific/Kiritimati")
+    boundary_concordance = BoundaryConcordance(zone=zone, config=CONFIG)
+    assert boundary_concordance.convert_greg(
+        datetime(2024, 11, 2, 1, tzinfo=zone)
+    ) == CyprianDate(11, 8, 1)
+    assert boundary_concordance.convert_cyprian(CyprianDate(11, 8, 1)) == \
+        datetime(2024, 11, 2, tzinfo=zone)
+
+def test_agreement_with_per_day_table():
+    """ Test that the boundaries agree with the per-day table, day by day. """
+    boundary_concordance = BoundaryConcordance(config=CONFIG)
+    concordance = Concordance(config=CONFIG)
+    for cyprian_year in (10, 11, 12):
+        assert not find_disagreements(
+            boundary_concordance, concordance, cyprian_year
+        )
+
+def test_storage(tmp_path, monkeypatch):
+    """
+    Test that a year is stored as a handful of rows, which a new instance
+    reads back without computing anything, and that a read-only cache refuses
+    to compute more.
+    """
+    path_to_cache_db = str(tmp_path/"cache.db")
+    concordance = Concordance(path_to_cache_db=path_to_cache_db)
+    concordance.write(new_cyprian_year=11)
+    boundary_concordance = \
+        BoundaryConcordance(path_to_cache_db=path_to_cache_db)
+    assert boundary_concordance.path_to_cache_db == \
+        str(tmp_path/"cache.boundaries.db")
+    for cyprian_year in (10, 11):
+        boundary_concordance.get_boundaries(cyprian_year)
+    boundary_concordance.close()
+    concordance.establish_connection()
+    cursor = concordance.db_connection.cursor()
+    cursor.execute("SELECT COUNT(*) FROM Equivalence;")
+    per_day_rows = cursor.fetchone()[0]
+    boundary_concordance.establish_connection()
+    cursor = boundary_concordance.db_connection.cursor()
+    cursor.execute("SELECT COUNT(*) FROM MonthBoundary;")
+    boundary_rows = cursor.fetchone()[0]
+    assert boundary_rows*10 < per_day_rows
+    def refuse(*_):
+        raise AssertionError("Should have read from the database")
+    monkeypatch.setattr(
+        "source.boundary_concordance.compute_year_structure", refuse
+    )
+    reader = \
+        BoundaryConcordance(path_to_cache_db=path_to_cache_db, read_only=True)
+    assert reader.convert_greg(datetime(2024, 12, 25)) == \
+        CyprianDate(11, 9, 25)
+    with pytest.raises(ConcordanceError):
+        reader.convert_cyprian(CyprianDate(30, 1, 1))
+
+def test_read_only_without_file(tmp_path):
+    """ Test that a read-only cache with no boundaries yet says as much. """
+    boundary_concordance = \
+        BoundaryConcordance(
+            path_to_cache_db=str(tmp_path/"cache.db"),
+            read_only=True
+        )
+    with pytest.raises(ConcordanceError, match="read-only cache"):
+        boundary_concordance.convert_greg(datetime(2024, 12, 25))
+
+def test_get_path_to_boundary_db():
+    """ Test that the infix goes before the suffix. """
+    assert get_path_to_boundary_db("/tmp/built.Europe_London.db") == \
+        "/tmp/built.Europe_London.boundaries.db"
@@ -0,0 +1,99 @@
+"""
+This code tests the cache configuration API.
+"""
+
+# Standard imports.
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.cache_config import (
+    BACKEND_MEMORY,
+    CacheConfig,
+    CacheConfigError,
+    drop_memory_caches,
+    get_cache_config,
+    set_cache_config,
+    use_cache_config
+)
+from source.concordance import Concordance
+from source.cyprian_date import CyprianDate
+from source.frontend_utils import convert_date
+
+#########
+# TESTS #
+#########
+
+def test_from_environment():
+    """ Test that the environment variables are read correctly. """
+    environ = {
+        "CYPRIAN_DATETIME_CACHE_PATH": "/tmp/cache.db",
+        "CYPRIAN_DATETIME_CACHE_BACKEND": "memory",
+        "CYPRIAN_DATETIME_CACHE_READ_ONLY": "True",
+        "CYPRIAN_DATETIME_CACHE_MAX_YEARS": "5"
+    }
+    expected = CacheConfig("/tmp/cache.db", BACKEND_MEMORY, True, 5)
+    assert CacheConfig.from_environment(environ) == expected
+    assert CacheConfig.from_environment({}) == CacheConfig()
+    with pytest.raises(CacheConfigError):
+        CacheConfig(backend="postgres")
+    with pytest.raises(CacheConfigError):
+        CacheConfig(max_cyprian_years=1)
+
+def test_precedence(tmp_path):
+    """ Test that context beats process, which beats the environment. """
+    process_path = str(tmp_path/"process.db")
+    set_cache_config(path_to_cache_db=process_path)
+    try:
+        assert Concordance().path_to_cache_db == process_path
+        with use_cache_config(read_only=True) as config:
+            assert config.path_to_cache_db == process_path
+            assert Concordance().read_only
+        assert not Concordance().read_only
+    finally:
+        set_cache_config(None)
+    assert get_cache_config() == CacheConfig.from_environment()
+
+def test_tenant_isolation(tmp_path):
+    """ Test that each tenant's conversions go to that tenant's cache. """
+    greg = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    for tenant in ("alpha", "beta"):
+        path_to_cache_db = str(tmp_path/f"{tenant}.db")
+        with use_cache_config(path_to_cache_db=path_to_cache_db):
+            assert convert_date(greg) == CyprianDate(10, 12, 22)
+        assert Path(path_to_cache_db).exists()
+
+def test_in_memory_backend(tmp_path):
+    """ Test that an in-memory cache works, and never touches the disk. """
+    path_to_cache_db = str(tmp_path/"memory.db")
+    config = CacheConfig(path_to_cache_db, BACKEND_MEMORY)
+    try:
+        concordance = Concordance(config=config)
+        assert concordance.convert_cyprian(CyprianDate(11, 1, 1)) == \
+            datetime(2024, 4, 8, tzinfo=timezone.utc)
+        concordance = Concordance(config=config)
+        assert not concordance.should_write_first(cyprian=CyprianDate(11, 1, 1))
+    finally:
+        drop_memory_caches()
+    assert not Path(path_to_cache_db).exists()
+
+def test_max_cyprian_years(tmp_path):
+    """
+    Test that extending a cache at its size limit evicts its oldest years,
+    rather than rebuilding it.
+    """
+    config = \
+        CacheConfig(str(tmp_path/"limited.db"), max_cyprian_years=2)
+    concordance = Concordance(config=config)
+    concordance.write(new_cyprian_year=11)
+    assert concordance.should_extend_first(cyprian=CyprianDate(12, 1, 1))
+    assert not concordance.should_write_first(cyprian=CyprianDate(12, 1, 1))
+    greg = concordance.convert_cyprian(CyprianDate(12, 1, 1))
+    span = concordance.read_span()
+    assert span.first_cyprian_year == 11
+    assert span.first_greg == concordance.convert_cyprian(CyprianDate(11, 1, 1))
+    assert concordance.read_year_rows(10) == []
+    assert concordance.convert_greg(greg) == CyprianDate(12, 1, 1)
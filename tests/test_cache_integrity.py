@@ -0,0 +1,55 @@
+"""
+This code tests the CacheVerifier class.
+"""
+
+# Standard imports.
+import sqlite3
+
+# Local imports.
+from source.cache_integrity import CacheVerifier, find_discontinuity
+from source.concordance import Concordance
+
+#########
+# TESTS #
+#########
+
+def test_verify_and_repair(tmp_path):
+    """ Test that damage is found, and that only damaged years are rebuilt. """
+    path_to_cache_db = str(tmp_path/"cache.db")
+    Concordance(path_to_cache_db=path_to_cache_db).write(new_greg_year=2024)
+    verifier = CacheVerifier(path_to_cache_db=path_to_cache_db, thorough=True)
+    report = verifier.verify()
+    assert report.ok
+    assert report.checked_years == [10, 11]
+    connection = sqlite3.connect(path_to_cache_db)
+    connection.execute(
+        "UPDATE Equivalence SET cyprian_day = 31 "+
+        "WHERE cyprian_year = 11 AND cyprian_month = 2 AND cyprian_day = 3;"
+    )
+    connection.commit()
+    connection.close()
+    report = verifier.verify()
+    assert report.damaged_years == { 11: "checksum mismatch" }
+    assert verifier.repair(report).ok
+
+def test_repair_unusable_cache(tmp_path):
+    """ Test that a cache which can't be read at all is rebuilt. """
+    path_to_cache_db = str(tmp_path/"cache.db")
+    with open(path_to_cache_db, "w") as cache_file:
+        cache_file.write("Not a database.")
+    verifier = CacheVerifier(path_to_cache_db=path_to_cache_db)
+    assert verifier.verify().fatal_error
+    assert verifier.repair().ok
+
+def test_verify_unreachable_cache(tmp_path):
+    """ Test that a cache which can't even be opened is reported as such. """
+    path_to_cache_db = str(tmp_path/"no_such_dir"/"cache.db")
+    verifier = CacheVerifier(path_to_cache_db=path_to_cache_db)
+    assert "unable to open" in verifier.verify().fatal_error
+
+def test_find_discontinuity():
+    """ Test that the function returns the right output. """
+    rows = [(2024, 4, 8, 1, 1), (2024, 4, 9, 1, 2), (2024, 4, 11, 1, 3)]
+    assert find_discontinuity(rows) == "gap after 2024-04-09"
+    assert find_discontinuity(rows[1:]) == "does not begin on 01 Pri"
+    assert find_discontinuity([]) == "no rows"
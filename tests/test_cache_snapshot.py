@@ -0,0 +1,61 @@
+"""
+This code tests the functions which populate, export and import the cache.
+"""
+
+# Standard imports.
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.cache_snapshot import (
+    CacheSnapshotError,
+    export_snapshot,
+    import_snapshot,
+    populate_cache
+)
+from source.concordance import Concordance, ConcordanceError
+from source.cyprian_date import CyprianDate
+
+#########
+# TESTS #
+#########
+
+def test_populate_export_and_import(tmp_path):
+    """ Test that a snapshot round-trips, and can then be read read-only. """
+    zone = ZoneInfo("Europe/London")
+    path_to_cache_db = \
+        populate_cache(
+            10,
+            13,
+            path_to_cache_db=str(tmp_path/"built.db"),
+            zone=zone
+        )
+    assert path_to_cache_db.endswith("built.Europe_London.db")
+    path_to_snapshot = str(tmp_path/"snapshot.db")
+    export_snapshot(path_to_snapshot, str(tmp_path/"built.db"), zone)
+    path_to_installed = \
+        import_snapshot(path_to_snapshot, str(tmp_path/"installed.db"), zone)
+    concordance = \
+        Concordance(path_to_cache_db=str(tmp_path/"installed.db"), zone=zone)
+    assert concordance.path_to_cache_db == path_to_installed
+    concordance.read_only = True
+    assert concordance.convert_greg(datetime(2024, 3, 1)) == \
+        CyprianDate(10, 12, 22)
+    assert concordance.convert_cyprian(CyprianDate(13, 1, 1)).year == 2026
+    with pytest.raises(ConcordanceError):
+        concordance.convert_cyprian(CyprianDate(20, 1, 1))
+    with pytest.raises(ConcordanceError):
+        concordance.write()
+
+def test_import_unsound_snapshot(tmp_path):
+    """ Test that an unsound snapshot is refused. """
+    path_to_snapshot = str(tmp_path/"snapshot.db")
+    with open(path_to_snapshot, "w") as snapshot_file:
+        snapshot_file.write("Not a database.")
+    with pytest.raises(CacheSnapshotError):
+        import_snapshot(path_to_snapshot, str(tmp_path/"installed.db"))
+    with pytest.raises(CacheSnapshotError):
+        populate_cache(12, 11, str(tmp_path/"empty.db"), timezone.utc)
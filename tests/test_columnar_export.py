@@ -0,0 +1,56 @@
+"""
+This code tests the columnar export functions.
+"""
+
+# Standard imports.
+import csv
+from datetime import date
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.columnar_export import (
+    export_arrow,
+    export_csv,
+    export_parquet,
+    iter_row_groups
+)
+
+#########
+# TESTS #
+#########
+
+def test_iter_row_groups():
+    """ Test that there is one row group, of the right length, per year. """
+    row_groups = list(iter_row_groups(2024, 2025))
+    assert len(row_groups) == 2
+    assert len(row_groups[0]["greg_date"]) == 366
+    assert len(row_groups[1]["cyprian_day"]) == 365
+    easter = row_groups[1]["greg_date"].index(date(2025, 4, 20))
+    assert row_groups[1]["liturgical"][easter] == "Easter Sunday"
+    assert row_groups[1]["cyprian_year"][easter] == 12
+    assert row_groups[1]["cyprian_month"][easter] == 1
+    assert row_groups[1]["cyprian_day"][easter] == 23
+
+def test_export_csv(tmp_path):
+    """ Test that the CSV file has a header and one row per day. """
+    path = export_csv(str(tmp_path/"concordance.csv"), 2024, 2024)
+    with open(path, newline="") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert len(rows) == 367
+    assert rows[1] == ["2024-01-01", "10", "10", "21", ""]
+
+def test_export_arrow_and_parquet(tmp_path):
+    """ Test that the Arrow and Parquet files hold typed columns. """
+    pyarrow = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = export_arrow(str(tmp_path/"concordance.arrow"), 2024, 2025)
+    with pyarrow.ipc.open_file(path) as reader:
+        table = reader.read_all()
+    assert table.num_rows == 731
+    assert table.schema.field("greg_date").type == pyarrow.date32()
+    path = export_parquet(str(tmp_path/"concordance.parquet"), 2024, 2025)
+    parquet_file = parquet.ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 2
+    assert parquet_file.read().equals(table)
@@ -3,10 +3,12 @@ This code tests the Concordance class.
 """
 
 # Standard imports.
-from datetime import datetime, timezone
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 # Local imports.
-from source.concordance import Concordance
+from source.concordance import Concordance, get_path_to_zone_cache_db
 from source.cyprian_date import CyprianDate
 
 #########
@@ -22,3 +24,110 @@ def test_cyprian_date():
     assert actual == cyprian
     actual = concordance.convert_cyprian(cyprian, force_write_first=True)
     assert actual == greg
+
+def test_concordance_extension(tmp_path):
+    """
+    Test that the cache is extended, rather than rebuilt, when we move into
+    the following year, and that the extension agrees with a rebuild.
+    """
+    path_to_cache_db = str(tmp_path/"cache.db")
+    concordance = Concordance(path_to_cache_db=path_to_cache_db)
+    concordance.write(new_greg_year=2024)
+    concordance.establish_connection()
+    first_span = concordance.read_span()
+    assert first_span.cursor_cyprian == CyprianDate(12, 1, 1)
+    new_years_day = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert not concordance.should_write_first(greg=new_years_day)
+    assert not concordance.should_extend_first(greg=new_years_day)
+    greg = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    assert not concordance.should_write_first(greg=greg)
+    assert concordance.should_extend_first(greg=greg)
+    actual = concordance.convert_greg(greg)
+    second_span = concordance.read_span()
+    assert second_span.first_greg == first_span.first_greg
+    assert second_span.cursor_cyprian == CyprianDate(13, 1, 1)
+    assert concordance.get_ephemeral("whole_cyprian_year") == 12
+    assert concordance.convert_cyprian(actual) == greg
+    rebuilt = Concordance(path_to_cache_db=str(tmp_path/"rebuilt.db"))
+    assert actual == rebuilt.convert_greg(greg)
+    assert concordance.should_write_first(
+        greg=datetime(2030, 1, 1, tzinfo=timezone.utc)
+    )
+    assert concordance.should_write_first(cyprian=CyprianDate(5, 1, 1))
+
+def test_connection_reused(tmp_path, monkeypatch):
+    """ Test that conversions from a warm cache share one connection. """
+    path_to_cache_db = str(tmp_path/"cache.db")
+    Concordance(path_to_cache_db=path_to_cache_db).write(new_greg_year=2024)
+    connections = []
+    connect = sqlite3.connect
+    def record_connect(*args, **kwargs):
+        result = connect(*args, **kwargs)
+        connections.append(result)
+        return result
+    monkeypatch.setattr(sqlite3, "connect", record_connect)
+    concordance = Concordance(path_to_cache_db=path_to_cache_db)
+    for day in range(1, 4):
+        concordance.convert_greg(datetime(2024, 1, day, tzinfo=timezone.utc))
+    assert len(connections) == 1
+    concordance.write(new_greg_year=2024)
+    assert len(connections) == 2
+    assert concordance.db_connection is None
+
+def test_concordance_zone(tmp_path):
+    """ Test that days are reckoned in the concordance's zone. """
+    zone = ZoneInfo("Pacific/Kiritimati")
+    path_to_cache_db = str(tmp_path/"cache.db")
+    concordance = Concordance(path_to_cache_db=path_to_cache_db, zone=zone)
+    assert concordance.path_to_cache_db == \
+        str(tmp_path/"cache.Pacific_Kiritimati.db")
+    # The new moon falls on 1 Nov in UTC, but on 2 Nov in Kiritimati.
+    assert concordance.convert_greg(datetime(2024, 11, 1)) == \
+        CyprianDate(11, 7, 30)
+    assert concordance.convert_greg(datetime(2024, 11, 2)) == \
+        CyprianDate(11, 8, 1)
+    assert concordance.convert_cyprian(CyprianDate(11, 8, 1)) == \
+        datetime(2024, 11, 2, tzinfo=zone)
+    instant = datetime(2024, 11, 1, 11, tzinfo=timezone.utc)
+    assert concordance.convert_greg(instant) == CyprianDate(11, 8, 1)
+
+def test_get_path_to_zone_cache_db():
+    """ Test that the function returns the right output. """
+    assert get_path_to_zone_cache_db("x/cache.db", timezone.utc) == \
+        "x/cache.db"
+    assert get_path_to_zone_cache_db("x/cache.db", ZoneInfo("UTC")) == \
+        "x/cache.db"
+    assert get_path_to_zone_cache_db(
+        "x/cache.db", timezone(timedelta(hours=2))
+    ) == "x/cache.UTC_02_00.db"
+
+def test_range_queries(tmp_path):
+    """ Test that each range comes from one indexed query, in order. """
+    concordance = Concordance(path_to_cache_db=str(tmp_path/"cache.db"))
+    month = concordance.days_in_cyprian_month(11, 9)
+    assert len(month) == 29
+    assert month[24] == \
+        (datetime(2024, 12, 25, tzinfo=timezone.utc), CyprianDate(11, 9, 25))
+    assert month[-1][1] == CyprianDate(11, 9, 29)
+    assert month[24:26].gregs == [
+        datetime(2024, 12, 25, tzinfo=timezone.utc),
+        datetime(2024, 12, 26, tzinfo=timezone.utc)
+    ]
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    end = datetime(2027, 3, 1, tzinfo=timezone.utc)
+    span = concordance.cyprian_span(start, end)
+    assert len(span) == (end-start).days
+    assert span.cyprians[0] == CyprianDate(10, 12, 22)
+    assert span.cyprians == \
+        [concordance.convert_greg(greg) for greg in span.gregs]
+    greg_span = \
+        concordance.greg_span(CyprianDate(10, 12, 22), span.cyprians[-1])
+    assert greg_span == span[:-1]
+    assert not concordance.cyprian_span(end, start)
+    concordance.establish_connection()
+    plan = concordance.db_connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM Equivalence "+
+        "WHERE (cyprian_year, cyprian_month, cyprian_day) >= (?, ?, ?);",
+        (11, 1, 1)
+    ).fetchall()
+    assert "EquivalenceByCyprian" in str(plan)
@@ -0,0 +1,50 @@
+"""
+This code tests the ConversionEngine class.
+"""
+
+# Standard imports.
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.conversion_engine import (
+    ConversionEngine,
+    ConversionEngineError,
+    get_engine
+)
+from source.cyprian_date import CyprianDate
+from source.year_structure import locate_greg
+
+#########
+# TESTS #
+#########
+
+def test_convert():
+    """ Test that the engine agrees with the year structures. """
+    engine = ConversionEngine()
+    greg = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+    assert engine.convert_greg(greg) == CyprianDate(10, 12, 22)
+    assert engine.convert_cyprian(CyprianDate(11, 1, 1)) == \
+        datetime(2024, 4, 8, tzinfo=timezone.utc)
+    with pytest.raises(ConversionEngineError):
+        engine.convert_cyprian(CyprianDate(11, 13, 1))
+    zone = ZoneInfo("America/New_York")
+    assert get_engine(zone) is get_engine(zone)
+    assert get_engine(zone).convert_greg(greg) == \
+        CyprianDate(*locate_greg(greg, zone))
+
+def test_shared_across_threads():
+    """ Test that many threads share one engine, and each year's structure. """
+    engine = ConversionEngine()
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    gregs = [start+timedelta(days=index) for index in range(0, 3650, 7)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        actual = list(executor.map(engine.convert_greg, gregs*4))
+    expected = [CyprianDate(*locate_greg(greg)) for greg in gregs]
+    assert actual == expected*4
+    assert sorted(engine.year_structures) == list(range(6, 17))
+    assert set(engine.year_locks) == set(engine.year_structures)
@@ -5,9 +5,15 @@ This code tests the CyprianDate class and its helper functions.
 # Standard imports.
 from datetime import datetime, timezone
 
+# Non-standard imports.
+import pytest
+
 # Local imports.
 from source.cyprian_date import (
     CyprianDate,
+    CyprianDateError,
+    format_cyprian_dates,
+    parse_cyprian_dates,
     new_moon_tomorrow,
     get_next_new_moon,
     fall_on_same_day,
@@ -47,6 +53,35 @@ def test_cyprian_date():
     cyprian.advance_one_day(greg)
     assert str(cyprian) == "01 Pri T11"
 
+def test_cyprian_date_strings():
+    """ Test that the class is rendered and parsed as intended. """
+    cyprian = CyprianDate(10, 10, 21)
+    assert cyprian.to_html() == \
+        '21 Dec <span class="frak">T</span><sub>10</sub>'
+    assert cyprian.to_latex() == "21 Dec $\\mathfrak{T}_{10}$"
+    assert cyprian.strftime("%B %d, %Y") == "December 21, T10"
+    assert CyprianDate.from_str("21 Dec T10") == cyprian
+    assert CyprianDate.from_str("21-Dec-T10") == cyprian
+    before_t1 = CyprianDate(-3, 1, 1)
+    assert CyprianDate.from_str(str(before_t1)) == before_t1
+    assert CyprianDate.from_str("01-Pri-T-3") == before_t1
+    assert CyprianDate.strptime("10/10/21", "%y/%m/%d") == cyprian
+    with pytest.raises(CyprianDateError):
+        CyprianDate.from_str("30 Int T11")
+
+def test_format_cyprian_dates():
+    """ Test that the function returns the right output. """
+    cyprian_dates = [CyprianDate(10, 10, 21), CyprianDate(10, 13, 1)]
+    actual = format_cyprian_dates(cyprian_dates, "%d %B %Y")
+    assert actual == ["21 December T10", "01 Intercalaris T10"]
+
+def test_parse_cyprian_dates():
+    """ Test that the function returns the right output. """
+    actual = parse_cyprian_dates(["21 Dec T10", "01 Int T10"])
+    assert actual == [CyprianDate(10, 10, 21), CyprianDate(10, 13, 1)]
+    with pytest.raises(CyprianDateError):
+        parse_cyprian_dates(["01 Int T11"])
+
 def test_new_moon_tomorrow():
     """ Test that the function returns the right output. """
     assert new_moon_tomorrow(datetime(2024, 10, 31, tzinfo=timezone.utc))
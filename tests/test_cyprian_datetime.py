@@ -3,11 +3,24 @@ This code tests the Concordance class.
 """
 
 # Standard imports.
-from datetime import timedelta, timezone
+import copy
+import pickle
+from datetime import timedelta, timezone, tzinfo
+from zoneinfo import ZoneInfo
+
+# Non-standard imports.
+import pytest
 
 # Local imports.
 from source.cyprian_date import CyprianDate
-from source.cyprian_datetime import CyprianDateTime
+from source.cyprian_datetime import (
+    BATCH_HEADER,
+    BATCH_MAGIC,
+    CyprianDateTime,
+    CyprianDateTimeError,
+    dump_cyprian_datetimes,
+    load_cyprian_datetimes
+)
 
 #########
 # TESTS #
@@ -35,6 +48,16 @@ def test_cyprian_datetime_sync():
     cyprian_datetime += timedelta(days=1)
     assert cyprian_datetime.cyprian == tomorrow_cyprian_date
 
+def test_cyprian_datetime_replace():
+    """ Test that replacing a field converts the new date. """
+    cyprian_datetime = CyprianDateTime(2024, 12, 25, tzinfo=timezone.utc)
+    replaced = cyprian_datetime.replace(year=2023)
+    assert isinstance(replaced, CyprianDateTime)
+    assert replaced.year == 2023
+    assert replaced.cyprian == CyprianDate(10, 10, 14)
+    assert str(replaced.cyprian) == "14 Dec T10"
+    assert pickle.loads(pickle.dumps(replaced)) == replaced
+
 def test_cyprian_datetime_from_cyprian_str():
     """
     Test that, when we initialise a CyprianDateTime object from a string
@@ -64,3 +87,86 @@ def test_cyprian_datetime_to_json():
         '"string": "21 Dec T10"}}'
     )
     assert actual == expected
+
+def test_cyprian_datetime_zone():
+    """ Test that the Cyprian day is reckoned in the instance's own zone. """
+    zone = ZoneInfo("Pacific/Kiritimati")
+    local = CyprianDateTime(2024, 11, 2, 1, tzinfo=zone)
+    assert local.cyprian == CyprianDate(11, 8, 1)
+    assert CyprianDateTime(2024, 11, 2, 1, tzinfo=timezone.utc).cyprian == \
+        CyprianDate(11, 8, 2)
+    midnight = CyprianDateTime.from_cyprian(CyprianDate(11, 8, 1), zone)
+    assert (midnight.year, midnight.month, midnight.day) == (2024, 11, 2)
+    assert midnight.tzinfo is zone
+
+def test_cyprian_datetime_pickle(monkeypatch):
+    """ Test that pickling and copying carry the Cyprian date over. """
+    zone = ZoneInfo("Europe/London")
+    original = CyprianDateTime(2024, 10, 27, 1, 30, tzinfo=zone, fold=1)
+    def refuse(*_):
+        raise AssertionError("Should not have converted")
+    monkeypatch.setattr("source.cyprian_datetime.convert_date", refuse)
+    for copied in (
+        pickle.loads(pickle.dumps(original)),
+        copy.copy(original),
+        copy.deepcopy(original)
+    ):
+        assert type(copied) is CyprianDateTime
+        assert copied == original
+        assert copied.fold == 1
+        assert copied.tzinfo is zone
+        assert copied.cyprian == original.cyprian
+    cyprian = CyprianDate(11, 8, 1)
+    assert pickle.loads(pickle.dumps(cyprian)) == cyprian
+
+def test_dump_and_load_cyprian_datetimes(monkeypatch):
+    """ Test that a batch survives a round trip, converting nothing. """
+    originals = [
+        CyprianDateTime(2024, 1, 1, tzinfo=timezone.utc),
+        CyprianDateTime(2024, 11, 2, 1, 2, 3, 4, tzinfo=ZoneInfo("Asia/Tokyo")),
+        CyprianDateTime(1850, 6, 1, 12),
+        CyprianDateTime(2024, 1, 2, tzinfo=timezone.utc),
+        CyprianDateTime(
+            2024, 1, 2, tzinfo=timezone(timedelta(hours=-3, seconds=1), "X")
+        )
+    ]
+    data = dump_cyprian_datetimes(originals)
+    assert len(data) < len(pickle.dumps(originals))
+    def refuse(*_):
+        raise AssertionError("Should not have converted")
+    monkeypatch.setattr("source.cyprian_datetime.convert_date", refuse)
+    actual = load_cyprian_datetimes(data)
+    assert actual == originals
+    assert [item.tzinfo for item in actual] == \
+        [item.tzinfo for item in originals]
+    assert [item.cyprian for item in actual] == \
+        [item.cyprian for item in originals]
+    with pytest.raises(CyprianDateTimeError):
+        load_cyprian_datetimes(data[:-1])
+    with pytest.raises(CyprianDateTimeError):
+        load_cyprian_datetimes(b"NOTIT"+data[5:])
+
+def test_batch_zones_are_data():
+    """
+    Test that a batch's zones are read as data, never unpickled, and that
+    zones which can't be described as data are refused.
+    """
+    data = dump_cyprian_datetimes(
+        [CyprianDateTime(2024, 1, 1, tzinfo=ZoneInfo("Europe/London"))]
+    )
+    assert b'"Europe/London"' in data
+    zones_length = len(b'[{"key": "Europe/London"}]')
+    pickled = pickle.dumps((timezone.utc,))
+    crafted = \
+        BATCH_HEADER.pack(BATCH_MAGIC, len(pickled))+pickled+\
+        data[BATCH_HEADER.size+zones_length:]
+    with pytest.raises(CyprianDateTimeError):
+        load_cyprian_datetimes(crafted)
+    class OddZone(tzinfo):
+        """ A zone which can't be described as data. """
+        def utcoffset(self, _):
+            return timedelta(0)
+        def dst(self, _):
+            return timedelta(0)
+    with pytest.raises(CyprianDateTimeError):
+        dump_cyprian_datetimes([CyprianDateTime(2024, 1, 1, tzinfo=OddZone())])
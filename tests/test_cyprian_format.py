@@ -0,0 +1,37 @@
+"""
+This code tests the CyprianFormat class and its helper functions.
+"""
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.cyprian_format import (
+    CyprianFormat,
+    CyprianFormatError,
+    compile_format
+)
+
+#########
+# TESTS #
+#########
+
+def test_cyprian_format():
+    """ Test that the class works as intended. """
+    cyprian_format = CyprianFormat("%d %b %Y {%%}")
+    assert cyprian_format.format(10, 10, 21) == "21 Dec T10 {%}"
+    assert cyprian_format.parse("21 Dec T10 {%}") == (10, 10, 21)
+    assert CyprianFormat("%B %y").format(-3, 13, 1) == "Intercalaris -3"
+    assert CyprianFormat("%Y-%m-%d").parse("T-3-13-01") == (-3, 13, 1)
+    with pytest.raises(CyprianFormatError):
+        cyprian_format.parse("21 Foo T10 {%}")
+    with pytest.raises(CyprianFormatError):
+        CyprianFormat("%d %q %Y")
+    with pytest.raises(CyprianFormatError):
+        CyprianFormat("%y %Y")
+    with pytest.raises(CyprianFormatError):
+        CyprianFormat("%d %b").parse("21 Dec")
+
+def test_compile_format():
+    """ Test that compiled patterns are reused. """
+    assert compile_format("%d %b %Y") is compile_format("%d %b %Y")
@@ -0,0 +1,32 @@
+"""
+This code tests the DayBucketConverter class.
+"""
+
+# Standard imports.
+from datetime import datetime, timedelta, timezone
+
+# Local imports.
+from source.concordance import Concordance
+from source.day_bucket import DayBucketConverter
+
+#########
+# TESTS #
+#########
+
+def test_day_bucket_converter(tmp_path):
+    """ Test that a sorted stream needs only one lookup per day. """
+    path_to_cache_db = str(tmp_path/"cache.db")
+    converter = DayBucketConverter(path_to_cache_db=path_to_cache_db)
+    start = datetime(2024, 10, 31, tzinfo=timezone.utc)
+    timestamps = [start+timedelta(minutes=30*index) for index in range(144)]
+    actual = converter.convert_many(timestamps)
+    assert converter.misses == 3
+    assert converter.hits == 141
+    concordance = Concordance(path_to_cache_db=path_to_cache_db)
+    for timestamp, cyprian in zip(timestamps, actual):
+        assert cyprian == concordance.convert_greg(timestamp)
+    last = actual[-1]
+    last.day += 1  # Changing a result must not change the bucket.
+    assert converter.convert(timestamps[-1]).day == last.day-1
+    assert converter.convert(datetime(2024, 11, 2, 12)) == \
+        converter.convert(timestamps[-1])
@@ -0,0 +1,89 @@
+"""
+This code tests the differential test harness, and runs its fast tier against
+the fast engines; set CYPRIAN_DATETIME_EXHAUSTIVE to run the exhaustive tier
+too.
+"""
+
+# Standard imports.
+import os
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.differential import (
+    EXHAUSTIVE_TIER,
+    FAST_TIER,
+    DifferentialHarness,
+    Tier,
+    make_concordance_engine,
+    merge_ranges,
+    year_structure_engine
+)
+
+# Local constants.
+RUN_EXHAUSTIVE = bool(os.environ.get("CYPRIAN_DATETIME_EXHAUSTIVE"))
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def broken_engine(start, end, zone):
+    """ Get one day's month wrong, as a subtle bug might. """
+    for greg, year, month, day in year_structure_engine(start, end, zone):
+        if greg.date() == date(2024, 4, 8):
+            month = 13
+        yield greg, year, month, day
+
+#########
+# TESTS #
+#########
+
+def test_fast_tier():
+    """ Test that the fast engines agree with the reference. """
+    engines = {
+        "year_structure": year_structure_engine,
+        "concordance": make_concordance_engine()
+    }
+    report = DifferentialHarness(engines).run_tier(FAST_TIER)
+    assert report.ok, str(report)
+    assert report.days_checked > 365
+
+def test_zone():
+    """ Test that the engines agree with the reference in another zone. """
+    tier = Tier("zone", 2024, 2025, random_ranges=5)
+    harness = \
+        DifferentialHarness(
+            { "year_structure": year_structure_engine },
+            ZoneInfo("Pacific/Auckland")
+        )
+    assert harness.run_tier(tier).ok
+
+def test_first_divergence():
+    """ Test that the first divergence, and only that, is reported. """
+    tier = Tier("broken", 2024, 2024)
+    report = DifferentialHarness({ "broken": broken_engine }).run_tier(tier)
+    divergence = report.divergences["broken"]
+    assert divergence.greg == date(2024, 4, 8)
+    assert divergence.expected == (11, 1, 1)
+    assert divergence.actual == (11, 13, 1)
+
+def test_merge_ranges():
+    """ Test that the function returns the right output. """
+    day = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ranges = [
+        (day+timedelta(days=5), day+timedelta(days=9)),
+        (day, day+timedelta(days=3)),
+        (day+timedelta(days=3), day+timedelta(days=4))
+    ]
+    assert merge_ranges(ranges) == \
+        [(day, day+timedelta(days=4)), ranges[0]]
+
+@pytest.mark.skipif(not RUN_EXHAUSTIVE, reason="Exhaustive tier not enabled")
+def test_exhaustive_tier():
+    """ Test that the fast path agrees with the reference, day by day. """
+    harness = DifferentialHarness({ "year_structure": year_structure_engine })
+    report = harness.run_tier(EXHAUSTIVE_TIER)
+    assert report.ok, str(report)
@@ -0,0 +1,96 @@
+"""
+This code tests the EventIndex class.
+"""
+
+# Standard imports.
+from datetime import datetime, timedelta, timezone
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.cache_config import BACKEND_MEMORY, CacheConfig
+from source.concordance import Concordance
+from source.cyprian_date import CyprianDate
+from source.event_index import (
+    LEAP_MONTH_START,
+    MONTH_START,
+    VERNAL_EQUINOX,
+    YEAR_START,
+    EventIndex,
+    EventIndexError,
+    make_cached_event_index
+)
+from source.year_structure import compute_year_structure, iter_days_between
+
+#########
+# TESTS #
+#########
+
+def test_next_and_previous():
+    """ Test that the nearest events either side are found. """
+    index = EventIndex(5, 20)
+    christmas = datetime(2024, 12, 25, tzinfo=timezone.utc)
+    actual = index.next(MONTH_START, christmas)
+    assert actual.cyprian == CyprianDate(11, 10, 1)
+    assert actual.greg == datetime(2024, 12, 30, tzinfo=timezone.utc)
+    assert index.previous(MONTH_START, christmas).cyprian == \
+        CyprianDate(11, 9, 1)
+    assert index.previous(YEAR_START, christmas).greg == \
+        datetime(2024, 4, 8, tzinfo=timezone.utc)
+    assert index.next(YEAR_START, christmas).cyprian == CyprianDate(12, 1, 1)
+    month_start = actual.greg
+    assert index.next(MONTH_START, month_start, inclusive=True) == actual
+    assert index.next(MONTH_START, month_start) != actual
+    assert index.previous(MONTH_START, month_start, inclusive=True) == actual
+    assert index.previous(MONTH_START, month_start) != actual
+    equinox = index.next(VERNAL_EQUINOX, christmas)
+    assert equinox.greg.date() == datetime(2025, 3, 20).date()
+    assert index.next(YEAR_START, equinox.greg).greg > equinox.greg
+
+def test_leap_months_and_counts():
+    """
+    Test that the leap months, and the counts of events, agree with those
+    found by walking from day to day.
+    """
+    index = EventIndex(5, 20)
+    leap_years = [
+        year for year in range(5, 21) if compute_year_structure(year).is_leap
+    ]
+    leap_months = index.between(LEAP_MONTH_START, index.start, index.end)
+    assert [event.cyprian.year for event in leap_months] == leap_years
+    start = datetime(2020, 2, 2, tzinfo=timezone.utc)
+    end = datetime(2029, 9, 9, tzinfo=timezone.utc)
+    expected = sum(
+        1 for _, _, _, day in iter_days_between(start, end) if day == 1
+    )
+    assert index.count_between(MONTH_START, start, end) == expected
+    assert index.count_between(MONTH_START, end, start) == 0
+    greg = leap_months[0].greg-timedelta(days=10, hours=-3)
+    assert index.days_until(LEAP_MONTH_START, greg) == 10
+    assert index.days_until(LEAP_MONTH_START, leap_months[-1].greg) == 0
+    after_last = leap_months[-1].greg+timedelta(days=1)
+    assert index.next(LEAP_MONTH_START, after_last) is None
+    assert index.days_until(LEAP_MONTH_START, after_last) is None
+
+def test_index_bounds():
+    """ Test that queries outside the index, or of unknown kinds, fail. """
+    index = EventIndex(10, 11)
+    with pytest.raises(EventIndexError):
+        index.next(MONTH_START, datetime(2000, 1, 1))
+    with pytest.raises(EventIndexError):
+        index.next("eclipse", index.start)
+    with pytest.raises(EventIndexError):
+        EventIndex(11, 10)
+
+def test_make_cached_event_index():
+    """ Test that the cache's own structures give the same index. """
+    concordance = \
+        Concordance(
+            whole_greg_year=2024,
+            config=CacheConfig("event_index", BACKEND_MEMORY)
+        )
+    index = make_cached_event_index(concordance)
+    expected = EventIndex(index.first_cyprian_year, index.last_cyprian_year)
+    assert index.first_cyprian_year < index.last_cyprian_year
+    assert index.events == expected.events
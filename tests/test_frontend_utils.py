@@ -3,10 +3,16 @@ This code tests the various frontend utility functions.
 """
 
 # Standard imports.
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 # Local imports.
-from source.frontend_utils import convert_date
+from source.frontend_utils import (
+    convert_date,
+    convert_timestamps,
+    get_days_in_cyprian_month
+)
 from source.cyprian_date import CyprianDate
 
 #########
@@ -21,3 +27,33 @@ def test_convert_date():
     assert actual == cyprian
     actual = convert_date(cyprian)
     assert actual == greg
+
+def test_convert_date_across_threads():
+    """ Test that many threads can convert at once, without sharing a cache. """
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    timestamps = [start+timedelta(hours=7*index) for index in range(400)]
+    expected = [convert_date(timestamp) for timestamp in timestamps]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        actual = list(executor.map(convert_date, timestamps*8))
+    assert actual == expected*8
+
+def test_convert_timestamps():
+    """ Test that each timestamp is placed on its day in the given zone. """
+    zone = ZoneInfo("Pacific/Kiritimati")
+    timestamps = [
+        datetime(2024, 11, 1, 9, tzinfo=timezone.utc),
+        datetime(2024, 11, 1, 11, tzinfo=timezone.utc),
+        datetime(2024, 11, 2, 23)
+    ]
+    assert convert_timestamps(timestamps) == [
+        CyprianDate(11, 8, 1), CyprianDate(11, 8, 1), CyprianDate(11, 8, 2)
+    ]
+    assert convert_timestamps(timestamps, zone) == [
+        CyprianDate(11, 7, 30), CyprianDate(11, 8, 1), CyprianDate(11, 8, 1)
+    ]
+
+def test_get_days_in_cyprian_month():
+    """ Test that the function returns the right output. """
+    days = get_days_in_cyprian_month(11, 1)
+    assert days.greg_start == datetime(2024, 4, 8, tzinfo=timezone.utc)
+    assert days.cyprians == [CyprianDate(11, 1, day) for day in range(1, 31)]
@@ -0,0 +1,68 @@
+"""
+This code tests the HTML calendar renderer.
+"""
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.cache_config import BACKEND_MEMORY, CacheConfig
+from source.concordance import Concordance
+from source.html_calendar import (
+    HtmlCalendar,
+    HtmlCalendarError,
+    HtmlCalendarOptions
+)
+
+# Local constants.
+CONFIG = CacheConfig("html_calendar", BACKEND_MEMORY)
+
+#########
+# TESTS #
+#########
+
+def test_render_month():
+    """ Test that a month is laid out, and annotated, as intended. """
+    calendar = HtmlCalendar(config=CONFIG)
+    actual = calendar.render_month(11, 9)
+    assert actual.startswith('<table class="cyprian-month">')
+    assert "<caption>November" in actual
+    assert actual.count('class="cyprian-day') == 29
+    assert '<span class="cyprian-greg">25 Dec</span>' in actual
+    assert '<span class="cyprian-liturgical">Christmas</span>' in actual
+    rows = actual.count("<tr>")-1
+    assert actual.count("<td") == rows*7
+    bare = \
+        calendar.render_month(
+            11, 9, HtmlCalendarOptions(show_greg=False, show_liturgical=False)
+        )
+    assert "cyprian-greg" not in bare
+    assert "Christmas" not in bare
+
+def test_fragment_cache(monkeypatch):
+    """ Test that a repeated rendering makes no conversions at all. """
+    calendar = HtmlCalendar(config=CONFIG)
+    first = calendar.render_month(11, 1)
+    def refuse(*_):
+        raise AssertionError("Should have been a cache hit")
+    monkeypatch.setattr(Concordance, "days_in_cyprian_month", refuse)
+    monkeypatch.setattr(Concordance, "greg_span", refuse)
+    assert calendar.render_month(11, 1) is first
+    assert (calendar.stats.hits, calendar.stats.misses) == (1, 1)
+    calendar.clear()
+    with pytest.raises(AssertionError):
+        calendar.render_month(11, 1)
+
+def test_render_year():
+    """ Test that a year holds each month once, and agrees month by month. """
+    calendar = HtmlCalendar(config=CONFIG, max_fragments=4)
+    actual = calendar.render_year(11)
+    assert actual.startswith('<div class="cyprian-year">')
+    assert actual.count('<table class="cyprian-month">') == 12
+    assert len(calendar.fragments) == 4
+    assert HtmlCalendar(config=CONFIG).render_month(11, 5) in actual
+
+def test_invalid_options():
+    """ Test that an impossible first weekday is refused. """
+    with pytest.raises(HtmlCalendarError):
+        HtmlCalendarOptions(first_weekday=7)
@@ -0,0 +1,115 @@
+"""
+This code tests the iCalendar export functions.
+"""
+
+# Standard imports.
+import io
+from datetime import date, datetime, timezone
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.cyprian_date import CyprianDate
+from source.ical_export import (
+    IcalExportError,
+    export_ical,
+    fold_line,
+    iter_ical_lines,
+    write_ical
+)
+from source.liturgical_index import LiturgicalIndex
+from source.year_structure import compute_year_structure
+
+# Local constants.
+STAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+####################
+# HELPER FUNCTIONS #
+####################
+
+def read_events(code: str) -> list[dict[str, str]]:
+    """ Unfold a calendar, and read each event's properties. """
+    result = []
+    for line in code.replace("\r\n ", "").split("\r\n"):
+        if line == "BEGIN:VEVENT":
+            result.append({})
+        elif result and ":" in line and line != "END:VEVENT":
+            name, value = line.split(":", 1)
+            result[-1][name] = value
+    return result
+
+#########
+# TESTS #
+#########
+
+def test_write_ical():
+    """ Test that the events match the structure of each year. """
+    out_file = io.StringIO(newline="")
+    count = write_ical(out_file, 11, 12, stamp=STAMP)
+    code = out_file.getvalue()
+    assert code.startswith("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n")
+    assert code.endswith("END:VCALENDAR\r\n")
+    events = read_events(code)
+    assert len(events) == count
+    months = [
+        event for event in events if event["CATEGORIES"] == "Cyprian month"
+    ]
+    expected = [
+        month_start.date().strftime("%Y%m%d")
+        for year in (11, 12)
+        for month_start in compute_year_structure(year).month_starts
+    ]
+    assert [event["DTSTART;VALUE=DATE"] for event in months] == expected
+    assert months[0]["SUMMARY"] == "Cyprian New Year: T11"
+    assert months[1]["SUMMARY"] == "Sectilis T11 begins"
+    assert all(event["DTSTAMP"] == "20240101T000000Z" for event in events)
+    starts = [event["DTSTART;VALUE=DATE"] for event in events]
+    assert starts == sorted(starts)
+    assert len({event["UID"] for event in events}) == len(events)
+
+def test_observances():
+    """ Test that each observance carries its Cyprian date. """
+    out_file = io.StringIO(newline="")
+    write_ical(out_file, 11, 11, stamp=STAMP, month_starts=False)
+    events = read_events(out_file.getvalue())
+    index = LiturgicalIndex(2024, 2025)
+    year_structure = compute_year_structure(11)
+    expected = [
+        (entry.greg.strftime("%Y%m%d"), entry.name, str(entry.cyprian))
+        for entry in index.entries
+        if year_structure.start.date() <= entry.greg <
+        year_structure.next_year_start.date()
+    ]
+    actual = [
+        (
+            event["DTSTART;VALUE=DATE"],
+            event["SUMMARY"].replace("\\", ""),
+            event["DESCRIPTION"]
+        )
+        for event in events
+    ]
+    assert actual == expected
+    assert ("20241225", "Christmas", str(CyprianDate(11, 9, 25))) in actual
+
+def test_export_ical(tmp_path):
+    """ Test that a file is written with CRLF line breaks. """
+    path_to_output = str(tmp_path/"cyprian.ics")
+    count = export_ical(path_to_output, 11, 11, stamp=STAMP)
+    with open(path_to_output, "rb") as ics_file:
+        code = ics_file.read()
+    assert code.count(b"BEGIN:VEVENT") == count
+    assert b"\n" not in code.replace(b"\r\n", b"")
+    with pytest.raises(IcalExportError):
+        list(iter_ical_lines(12, 11))
+
+def test_fold_line():
+    """ Test that long lines are folded without splitting any character. """
+    line = "SUMMARY:"+"æ"*100
+    folded = fold_line(line)
+    pieces = folded.split("\r\n")
+    assert len(pieces) > 1
+    assert all(len(piece.encode("utf-8")) <= 75 for piece in pieces)
+    assert all(piece.startswith(" ") for piece in pieces[1:])
+    assert "".join(piece.removeprefix(" ") for piece in pieces) == line
+    assert fold_line("SHORT:x") == "SHORT:x"
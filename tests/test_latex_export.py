@@ -0,0 +1,44 @@
+"""
+This code tests the multi-year LaTeX export functions.
+"""
+
+# Local imports.
+from source.extended_concordance import ExtendedConcordance
+from source.latex_export import export_latex_years, load_template
+
+#########
+# TESTS #
+#########
+
+def test_export_latex_years_separately(tmp_path):
+    """ Test that each year's file matches the single-year export. """
+    paths = export_latex_years(
+        2024, 2025, str(tmp_path/"new"), combined=False, max_workers=1
+    )
+    assert len(paths) == 2
+    with open(paths[1], "r") as new_file:
+        actual = new_file.read()
+    path_to_old = ExtendedConcordance(2025).export_latex_file(
+        str(tmp_path/"old")
+    )
+    with open(path_to_old, "r") as old_file:
+        expected = old_file.read()
+    assert actual == expected
+
+def test_export_latex_years_combined(tmp_path):
+    """ Test that the combined file holds each year once, in order. """
+    paths = export_latex_years(2024, 2026, str(tmp_path), max_workers=2)
+    assert len(paths) == 1
+    with open(paths[0], "r") as combined_file:
+        code = combined_file.read()
+    assert code.count("\\begin{document}") == 1
+    assert code.count("\\end{document}") == 1
+    assert "\\title{Concordance 2024--2026}" in code
+    positions = [
+        code.index(f"CONCORDANCE {year}") for year in range(2024, 2027)
+    ]
+    assert positions == sorted(positions)
+
+def test_load_template():
+    """ Test that the template is only parsed once. """
+    assert load_template() is load_template()
@@ -0,0 +1,85 @@
+"""
+This code tests the LiturgicalCalendar class.
+"""
+
+# Standard imports.
+from datetime import date, datetime
+
+# Non-standard imports.
+import pytest
+
+# Source imports.
+from source.liturgical_calendar import (
+    ANCHOR_ADVENT,
+    ANCHOR_EASTER,
+    LiturgicalCalendar,
+    LiturgicalCalendarError,
+    Observance
+)
+from source.liturgical_summary import LiturgicalSummary, advent_sunday
+
+#########
+# TESTS #
+#########
+
+def test_liturgical_calendar_agrees_with_summary():
+    """ Test that the default observances are those of LiturgicalSummary. """
+    calendar = LiturgicalCalendar()
+    for year in range(2000, 2040):
+        expected = LiturgicalSummary(year).to_lookup()
+        actual = {
+            datetime.fromordinal(ordinal).isoformat(): name
+            for ordinal, name in calendar.get_ordinal_lookup(year).items()
+        }
+        assert actual == expected
+
+def test_liturgical_calendar_registry():
+    """ Test that observances can be added and removed. """
+    calendar = LiturgicalCalendar()
+    assert calendar.get_observances(date(2025, 6, 19)) == []
+    calendar.register(Observance("Corpus Christi", ANCHOR_EASTER, None, 60))
+    assert calendar.get_observances(date(2025, 6, 19)) == ["Corpus Christi"]
+    calendar.register(Observance("Burns Night", month_and_day=(1, 25)))
+    assert calendar.get_observances(datetime(2025, 1, 25)) == ["Burns Night"]
+    calendar.unregister("Burns Night")
+    assert calendar.get_observances(date(2025, 1, 25)) == []
+    with pytest.raises(LiturgicalCalendarError):
+        calendar.unregister("Burns Night")
+    with pytest.raises(LiturgicalCalendarError):
+        Observance("Nowhen")
+    with pytest.raises(LiturgicalCalendarError):
+        Observance("Nowhen", "pentecost")
+
+def test_observances_between():
+    """ Test that the method returns the right output. """
+    calendar = LiturgicalCalendar()
+    actual = calendar.observances_between(date(2024, 12, 1), date(2025, 1, 7))
+    assert actual == [
+        (date(2024, 12, 2), "Advent Sunday"),
+        (date(2024, 12, 16), "Gaudete Sunday"),
+        (date(2024, 12, 25), "Christmas"),
+        (date(2025, 1, 6), "Epiphany")
+    ]
+
+def test_observances_across_years_and_on_shared_dates():
+    """
+    Test that an observance is found in the year on which it falls, rather
+    than that of its anchor, and that observances sharing a date are all kept.
+    """
+    calendar = LiturgicalCalendar()
+    calendar.register(Observance("Late", ANCHOR_ADVENT, offset_days=40))
+    late = date.fromordinal(advent_sunday(2025).toordinal()+40)
+    assert late.year == 2026
+    assert calendar.get_observances(late) == ["Late"]
+    assert (late, "Late") in \
+        calendar.observances_between(date(2026, 1, 1), date(2026, 2, 1))
+    assert calendar.get_ordinal_lookup(2026)[late.toordinal()] == "Late"
+    calendar.register(Observance("Yule", month_and_day=(12, 25)))
+    assert calendar.get_observances(date(2025, 12, 25)) == ["Christmas", "Yule"]
+    actual = \
+        calendar.observances_between(date(2025, 12, 25), date(2025, 12, 26))
+    assert actual == [
+        (date(2025, 12, 25), "Christmas"), (date(2025, 12, 25), "Yule")
+    ]
+    assert calendar.get_ordinal_lookup(2025)[date(2025, 12, 25).toordinal()] \
+        == "Yule"
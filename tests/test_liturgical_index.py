@@ -0,0 +1,23 @@
+"""
+This code tests the LiturgicalIndex class.
+"""
+
+# Local imports.
+from source.cyprian_date import CyprianDate
+from source.liturgical_index import LiturgicalIndex
+
+#########
+# TESTS #
+#########
+
+def test_liturgical_index():
+    """ Test that the index can be queried in both directions. """
+    index = LiturgicalIndex(2024, 2025)
+    easters = index.get_cyprian_dates("Easter Sunday")
+    assert easters[-1] == CyprianDate(12, 1, 23)
+    assert len(easters) == 2
+    assert index.get_observances(CyprianDate(12, 1, 23)) == ["Easter Sunday"]
+    assert index.get_observances(CyprianDate(12, 1, 24)) == []
+    for entry in index.find_by_cyprian_month_and_day(1, 1):
+        assert entry.cyprian.month == entry.cyprian.day == 1
+    assert index.get_cyprian_dates("Christmas")[0] == CyprianDate(11, 9, 25)
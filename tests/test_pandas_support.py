@@ -0,0 +1,98 @@
+"""
+This code tests the optional pandas integration.
+"""
+
+# Standard imports.
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.cyprian_date import CyprianDate
+from source.year_structure import locate_greg
+
+pandas = pytest.importorskip("pandas")
+pandas_support = pytest.importorskip("source.pandas_support")
+
+#########
+# TESTS #
+#########
+
+def test_accessor():
+    """ Test that the accessor agrees with the year structures. """
+    series = \
+        pandas.Series(
+            pandas.date_range("1919-01-01", "2031-12-31", freq="37h")
+        )
+    series[3] = pandas.NaT
+    expected = [
+        None if pandas.isna(greg) else locate_greg(greg.to_pydatetime())
+        for greg in series
+    ]
+    assert [
+        None if pandas.isna(year) else (year, month, day)
+        for year, month, day in zip(
+            series.cyprian.year, series.cyprian.month, series.cyprian.day
+        )
+    ] == expected
+    assert str(series.cyprian.year.dtype) == "Int64"
+    frame = pandas.DataFrame({ "greg": series, "value": 1 })
+    counts = frame.groupby(frame.greg.cyprian.month_key)["value"].sum()
+    first_year, first_month, _ = expected[0]
+    assert counts.index[0] == first_year*100+first_month
+    assert counts.loc[1101] == 20
+
+def test_accessor_zone_and_strings():
+    """ Test that days are reckoned in the Series' zone. """
+    greg = datetime(2024, 4, 7, 23, 30, tzinfo=timezone.utc)
+    series = pandas.Series([greg]).dt.tz_convert("Europe/Berlin")
+    assert series.cyprian.to_series()[0] == \
+        CyprianDate(*locate_greg(greg, ZoneInfo("Europe/Berlin")))
+    assert series.cyprian.str[0] == "01 Pri T11"
+    naive = pandas.Series([datetime(2024, 4, 7, 23, 30)])
+    assert naive.cyprian.str[0] == "29 Int T10"
+    with pytest.raises(AttributeError):
+        pandas.Series([1, 2]).cyprian.year
+
+def test_extension_array():
+    """ Test that the dtype round-trips, sorts, and converts back. """
+    values = ["01 Pri T11", None, "29 Int T10", CyprianDate(11, 9, 25)]
+    series = pandas.Series(values, dtype="cyprian")
+    assert str(series.dtype) == "cyprian"
+    assert series.isna().tolist() == [False, True, False, False]
+    assert series.sort_values().tolist()[:3] == \
+        [CyprianDate(10, 13, 29), CyprianDate(11, 1, 1), CyprianDate(11, 9, 25)]
+    assert series.array.nbytes == 4*9
+    assert (series == CyprianDate(11, 1, 1)).tolist() == \
+        [True, False, False, False]
+    gregs = series.array.to_greg(timezone.utc)
+    assert gregs[0] == pandas.Timestamp("2024-04-08", tz="UTC")
+    assert pandas.isna(gregs[1])
+    assert gregs[3] == pandas.Timestamp("2024-12-25", tz="UTC")
+    assert pandas.concat([series, series]).nunique() == 3
+    with pytest.raises(pandas_support.PandasSupportError):
+        invalid = CyprianDate(11, 1, 31)
+        pandas.Series([invalid], dtype="cyprian").array.to_greg()
+
+def test_day_table_across_threads():
+    """
+    Test that threads growing a shared table at once each get a consistent
+    view of it.
+    """
+    numpy = pytest.importorskip("numpy")
+    start = date(2000, 1, 1).toordinal()
+    ranges = [
+        numpy.arange(start+offset, start+offset+400, dtype="int64")
+        for offset in range(0, 8000, 250)
+    ]
+    expected = [
+        pandas_support.DayTable().look_up(ordinals) for ordinals in ranges
+    ]
+    day_table = pandas_support.DayTable()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        actual = list(executor.map(day_table.look_up, ranges))
+    for actual_codes, expected_codes in zip(actual, expected):
+        assert (actual_codes == expected_codes).all()
@@ -0,0 +1,79 @@
+"""
+This code tests the CachePrefetcher class.
+"""
+
+# Standard imports.
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.cache_config import CacheConfig
+from source.concordance import Concordance
+from source.cyprian_date import CyprianDate
+from source.prefetch import CachePrefetcher, CachePrefetcherError
+
+#########
+# TESTS #
+#########
+
+def test_cache_prefetcher(tmp_path):
+    """ Test that the cache is warmed in the background. """
+    path_to_cache_db = str(tmp_path/"cache.db")
+    clock = lambda: datetime(2024, 6, 1, tzinfo=timezone.utc)
+    with CachePrefetcher(
+        path_to_cache_db=path_to_cache_db, clock=clock
+    ) as prefetcher:
+        assert prefetcher.wait_until_ready(timeout=60)
+        assert prefetcher.is_ready()
+        assert prefetcher.last_error is None
+    assert not prefetcher.thread.is_alive()
+    concordance = Concordance(path_to_cache_db=path_to_cache_db)
+    for cyprian in (CyprianDate(10, 1, 1), CyprianDate(12, 13, 1)):
+        assert not concordance.should_write_first(cyprian=cyprian)
+        assert not concordance.should_extend_first(cyprian=cyprian)
+    assert concordance.read_span().cursor_cyprian == CyprianDate(13, 1, 1)
+
+def test_cache_prefetcher_zones(tmp_path):
+    """ Test that the cache for each given zone is warmed. """
+    path_to_cache_db = str(tmp_path/"cache.db")
+    clock = lambda: datetime(2024, 6, 1, tzinfo=timezone.utc)
+    zones = (timezone.utc, ZoneInfo("Europe/London"))
+    prefetcher = \
+        CachePrefetcher(
+            path_to_cache_db=path_to_cache_db,
+            clock=clock,
+            zones=zones
+        )
+    prefetcher.warm()
+    assert (tmp_path/"cache.Europe_London.db").exists()
+    for zone in zones:
+        concordance = Concordance(path_to_cache_db=path_to_cache_db, zone=zone)
+        for cyprian in (CyprianDate(10, 1, 1), CyprianDate(12, 13, 1)):
+            assert not concordance.should_write_first(cyprian=cyprian)
+            assert not concordance.should_extend_first(cyprian=cyprian)
+
+def test_cache_prefetcher_size_limit(tmp_path):
+    """
+    Test that a prefetcher can't be asked for more years than the cache may
+    hold, and that it doesn't rebuild the cache to restore years which later
+    requests have evicted.
+    """
+    config = CacheConfig(str(tmp_path/"cache.db"), max_cyprian_years=3)
+    clock = lambda: datetime(2024, 6, 1, tzinfo=timezone.utc)
+    with pytest.raises(CachePrefetcherError):
+        CachePrefetcher(years_either_side=2, clock=clock, config=config)
+    prefetcher = \
+        CachePrefetcher(years_either_side=1, clock=clock, config=config)
+    prefetcher.warm()
+    concordance = Concordance(config=config)
+    concordance.establish_connection()
+    assert concordance.read_span().first_cyprian_year == 10
+    concordance.convert_cyprian(CyprianDate(13, 1, 1))
+    span = concordance.read_span()
+    assert (span.first_cyprian_year, span.cursor_cyprian.year) == (11, 14)
+    prefetcher.warm()
+    span = concordance.read_span()
+    assert (span.first_cyprian_year, span.cursor_cyprian.year) == (11, 14)
@@ -0,0 +1,68 @@
+"""
+This code tests the ConversionProfiler class and its helper functions.
+"""
+
+# Standard imports.
+import argparse
+import pstats
+from datetime import datetime, timezone
+
+# Non-standard imports.
+import ephem
+
+# Local imports.
+from source.concordance import Concordance
+from source.profiling import (
+    ConversionProfiler,
+    add_profiling_arguments,
+    profile_if_asked
+)
+
+#########
+# TESTS #
+#########
+
+def test_conversion_profiler(tmp_path):
+    """ Test that a cache build is profiled phase by phase. """
+    original = ephem.next_new_moon
+    concordance = Concordance(path_to_cache_db=str(tmp_path/"cache.db"))
+    with ConversionProfiler(use_cprofile=True, sample_stacks=True) as profiler:
+        concordance.convert_greg(datetime(2024, 3, 1, tzinfo=timezone.utc))
+    report = profiler.report
+    assert ephem.next_new_moon is original
+    assert report.phases["write"].count == 1
+    assert report.phases["walk"].count == 2
+    assert report.phases["convert_greg"].count == 1
+    assert report.ephem_calls["next_new_moon"] > 700
+    assert report.sql_statements["INSERT"].count > 700
+    assert report.sql_statements["SELECT"].seconds > 0
+    assert report.wall_seconds >= report.phases["write"].seconds
+    assert set(report.to_dict()) == {
+        "wall_seconds",
+        "phases",
+        "ephem_calls",
+        "sql_statements",
+        "net_allocated_blocks"
+    }
+    path_to_stats = str(tmp_path/"profile.pstats")
+    report.dump_stats(path_to_stats)
+    assert pstats.Stats(path_to_stats).total_calls > 0
+    path_to_folded = str(tmp_path/"profile.folded")
+    report.write_folded_stacks(path_to_folded)
+    with open(path_to_folded, "r") as folded_file:
+        assert all(
+            line.rsplit(" ", 1)[1].strip().isdigit() for line in folded_file
+        )
+    assert "Phase walk: 2" in str(report)
+
+def test_profile_if_asked(tmp_path, capsys):
+    """ Test that the script flags switch profiling on and off. """
+    parser = argparse.ArgumentParser()
+    add_profiling_arguments(parser)
+    concordance = Concordance(path_to_cache_db=str(tmp_path/"cache.db"))
+    with profile_if_asked(parser.parse_args([])) as profiler:
+        assert profiler is None
+    with profile_if_asked(parser.parse_args(["--profile"])) as profiler:
+        concordance.convert_greg(datetime(2024, 3, 1, tzinfo=timezone.utc))
+    assert profiler.report.phases["write"].count == 1
+    assert "Phase write: 1" in capsys.readouterr().err
@@ -0,0 +1,105 @@
+"""
+This code tests the CyprianRule class.
+"""
+
+# Standard imports.
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.cyprian_date import CyprianDate
+from source.recurrence import MONTHLY, YEARLY, CyprianRule, RecurrenceError
+from source.year_structure import compute_year_structure, iter_days_between
+
+#########
+# TESTS #
+#########
+
+def test_first_of_every_month(monkeypatch):
+    """
+    Test that the first of every month agrees with walking from day to day,
+    without any conversion.
+    """
+    def refuse(*_):
+        raise AssertionError("Should not have converted")
+    monkeypatch.setattr("source.cyprian_datetime.convert_date", refuse)
+    rule = CyprianRule(MONTHLY, CyprianDate(1, 1, 1))
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    expected = [
+        (greg, CyprianDate(year, month, day))
+        for greg, year, month, day in iter_days_between(start, end)
+        if day == 1
+    ]
+    actual = [
+        (occurrence, occurrence.cyprian)
+        for occurrence in rule.between(start, end)
+    ]
+    assert actual == expected
+
+def test_intercalaris_in_leap_years():
+    """ Test that a rule for Intercalaris falls only in leap years. """
+    rule = CyprianRule(YEARLY, CyprianDate(1, 1, 1), days=(15,), months=(13,))
+    actual = [occurrence.cyprian for occurrence in islice(rule, 10)]
+    assert [cyprian.year for cyprian in actual] == [
+        year for year in range(1, 40) if compute_year_structure(year).is_leap
+    ][:10]
+    assert all(cyprian.month == 13 for cyprian in actual)
+    assert all(cyprian.day == 15 for cyprian in actual)
+    common = \
+        CyprianRule(
+            YEARLY, CyprianDate(1, 1, 1), days=(-1,), leap_years=False
+        )
+    for occurrence in islice(common, 24):
+        year_structure = compute_year_structure(occurrence.cyprian.year)
+        assert not year_structure.is_leap
+        assert occurrence.cyprian.day in year_structure.month_lengths
+
+def test_count_until_and_interval():
+    """ Test that the rule starts, steps and stops where it should. """
+    rule = CyprianRule(MONTHLY, CyprianDate(10, 12, 5), days=(1, 5), count=5)
+    assert [str(occurrence.cyprian) for occurrence in rule] == [
+        "05 Duo T10", "01 Int T10", "05 Int T10", "01 Pri T11", "05 Pri T11"
+    ]
+    rule = \
+        CyprianRule(
+            YEARLY,
+            CyprianDate(10, 1, 1),
+            interval=3,
+            months=(2,),
+            until=CyprianDate(19, 2, 1)
+        )
+    assert [occurrence.cyprian.year for occurrence in rule] == [10, 13, 16, 19]
+
+def test_after_skips_ahead():
+    """ Test that skipping ahead finds what iterating from the start would. """
+    rule = CyprianRule(MONTHLY, CyprianDate(-100, 3, 1), interval=7, days=(-2,))
+    greg = datetime(2150, 6, 1, tzinfo=timezone.utc)
+    expected = next(
+        occurrence for occurrence in rule.iter_occurrences()
+        if occurrence > greg
+    )
+    assert rule.after(greg) == expected
+    assert rule.after(expected, inclusive=True) == expected
+    assert rule.after(expected) > expected+timedelta(days=7*29)
+    assert rule.after(datetime(2150, 6, 1)) == expected
+
+def test_invalid_rules():
+    """ Test that impossible rules are refused. """
+    start = CyprianDate(1, 1, 1)
+    with pytest.raises(RecurrenceError):
+        CyprianRule("weekly", start)
+    with pytest.raises(RecurrenceError):
+        CyprianRule(MONTHLY, start, interval=0)
+    with pytest.raises(RecurrenceError):
+        CyprianRule(MONTHLY, start, days=(31,))
+    with pytest.raises(RecurrenceError):
+        CyprianRule(YEARLY, start, months=(14,))
+    with pytest.raises(RecurrenceError):
+        CyprianRule(YEARLY, start, months=(13,), leap_years=False)
+    for bad_start in (CyprianDate(-40, 13, 1), CyprianDate(11, 9, 30)):
+        with pytest.raises(RecurrenceError):
+            CyprianRule(MONTHLY, bad_start)
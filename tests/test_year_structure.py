@@ -0,0 +1,91 @@
+"""
+This code tests the YearStructure class and its helper functions.
+"""
+
+# Standard imports.
+from datetime import datetime, timezone
+
+# Non-standard imports.
+import pytest
+
+# Local imports.
+from source.concordance import Concordance
+from source.cyprian_date import CyprianDate
+from source.year_structure import (
+    YearStructureError,
+    compute_year_structure,
+    find_cyprian_year,
+    iter_days_between,
+    locate_greg
+)
+
+#########
+# TESTS #
+#########
+
+def test_year_structure():
+    """ Test that the class works as intended. """
+    leap_year = compute_year_structure(10)
+    assert leap_year.is_leap
+    assert leap_year.number_of_months == 13
+    assert leap_year.get_month_start(13) == \
+        datetime(2024, 3, 10, tzinfo=timezone.utc)
+    assert leap_year.get_month_length(13) == 29
+    assert leap_year.next_year_start == \
+        datetime(2024, 4, 8, tzinfo=timezone.utc)
+    common_year = compute_year_structure(11)
+    assert not common_year.is_leap
+    assert common_year.start == datetime(2024, 4, 8, tzinfo=timezone.utc)
+    assert common_year.get_month_length(1) == 30
+    assert common_year.next_year_start == \
+        datetime(2025, 3, 29, tzinfo=timezone.utc)
+    assert common_year.length == sum(common_year.month_lengths) == 355
+    with pytest.raises(YearStructureError):
+        common_year.get_month_length(13)
+
+def test_cyprian_date_is_valid():
+    """ Test that impossible dates are detected. """
+    assert CyprianDate(10, 13, 29).is_valid()
+    assert not CyprianDate(10, 13, 30).is_valid()
+    assert not CyprianDate(11, 13, 1).is_valid()
+    assert not CyprianDate(11, 1, 0).is_valid()
+
+def test_concordance_year_structure():
+    """ Test that the cached structure agrees with the computed one. """
+    concordance = Concordance()
+    actual = concordance.get_year_structure(11, force_write_first=True)
+    assert actual == compute_year_structure(11)
+    actual = concordance.read_year_structure(10)
+    assert actual == compute_year_structure(10)
+
+def test_iter_days_between():
+    """ Test that the function agrees with the concordance. """
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    days = list(iter_days_between(start, end))
+    assert len(days) == (end-start).days
+    assert days[0] == (start, 10, 12, 22)
+    assert (datetime(2024, 4, 8, tzinfo=timezone.utc), 11, 1, 1) in days
+    concordance = Concordance()
+    for greg, year, month, day in days:
+        assert concordance.convert_greg(greg) == CyprianDate(year, month, day)
+    assert find_cyprian_year(start) == 10
+    assert find_cyprian_year(end) == 11
+
+def test_locate_greg():
+    """ Test that the function agrees with the concordance. """
+    assert locate_greg(datetime(2024, 12, 25, tzinfo=timezone.utc)) == \
+        (11, 9, 25)
+    assert locate_greg(datetime(2024, 4, 7)) == (10, 13, 29)
+    with pytest.raises(YearStructureError):
+        compute_year_structure(11).locate(datetime(2024, 4, 7))
+
+def test_new_moon_on_equinox_day():
+    """
+    Test that a new moon earlier on the day of the equinox begins the year, as
+    it did in 1920, so that each year begins where the last one ends.
+    """
+    structure = compute_year_structure(-94)
+    assert structure.next_year_start == \
+        datetime(1920, 3, 20, tzinfo=timezone.utc)
+    assert compute_year_structure(-93).start == structure.next_year_start